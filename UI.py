@@ -1,15 +1,14 @@
-import os
-
 import streamlit as st
-from cmp.evaluation import evaluate_reverse_parse
 from format_visitor import FormatVisitor
-from semantics import TypeCollector, TypeBuilder, TypeInferencer, TypeChecker, TypesUpdater
-from tools.serializers import Serializer
-from semantics.utils import Context, Scope
-
-path = os.getcwd() + '/tools'
-tokenizer = Serializer.load(path + '/lexer')
-parser = Serializer.load(path + '/parser')
+from semantics import semantic_pipeline
+from re_lexer import CoolLexer
+from grammar import G
+from tools.tables import load_parser
+from incremental_parser import IncrementalParser
+from semantics.utils import Context
+
+tokenizer = CoolLexer()
+parser = load_parser(G)
 example_code = '''class Main {
     x: AUTO_TYPE;
 
@@ -37,62 +36,48 @@ if __name__ == '__main__':
     show_parsing = st.sidebar.checkbox('Parsing')
     show_ast = st.sidebar.checkbox('Abstract Syntax Tree')
     show_context = st.sidebar.checkbox('Context')
+    show_timings = st.sidebar.checkbox('Semantic passes time')
 
     input_program = st.text_area('COOL Program', value=example_code, height=400)
     start = st.button('Start')
-    if start:
-        tokens = list(tokenizer(input_program))
+    # kept across reruns of the script, so each Start only re-parses the classes edited since the previous one
+    if 'incremental_parser' not in st.session_state:
+        st.session_state.incremental_parser = IncrementalParser(tokenizer, parser)
+    incremental_parser = st.session_state.incremental_parser
 
+    if start:
         if show_tokens:
             st.markdown('### Tokens')
-            st.write([str(token) + '\n' for token in tokens])
-
-        parse, operations = parser(tokens, get_shift_reduce=True)
+            st.write([str(token) + '\n' for token in tokenizer(input_program)])
 
         if show_parsing:
+            # the trace needs every reduction, so the whole program is parsed, from a token buffer over its text
+            parse = []
+            ast = parser.evaluate(tokenizer.buffer(input_program), parse)
             st.markdown('### Parsing')
             st.write([str(prod) + '\n' for prod in reversed(parse)])
+        else:
+            # declarations that TypesUpdater rewrites are copied, the cached ones must keep their AUTO_TYPEs
+            ast = incremental_parser(input_program, inference)
 
-        ast = evaluate_reverse_parse(parse, operations, tokens)
         formatter = FormatVisitor()
 
         if ast is not None:
             errors = []
             context = Context()
-            scope = Scope()
-            collector = TypeCollector(context, errors)
-            builder = TypeBuilder(context, errors)
+            passes = semantic_pipeline(inference)
 
-            if inference:
-                # This part is for type inference
-                ###################################################
-                collector.visit(ast)
-                builder.visit(ast)
-                inferencer = TypeInferencer(context, scope, errors)
-
-                st.markdown('## Before Types Inference')
-                if show_ast:
-                    st.markdown('### Abstract Syntax Tree')
-                    st.text(formatter.visit(ast, 1))
-                if show_context:
-                    st.markdown('### Context')
-                    st.text(context)
-
-                inferencer.visit(ast, scope)
-                updater = TypesUpdater(inferencer.context,
-                                       inferencer.scope,
-                                       inferencer.functions,
-                                       inferencer.attributes,
-                                       inferencer.substitutions,
-                                       inferencer.errors)
-                updater.visit(ast, inferencer.scope, 0)
-                ###################################################
-
-            # Normal pipeline
-            collector.context = Context()
-            collector.visit(ast)
-            builder.context = collector.context
-            builder.visit(ast)
+            def on_pass(semantic_pass, state):
+                if inference and semantic_pass.name == 'build':
+                    st.markdown('## Before Types Inference')
+                    if show_ast:
+                        st.markdown('### Abstract Syntax Tree')
+                        st.text(formatter.visit(ast, 1))
+                    if show_context:
+                        st.markdown('### Context')
+                        st.text(context)
+
+            passes.run(on_pass, ast=ast, context=context, errors=errors)
 
             if inference:
                 st.markdown('## After Types Inference')
@@ -102,11 +87,12 @@ if __name__ == '__main__':
                 st.text(formatter.visit(ast, 1))
             if show_context:
                 st.markdown('### Context')
-                st.text(builder.context)
+                st.text(context)
 
-            type_checker = TypeChecker(builder.context, errors)
-            type_checker.visit(ast)
-            print(builder.context)
+            print(context)
+            if show_timings:
+                st.markdown('### Semantic passes')
+                st.text(passes.report())
             if errors:
                 st.markdown('# Errors')
                 st.write(errors)
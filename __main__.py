@@ -1,102 +1,83 @@
-import os
 from rich.console import Console
-from cmp.evaluation import evaluate_reverse_parse
 from format_visitor import FormatVisitor
 from interpreter import Interpreter
-from semantics import TypeCollector, TypeBuilder, TypeInferencer, TypeChecker, TypesUpdater
-from tools.serializers import Serializer
-from semantics.utils import Context, Scope
+from closure_compiler import ClosureCompiler
+from vm import BytecodeCompiler, VirtualMachine, disassemble_program
+from semantics import semantic_pipeline
+from tools.lexer_generator import load_generated_lexer
+from tools.parser_generator import load_generated_parser
+from semantics.utils import Context
 
 console = Console()
 
-path = os.getcwd() + '/tools'
-tokenizer = Serializer.load(path + '/lexer')
-parser = Serializer.load(path + '/parser')
+# generated modules holding the token regex and the LR(1) tables and semantic actions, see
+# tools/lexer_generator.py and tools/parser_generator.py. Neither loads the grammar unless it has to be regenerated.
+tokenize = load_generated_lexer()
+parse_program = load_generated_parser()
 
 
 def get_ast(args):
-    file = open(args.file)
-    code = file.read()
     if args.lexing:
         console.log('LEXING')
-    tokens = list(tokenizer(code))
-    if args.lexing:
-        console.log('Tokens')
-        console.print('\n'.join(str(token) for token in tokens), style='blue')
-    if args.parsing:
-        console.log('PARSING')
-    parse, operations = parser(tokens, get_shift_reduce=True)
+    with open(args.file) as file:
+        if args.lexing:
+            tokens = list(tokenize(file))
+            console.log('Tokens')
+            console.print('\n'.join(str(token) for token in tokens), style='blue')
+        else:
+            # the lexer reads the file a chunk at a time as the parser pulls tokens from it
+            tokens = tokenize(file)
+        if args.parsing:
+            console.log('PARSING')
+        # the reduced productions are only recorded when they are going to be printed
+        parse = [] if args.parsing else None
+        ast = parse_program(tokens, parse)
     if args.parsing:
         console.print('\n'.join(str(operation) for operation in parse), style='bold cyan')
-    ast = evaluate_reverse_parse(parse, operations, tokens)
     if args.ast:
         console.print('Abstract Syntax Tree\n' + FormatVisitor().visit(ast, 1),style='bold green')
     return ast
 
 
-def normal_pipeline(args):
-    ast = get_ast(args)
-    if ast is not None:
-        errors = []
-        context = Context()
-
-        collector = TypeCollector(context, errors)
-        collector.visit(ast)
-        builder = TypeBuilder(context, errors)
-        builder.context = collector.context
-        builder.visit(ast)
-        context.types.pop('AUTO_TYPE')
-        type_checker = TypeChecker(builder.context, errors)
-        type_checker.visit(ast)
-        if errors:
-            for error in errors:
-                console.print(error, style='bold red')
-        else:
-            interpreter = Interpreter(builder.context)
-            console.log('OUTPUT:')
-            interpreter.visit(ast, Scope())
-
-
-def full_pipeline(args):
+def pipeline(args):
     ast = get_ast(args)
 
     if ast is not None:
         errors = []
         context = Context()
-        scope = Scope()
+        passes = semantic_pipeline(args.inference)
 
-        # This part is for type inference
-        collector = TypeCollector(context, errors)
-        collector.visit(ast)
-        builder = TypeBuilder(context, errors)
-        builder.visit(ast)
-        inferencer = TypeInferencer(context, scope, errors)
-        inferencer.visit(ast, scope)
-        updater = TypesUpdater(inferencer.context,
-                               inferencer.scope,
-                               inferencer.functions,
-                               inferencer.attributes,
-                               inferencer.substitutions,
-                               inferencer.errors)
-        updater.visit(ast, inferencer.scope, 0)
-        if args.ast:
-            console.print('Abstract Syntax Tree after types inference\n' + FormatVisitor().visit(ast, 1),
-                          style='bold green')
-        # Normal pipeline
-        collector.context = Context()
-        collector.visit(ast)
-        builder.context = collector.context
-        builder.visit(ast)
-        type_checker = TypeChecker(builder.context, errors)
-        type_checker.visit(ast)
+        def on_pass(semantic_pass, state):
+            if args.ast and semantic_pass.name == 'update types':
+                console.print('Abstract Syntax Tree after types inference\n' + FormatVisitor().visit(ast, 1),
+                              style='bold green')
+
+        passes.run(on_pass, ast=ast, context=context, errors=errors)
+        if args.timings:
+            console.print('Semantic passes\n' + passes.report(), style='bold magenta')
         if errors:
             console.log('ERROR')
             for error in errors:
                 console.print(error, style='bold red')
         else:
-            interpreter = Interpreter(builder.context)
-            console.log('OUTPUT:')
-            interpreter.visit(ast, Scope())
+            execute(args, ast, context)
+
+
+def execute(args, ast, context):
+    if args.backend == 'closure':
+        program = ClosureCompiler(context).visit(ast)
+        console.log('OUTPUT:')
+        program()
+    elif args.backend == 'vm':
+        program = BytecodeCompiler(context).visit(ast)
+        if args.bytecode:
+            console.print('Bytecode\n' + disassemble_program(program), style='bold green')
+        console.log('OUTPUT:')
+        VirtualMachine(context, program).run()
+    else:
+        interpreter = Interpreter(context)
+        console.log('OUTPUT:')
+        interpreter.visit(ast)
 
 
 if __name__ == '__main__':
@@ -128,9 +109,25 @@ if __name__ == '__main__':
         default=True,
         help='Support for type inference through keyword AUTO_TYPE'
     )
+    args_parser.add_argument(
+        '--backend',
+        type=str,
+        default='interpreter',
+        choices=['interpreter', 'closure', 'vm'],
+        help='Execution engine: the tree-walking interpreter, the closure compiler or the bytecode VM'
+    )
+    args_parser.add_argument(
+        '--bytecode',
+        type=bool,
+        default=False,
+        help='Print the disassembled bytecode when running with the VM backend'
+    )
+    args_parser.add_argument(
+        '--timings',
+        type=bool,
+        default=False,
+        help='Print the time taken by each semantic pass'
+    )
     arguments = args_parser.parse_args()
 
-    if not arguments.inference:
-        normal_pipeline(arguments)
-    else:
-        full_pipeline(arguments)
+    pipeline(arguments)
@@ -0,0 +1,320 @@
+import operator
+from typing import Callable, Dict, List, Optional, Tuple
+from cmp import visitor
+import cool_ast
+from interpreter import CoolObject, VoidObject, defining_type, new_frame, resolve_dispatch
+from semantics import Context, Type, VoidType, VariablesResolver
+
+Closure = Callable[[List[CoolObject], CoolObject], CoolObject]
+# frame size and body of a method or attribute initializer
+CompiledMethod = Tuple[int, Closure]
+
+
+class ClosureCompiler:
+    """
+    Compiles a checked program into nested Python closures, one per AST node.
+
+    Every closure receives the current frame, laid out by `VariablesResolver`, and the object
+    bound to `self` and returns a CoolObject, so once the program is compiled no visitor
+    dispatch happens at runtime. The semantics are the same ones implemented by the
+    tree-walking `Interpreter`.
+    """
+
+    def __init__(self, context: Context):
+        self.context = context
+        self.current_type: Type = None
+        self.methods: Dict[Tuple[str, str], CompiledMethod] = {}
+        self.initializers: Dict[Tuple[str, str], Optional[CompiledMethod]] = {}
+
+    @visitor.on('node')
+    def visit(self, node):
+        pass
+
+    @visitor.when(cool_ast.ProgramNode)
+    def visit(self, node: cool_ast.ProgramNode) -> Callable[[], CoolObject]:
+        VariablesResolver().visit(node)
+        for class_decl in node.declarations:
+            self.visit(class_decl)
+
+        main_type = self.context.get_type('Main')
+        size, main = self.methods[defining_type(main_type, 'main').name, 'main']
+
+        def program():
+            main_object = CoolObject(main_type)
+            return main(new_frame(main_object, size), main_object)
+
+        return program
+
+    @visitor.when(cool_ast.ClassDeclarationNode)
+    def visit(self, node: cool_ast.ClassDeclarationNode) -> None:
+        self.current_type = self.context.get_type(node.id)
+        for feature in node.features:
+            self.visit(feature)
+
+    @visitor.when(cool_ast.AttrDeclarationNode)
+    def visit(self, node: cool_ast.AttrDeclarationNode) -> None:
+        initializer = None if node.expression is None else (node.frame_size, self.visit(node.expression))
+        self.initializers[self.current_type.name, node.id] = initializer
+
+    @visitor.when(cool_ast.MethodDeclarationNode)
+    def visit(self, node: cool_ast.MethodDeclarationNode) -> None:
+        body = self.visit(node.body) if node.body is not None else lambda frame, this: VoidObject()
+        self.methods[self.current_type.name, node.id] = node.frame_size, body
+
+    @visitor.when(cool_ast.BlocksNode)
+    def visit(self, node: cool_ast.BlocksNode) -> Closure:
+        expressions = [self.visit(expr) for expr in node.expr_list]
+        if not expressions:
+            return lambda frame, this: VoidObject()
+        *init, last = expressions
+
+        def blocks(frame, this):
+            for expr in init:
+                expr(frame, this)
+            return last(frame, this)
+
+        return blocks
+
+    @visitor.when(cool_ast.ConditionalNode)
+    def visit(self, node: cool_ast.ConditionalNode) -> Closure:
+        condition = self.visit(node.condition)
+        then_body = self.visit(node.then_body)
+        else_body = self.visit(node.else_body)
+
+        def conditional(frame, this):
+            if condition(frame, this).value:
+                return then_body(frame, this)
+            return else_body(frame, this)
+
+        return conditional
+
+    @visitor.when(cool_ast.LoopNode)
+    def visit(self, node: cool_ast.LoopNode) -> Closure:
+        condition = self.visit(node.condition)
+        body = self.visit(node.body)
+
+        def loop(frame, this):
+            while condition(frame, this).value:
+                body(frame, this)
+            return VoidObject()
+
+        return loop
+
+    @visitor.when(cool_ast.LetNode)
+    def visit(self, node: cool_ast.LetNode) -> Closure:
+        declarations = []
+        for var in node.var_decl_list:
+            expr = None if var.expr is None else self.visit(var.expr)
+            declarations.append((var.slot, self.context.get_type(var.typex), expr))
+        in_expr = self.visit(node.in_expr)
+
+        def let(frame, this):
+            for slot, typex, expr in declarations:
+                frame[slot] = CoolObject(typex) if expr is None else expr(frame, this)
+            return in_expr(frame, this)
+
+        return let
+
+    @visitor.when(cool_ast.CaseNode)
+    def visit(self, node: cool_ast.CaseNode) -> Closure:
+        case_expr = self.visit(node.case_expr)
+        options = [(option.slot, self.context.get_type(option.type), self.visit(option.expr))
+                   for option in node.options]
+        branches: Dict[Type, Tuple[int, Type, Closure]] = {}
+
+        def select(typex: Type) -> Tuple[int, Type, Closure]:
+            minimum = 1e10
+            most_suitable = 0
+            for index, (_, option_type, _) in enumerate(options):
+                distance = Type.types_distance(typex, option_type)
+                if distance != -1 and distance < minimum:
+                    most_suitable = index
+                    minimum = distance
+            return options[most_suitable]
+
+        def case(frame, this):
+            obj = case_expr(frame, this)
+            typex = obj.type
+            try:
+                slot, _, expr = branches[typex]
+            except KeyError:
+                branch = slot, _, expr = select(typex)
+                if not isinstance(typex, VoidType):
+                    branches[typex] = branch
+            frame[slot] = obj
+            return expr(frame, this)
+
+        return case
+
+    @visitor.when(cool_ast.MethodCallNode)
+    def visit(self, node: cool_ast.MethodCallNode) -> Closure:
+        expr = None if node.expr is None else self.visit(node.expr)
+        args = [self.visit(arg) for arg in node.args]
+        static_type = None if node.type is None else self.context.get_type(node.type)
+        name = node.id
+        context = self.context
+        targets: Dict[Type, Tuple[bool, object]] = {}
+
+        def method_call(frame, this):
+            obj = this if expr is None else expr(frame, this)
+            try:
+                is_builtin, target = targets[obj.type]
+            except KeyError:
+                is_builtin, target = targets[obj.type] = self._resolve(name, obj.type, static_type)
+
+            if is_builtin:
+                return target(obj, *[arg(frame, this) for arg in args], context)
+
+            size, body = target
+            method_frame = new_frame(obj, size)
+            for slot, arg in enumerate(args, 1):
+                method_frame[slot] = arg(frame, this)
+            return body(method_frame, obj)
+
+        return method_call
+
+    @visitor.when(cool_ast.VariableNode)
+    def visit(self, node: cool_ast.VariableNode) -> Closure:
+        name = node.lex
+        if name == 'self':
+            return lambda frame, this: this
+        if node.slot is not None:
+            slot = node.slot
+            return lambda frame, this: frame[slot]
+        initializers: Dict[Type, CompiledMethod] = {}
+
+        def variable(frame, this):
+            try:
+                return this.atributes[name]
+            except KeyError:
+                pass
+            try:
+                initializer = initializers[this.type]
+            except KeyError:
+                initializer = initializers[this.type] = self._attribute_initializer(this.type, name)
+            size, body = initializer
+            value = this.atributes[name] = body(new_frame(this, size), this)
+            return value
+
+        return variable
+
+    @visitor.when(cool_ast.AssignNode)
+    def visit(self, node: cool_ast.AssignNode) -> Closure:
+        expr = self.visit(node.expr)
+        name = node.id
+        if node.slot is not None:
+            slot = node.slot
+
+            def assign_local(frame, this):
+                value = frame[slot] = expr(frame, this)
+                return value
+
+            return assign_local
+        checked_types = set()
+
+        def assign(frame, this):
+            value = expr(frame, this)
+            if this.type in checked_types:
+                this.atributes[name] = value
+            else:
+                this.set_attribute(name, value)
+                checked_types.add(this.type)
+            return value
+
+        return assign
+
+    @visitor.when(cool_ast.NotNode)
+    def visit(self, node: cool_ast.NotNode) -> Closure:
+        expr = self.visit(node.expr)
+        bool_type = self.context.get_type('Bool')
+        return lambda frame, this: CoolObject(bool_type, not expr(frame, this).value)
+
+    @visitor.when(cool_ast.ComplementNode)
+    def visit(self, node: cool_ast.ComplementNode) -> Closure:
+        expr = self.visit(node.expr)
+        int_type = self.context.get_type('Int')
+        return lambda frame, this: CoolObject(int_type, -expr(frame, this).value)
+
+    @visitor.when(cool_ast.IsVoidNode)
+    def visit(self, node: cool_ast.IsVoidNode) -> Closure:
+        expr = self.visit(node.expr)
+        bool_type = self.context.get_type('Bool')
+        return lambda frame, this: CoolObject(bool_type, isinstance(expr(frame, this), VoidObject))
+
+    @visitor.when(cool_ast.ConstantNumNode)
+    def visit(self, node: cool_ast.ConstantNumNode) -> Closure:
+        constant = CoolObject(self.context.get_type('Int'), int(node.lex))
+        return lambda frame, this: constant
+
+    @visitor.when(cool_ast.BooleanNode)
+    def visit(self, node: cool_ast.BooleanNode) -> Closure:
+        constant = CoolObject(self.context.get_type('Bool'), node.lex == 'true')
+        return lambda frame, this: constant
+
+    @visitor.when(cool_ast.StringNode)
+    def visit(self, node: cool_ast.StringNode) -> Closure:
+        constant = CoolObject(self.context.get_type('String'), node.lex)
+        return lambda frame, this: constant
+
+    @visitor.when(cool_ast.InstantiateNode)
+    def visit(self, node: cool_ast.InstantiateNode) -> Closure:
+        typex = self.context.get_type(node.lex)
+        return lambda frame, this: CoolObject(typex)
+
+    @visitor.when(cool_ast.BinaryNode)
+    def visit(self, node: cool_ast.BinaryNode) -> Closure:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operation, result_type = self.operate(node)
+
+        def binary(frame, this):
+            return CoolObject(result_type, operation(left(frame, this).value, right(frame, this).value))
+
+        return binary
+
+    @visitor.on('node')
+    def operate(self, node):
+        pass
+
+    @visitor.when(cool_ast.PlusNode)
+    def operate(self, node):
+        return operator.add, self.context.get_type('Int')
+
+    @visitor.when(cool_ast.MinusNode)
+    def operate(self, node):
+        return operator.sub, self.context.get_type('Int')
+
+    @visitor.when(cool_ast.StarNode)
+    def operate(self, node):
+        return operator.mul, self.context.get_type('Int')
+
+    @visitor.when(cool_ast.DivNode)
+    def operate(self, node):
+        return operator.floordiv, self.context.get_type('Int')
+
+    @visitor.when(cool_ast.EqualsNode)
+    def operate(self, node):
+        return operator.eq, self.context.get_type('Bool')
+
+    @visitor.when(cool_ast.LessOrEqualNode)
+    def operate(self, node):
+        return operator.le, self.context.get_type('Bool')
+
+    @visitor.when(cool_ast.LessNode)
+    def operate(self, node):
+        return operator.lt, self.context.get_type('Bool')
+
+    def _resolve(self, name: str, dynamic_type: Type, static_type: Optional[Type]) -> Tuple[bool, object]:
+        builtin, owner = resolve_dispatch(self.context, name, dynamic_type, static_type)
+        if builtin is not None:
+            return True, builtin
+        return False, self.methods[owner.name, name]
+
+    def _attribute_initializer(self, typex: Type, name: str) -> CompiledMethod:
+        attribute = typex.get_attribute(name)
+        typex = typex.attribute_table[name][1]
+        initializer = self.initializers.get((typex.name, name))
+        if initializer is None:
+            attribute_type = attribute.type
+            return 1, lambda frame, this: CoolObject(attribute_type)
+        return initializer
@@ -308,53 +308,55 @@ def epsilon_closure(automaton, states):
 
     while pending:
         state = pending.pop()
-        # Your code here
         for new_state in automaton.epsilon_transitions(state):
-            closure.add(new_state)
-            pending.append(new_state)
+            if new_state not in closure:
+                closure.add(new_state)
+                pending.append(new_state)
 
     return ContainerSet(*closure)
 
 
 def nfa_to_dfa(automaton):
-    transitions = {}
+    """
+    Subset construction. DFA states are frozensets of NFA states, numbered through a dict, and the epsilon closure of
+    every NFA state is computed once. Each DFA state only tries the symbols its NFA states have transitions on.
+    """
+    closures = {}
+
+    def closure(state):
+        try:
+            return closures[state]
+        except KeyError:
+            value = closures[state] = frozenset(epsilon_closure(automaton, [state]).set)
+            return value
 
-    start = epsilon_closure(automaton, [automaton.start])
-    start.id = 0
-    start.is_final = any(s in automaton.finals for s in start)
+    transitions = {}
+    start = closure(automaton.start)
+    ids = {start: 0}
     states = [start]
 
     pending = [start]
     while pending:
         state = pending.pop()
+        origin = ids[state]
 
-        for symbol in automaton.vocabulary:
-            goto = move(automaton, state, symbol)
-            new_state = epsilon_closure(automaton, goto)
-            if len(new_state) == 0:
-                continue
-            new_state.is_final = any(s in automaton.finals for s in new_state)
+        moves = {}
+        for nfa_state in state:
+            for symbol, destinations in automaton.transitions[nfa_state].items():
+                if symbol != '':
+                    moves.setdefault(symbol, set()).update(destinations)
 
+        for symbol, goto in moves.items():
+            new_state = frozenset().union(*(closure(nfa_state) for nfa_state in goto))
             try:
-                transitions[state.id, symbol]
-                assert False, 'Invalid DFA!!!'
+                new_id = ids[new_state]
             except KeyError:
-                # Your code here
-                new_id = 0
-                for i, item in enumerate(states, 0):
-                    if item.set.issubset(new_state.set) and new_state.set.issubset(item.set):
-                        new_state.id = item.id
-                        new_id = item.id
-                        break
-                else:
-                    new_state.id = i + 1
-                    pending.append(new_state)
-                    states.append(new_state)
-                    new_id = i + 1
-
-                transitions[state.id, symbol] = new_id
+                new_id = ids[new_state] = len(states)
+                states.append(new_state)
+                pending.append(new_state)
+            transitions[origin, symbol] = new_id
 
-    finals = [state.id for state in states if state.is_final]
+    finals = [i for i, state in enumerate(states) if not automaton.finals.isdisjoint(state)]
     dfa = DFA(len(states), finals, transitions)
     return dfa
 
@@ -434,57 +436,66 @@ def automata_closure(a1):
     return NFA(J, S, transitions, start)
 
 
-def distinguish_states(group, automaton, partition):
-    split = {}
-    vocabulary = tuple(automaton.vocabulary)
-
-    transition = automaton.transitions
-
-    for member in group:
-        for item in split.keys():
-            for symbol in vocabulary:
-                q1 = None
-                q2 = None
-                try:
-                    q1 = partition[transition[item][symbol][0]].representative
-                except KeyError:
-                    q1 = None
-                try:
-                    q2 = partition[transition[member.value][symbol][0]].representative
-                except KeyError:
-                    q2 = None
-                if q1 != q2:
-                    break
-            else:
-                split[item].append(member.value)
-                break
-        else:
-            split[member.value] = [member.value]
-
-    return [group for group in split.values()]
-
-
 def state_minimization(automaton):
-    partition = DisjointSet(*range(automaton.states))
-
-    finals = list(automaton.finals)
-    non_finals = [state for state in range(automaton.states) if not state in automaton.finals]
-    partition.merge(finals)
-    partition.merge(non_finals)
-
-    while True:
-        new_partition = DisjointSet(*range(automaton.states))
-
-        for group in partition.groups:
-            new_groups = distinguish_states(group, automaton, partition)
-            for new_group in new_groups:
-                new_partition.merge(new_group)
-
-        if len(new_partition) == len(partition):
-            break
+    """
+    Hopcroft's partition refinement, O(n log n) on the number of states. Missing transitions go to an implicit dead
+    state, which belongs to no group of the returned partition.
+    """
+    states = automaton.states
+    dead = states
+    vocabulary = tuple(automaton.vocabulary)
 
-        partition = new_partition
+    # inverse[symbol][target] lists the states that reach `target` on `symbol`
+    inverse = {symbol: {} for symbol in vocabulary}
+    for origin in range(states):
+        targets = automaton.transitions[origin]
+        for symbol in vocabulary:
+            try:
+                target = targets[symbol][0]
+            except KeyError:
+                target = dead
+            inverse[symbol].setdefault(target, []).append(origin)
+    # the dead state loops on every symbol, the splitting rule needs a total transition function
+    for symbol in vocabulary:
+        inverse[symbol].setdefault(dead, []).append(dead)
+
+    finals = set(automaton.finals)
+    non_finals = set(range(states + 1)) - finals
+    blocks = [group for group in (finals, non_finals) if group]
+    block_of = [0] * (states + 1)
+    for i, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = i
+
+    smallest = min(range(len(blocks)), key=lambda i: len(blocks[i]))
+    pending = {(smallest, symbol) for symbol in vocabulary}
+    while pending:
+        splitter, symbol = pending.pop()
+        sources = inverse[symbol]
+        # states that reach the splitter on `symbol`, grouped by the block they belong to
+        touched = {}
+        for target in blocks[splitter]:
+            for origin in sources.get(target, ()):
+                touched.setdefault(block_of[origin], set()).add(origin)
+
+        for i, inside in touched.items():
+            block = blocks[i]
+            if len(inside) == len(block):
+                continue
+            block -= inside
+            j = len(blocks)
+            blocks.append(inside)
+            for state in inside:
+                block_of[state] = j
+            for other in vocabulary:
+                if (i, other) in pending:
+                    pending.add((j, other))
+                else:
+                    pending.add((j, other) if len(inside) <= len(block) else (i, other))
 
+    partition = DisjointSet(*range(states))
+    for block in blocks:
+        partition.merge(state for state in block if state != dead)
     return partition
 
 
@@ -492,12 +503,13 @@ def automata_minimization(automaton):
     partition = state_minimization(automaton)
 
     states = [s for s in partition.representatives]
+    index = {state: i for i, state in enumerate(states)}
 
     transitions = {}
     for i, state in enumerate(states):
         origin = state.value
         for symbol, destinations in automaton.transitions[origin].items():
-            new_dest = states.index(partition[destinations[0]].representative)
+            new_dest = index[partition[destinations[0]].representative]
 
             try:
                 transitions[i, symbol]
@@ -506,7 +518,7 @@ def automata_minimization(automaton):
                 transitions[i, symbol] = new_dest
                 pass
 
-    start = states.index(partition[automaton.start].representative)
+    start = index[partition[automaton.start].representative]
     finals = set([i for i in range(len(states)) if states[i].value in automaton.finals])
 
     return DFA(len(states), finals, transitions, start)
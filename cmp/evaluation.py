@@ -1,5 +1,6 @@
 from cmp.parsers.shift_reduce_parser import ShiftReduceParser
 from cmp.pycompiler import EOF
+from cmp.utils import TokenBuffer
 
 
 def evaluate_parse(left_parse, tokens):
@@ -45,12 +46,16 @@ def evaluate_reverse_parse(right_parse, operations, tokens):
         return
 
     right_parse = iter(right_parse)
-    tokens = iter(tokens)
+    # lexemes of a TokenBuffer are sliced out of the source only when they are shifted
+    buffered = isinstance(tokens, TokenBuffer)
+    if not buffered:
+        tokens = iter(tokens)
+    shifted = 0
     stack = []
     for operation in operations:
         if operation == ShiftReduceParser.SHIFT:
-            token = next(tokens)
-            stack.append(token.lex)
+            stack.append(tokens.lex(shifted) if buffered else next(tokens).lex)
+            shifted += 1
         elif operation == ShiftReduceParser.REDUCE:
             production = next(right_parse)
             head, body = production
@@ -68,5 +73,5 @@ def evaluate_reverse_parse(right_parse, operations, tokens):
             raise Exception('Invalid action!!!')
 
     assert len(stack) == 1
-    assert isinstance(next(tokens).token_type, EOF)
+    assert isinstance(tokens.token_type(shifted) if buffered else next(tokens).token_type, EOF)
     return stack[0]
@@ -1,4 +1,3 @@
-from itertools import islice
 from cmp.utils import ContainerSet
 
 
@@ -22,82 +21,132 @@ def compute_local_first(firsts, alpha):
     return first_alpha
 
 
+class _Bitsets:
+    """
+    Numbers the terminals of a grammar (EOF included) so sets of terminals can be stored as int bitmasks.
+    """
+
+    def __init__(self, G):
+        self.terminals = [G.EOF] + G.terminals
+        self.ids = {terminal: i for i, terminal in enumerate(self.terminals)}
+
+    def mask(self, terminal):
+        return 1 << self.ids[terminal]
+
+    def container(self, mask, contains_epsilon=False):
+        terminals = self.terminals
+        values = []
+        i = 0
+        while mask:
+            if mask & 1:
+                values.append(terminals[i])
+            mask >>= 1
+            i += 1
+        return ContainerSet(*values, contains_epsilon=contains_epsilon)
+
+
+def _first_masks(G, bitsets):
+    """
+    FIRST bitmask and nullability of every nonterminal. A worklist of productions is kept: a production is revisited
+    only when the FIRST set or nullability of a nonterminal in its body changed.
+    """
+    first = {nonterminal: 0 for nonterminal in G.nonTerminals}
+    nullable = {nonterminal: False for nonterminal in G.nonTerminals}
+
+    users = {nonterminal: [] for nonterminal in G.nonTerminals}
+    for production in G.Productions:
+        for symbol in set(production.Right):
+            if not symbol.IsTerminal:
+                users[symbol].append(production)
+
+    pending = list(G.Productions)
+    queued = set(pending)
+    while pending:
+        production = pending.pop()
+        queued.discard(production)
+        x = production.Left
+
+        mask, epsilon = _local_first_mask(first, nullable, bitsets, production.Right)
+        if first[x] | mask != first[x] or (epsilon and not nullable[x]):
+            first[x] |= mask
+            nullable[x] |= epsilon
+            for user in users[x]:
+                if user not in queued:
+                    queued.add(user)
+                    pending.append(user)
+
+    return first, nullable
+
+
+def _local_first_mask(first, nullable, bitsets, alpha):
+    mask = 0
+    for symbol in alpha:
+        if symbol.IsTerminal:
+            return mask | bitsets.mask(symbol), False
+        mask |= first[symbol]
+        if not nullable[symbol]:
+            return mask, False
+    return mask, True
+
+
 def compute_firsts(G):
+    bitsets = _Bitsets(G)
+    first, nullable = _first_masks(G, bitsets)
     firsts = {}
-    change = True
 
-    # init First(Vt)
+    # First(Vt)
     for terminal in G.terminals:
         firsts[terminal] = ContainerSet(terminal)
 
-    # init First(Vn)
+    # First(Vn)
     for nonterminal in G.nonTerminals:
-        firsts[nonterminal] = ContainerSet()
-
-    while change:
-        change = False
-
-        # P: x -> alpha
-        for production in G.Productions:
-            x = production.Left
-            alpha = production.Right
-
-            # get current First(x)
-            first_x = firsts[x]
+        firsts[nonterminal] = bitsets.container(first[nonterminal], nullable[nonterminal])
 
-            # init First(alpha)
-            try:
-                first_alpha = firsts[alpha]
-            except KeyError:
-                first_alpha = firsts[alpha] = ContainerSet()
+    # First(RightSides)
+    for production in G.Productions:
+        alpha = production.Right
+        if alpha not in firsts:
+            firsts[alpha] = bitsets.container(*_local_first_mask(first, nullable, bitsets, alpha))
 
-            # CurrentFirst(alpha)???
-            local_first = compute_local_first(firsts, alpha)
-
-            # update First(x) and First(alpha) from CurrentFirst(alpha)
-            change |= first_alpha.hard_update(local_first)
-            change |= first_x.hard_update(local_first)
-
-    # First(Vt) + First(Vt) + First(RightSides)
     return firsts
 
 
 def compute_follows(G, firsts):
-    follows = {}
-    change = True
-
-    local_firsts = {}
-
-    # init Follow(Vn)
+    """
+    Follow sets as bitmasks: FIRST(beta) contributions for every `X -> alpha Y beta` are added up front, then the
+    `Follow(X) <= Follow(Y)` inclusions (beta nullable) are propagated with a worklist.
+    """
+    bitsets = _Bitsets(G)
+    first = {nonterminal: 0 for nonterminal in G.nonTerminals}
+    nullable = {nonterminal: False for nonterminal in G.nonTerminals}
     for nonterminal in G.nonTerminals:
-        follows[nonterminal] = ContainerSet()
-    follows[G.startSymbol] = ContainerSet(G.EOF)
-
-    while change:
-        change = False
-
-        # P: X -> alpha
-        for production in G.Productions:
-            x = production.Left
-            alpha = production.Right
-
-            follow_x = follows[x]
-
-            for i, Y in enumerate(alpha):
-
-                if not Y.IsTerminal:
-
-                    follow_y = follows[Y]
-
-                    try:
-                        first_beta = local_firsts[alpha, i]
-                    except KeyError:
-                        first_beta = local_firsts[alpha, i] = compute_local_first(firsts, islice(alpha, i + 1, None))
-
-                    change |= follow_y.update(first_beta)
-
-                    if i == len(alpha) - 1 or first_beta.contains_epsilon:
-                        change |= follow_y.update(follow_x)
+        for terminal in firsts[nonterminal]:
+            first[nonterminal] |= bitsets.mask(terminal)
+        nullable[nonterminal] = firsts[nonterminal].contains_epsilon
+
+    follow = {nonterminal: 0 for nonterminal in G.nonTerminals}
+    follow[G.startSymbol] = bitsets.mask(G.EOF)
+    inclusions = {nonterminal: set() for nonterminal in G.nonTerminals}
+
+    # P: X -> alpha
+    for production in G.Productions:
+        x = production.Left
+        alpha = list(production.Right)
+
+        for i, y in enumerate(alpha):
+            if not y.IsTerminal:
+                mask, epsilon = _local_first_mask(first, nullable, bitsets, alpha[i + 1:])
+                follow[y] |= mask
+                if epsilon and y != x:
+                    inclusions[x].add(y)
+
+    pending = list(G.nonTerminals)
+    while pending:
+        x = pending.pop()
+        for y in inclusions[x]:
+            if follow[y] | follow[x] != follow[y]:
+                follow[y] |= follow[x]
+                pending.append(y)
 
     # Follow(Vn)
-    return follows
+    return {nonterminal: bitsets.container(mask) for nonterminal, mask in follow.items()}
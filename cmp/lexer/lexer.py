@@ -1,13 +1,17 @@
+from array import array
 from cmp.automata import State
 from cmp.utils import Token
 from cmp.lexer.regex import Regex
 
 
 class Lexer:
+    NO_TAG = 1 << 30
+
     def __init__(self, table, eof):
         self.eof = eof
         self.regexs = self._build_regexs(table)
         self.automaton = self._build_automaton()
+        self._build_tables()
 
     @staticmethod
     def _build_regexs(table):
@@ -29,35 +33,94 @@ class Lexer:
 
         return start.to_deterministic()
 
-    def _walk(self, string):
-        state = self.automaton
-        final_lex = lex = ''
-        token_type = None
-        priority = 500000
+    def _build_tables(self):
+        """
+        Exports the combined automaton into integer tables.
+
+        Characters with identical transitions in every state share an equivalence class; class 0 holds every
+        character without transitions. `self.transitions[state * self.width + class]` is the next state or -1.
+        `self.best_tag[state]` is the smallest tag index of a final state and `self.exact_tag[state]` the tag whose
+        name equals every lexeme that reaches the state (keywords and operators), or `NO_TAG`.
+        """
+        states = list(self.automaton)
+        index = {state: i for i, state in enumerate(states)}
+        alphabet = sorted({symbol for state in states for symbol in state.transitions})
+
+        columns = {}
+        self.classes = {}
+        for symbol in alphabet:
+            column = tuple(index[state.transitions[symbol][0]] if symbol in state.transitions else -1
+                           for state in states)
+            self.classes[symbol] = columns.setdefault(column, len(columns) + 1)
+
+        self.width = len(columns) + 1
+        self.transitions = array('i', [-1]) * (len(states) * self.width)
+        for column, cls in columns.items():
+            for state, target in enumerate(column):
+                self.transitions[state * self.width + cls] = target
+
+        self.token_types = []
+        self.best_tag = array('i', [self.NO_TAG]) * len(states)
+        self.exact_tag = array('i', [self.NO_TAG]) * len(states)
+        for i, state in enumerate(states):
+            if state.final and state.tag:
+                self.best_tag[i] = min(n for n, _ in state.tag)
+            for n, token_type in state.tag or ():
+                while len(self.token_types) <= n:
+                    self.token_types.append(None)
+                self.token_types[n] = token_type
+
+        for n, token_type in enumerate(self.token_types):
+            name = str(token_type)
+            if token_type is None or name == 'id':
+                continue
+            state = self._run(name)
+            if state >= 0 and states[state].final and (n, token_type) in states[state].tag:
+                self.exact_tag[state] = n
+
+    def _run(self, string):
+        state = 0
         for symbol in string:
-            try:
-                state = state.get(symbol)
-                lex += symbol
-                if state.final:
-                    if state.tag is not None:
-                        for tag in state.tag:
-                            if lex == str(tag[1]) and str(tag[1]) != 'id':
-                                priority, token_type = tag
-                                final_lex = lex
-                                break
-                            elif tag[0] <= priority:
-                                priority, token_type = tag
-                                final_lex = lex
-            except KeyError:
+            cls = self.classes.get(symbol, 0)
+            state = self.transitions[state * self.width + cls]
+            if state < 0:
                 break
-
-        return token_type, final_lex
+        return state
 
     def _tokenize(self, text):
-        while len(text) > 0:
-            token_type, lex = self._walk(text)
-            yield lex, token_type
-            text = text[len(lex):]
+        classes = self.classes
+        transitions = self.transitions
+        width = self.width
+        best_tag = self.best_tag
+        exact_tag = self.exact_tag
+        token_types = self.token_types
+        no_tag = self.NO_TAG
+
+        position = 0
+        length = len(text)
+        while position < length:
+            state = 0
+            priority = no_tag
+            token = -1
+            end = position
+            i = position
+            while i < length:
+                state = transitions[state * width + classes.get(text[i], 0)]
+                if state < 0:
+                    break
+                i += 1
+                tag = exact_tag[state]
+                if tag == no_tag:
+                    tag = best_tag[state]
+                    if tag > priority:
+                        continue
+                priority = token = tag
+                end = i
+
+            if token < 0:
+                raise Exception(f'Unknown token at position {position}')
+            yield text[position:end], token_types[token]
+            position = end
 
         yield '$', self.eof
 
@@ -1,49 +1,77 @@
 from cmp.automata import State, multiline_formatter
-from cmp.parsers.lr1_parser import build_LR1_automaton
+from cmp.parsers.lr1_parser import LR1Builder
+from cmp.parsers.slr1_parser import build_LR0_automaton
 from cmp.pycompiler import Item
 from cmp.parsers.shift_reduce_parser import ShiftReduceParser
 
 
 def build_LALR1_automaton(G):
-    automaton = build_LR1_automaton(G)
-
-    stKernel = {}
-    for node in automaton:
-        kernel = frozenset([item.Center() for item in node.state])
-        try:
-            stKernel[kernel].append(node)
-        except KeyError:
-            stKernel[kernel] = [node]
+    """
+    LALR(1) automaton computed on the LR(0) automaton with spontaneous and propagated lookaheads.
+
+    For every kernel item `k`, the LR(1) closure of `{[k, #]}` (with `#` a marker outside the grammar) tells which
+    lookaheads each successor kernel item gets spontaneously and which ones it inherits from `k`; the inherited ones
+    are then propagated with a worklist. States are numbered as when merging the canonical LR(1) automaton.
+    """
+    builder = LR1Builder(G)
+    marker = 1 << builder.terminals
+    lr0 = build_LR0_automaton(G).to_deterministic()
+
+    kernels = {}
+    for node in lr0:
+        kernels[node] = [builder.item_id(nfa_state.state) for nfa_state in node.state
+                         if nfa_state.state.pos > 0 or nfa_state.state.production.Left == G.startSymbol]
+
+    lookaheads = {(node, item): 0 for node, items in kernels.items() for item in items}
+    propagation = {key: [] for key in lookaheads}
+    closures = {}
+    for node, items in kernels.items():
+        for item in items:
+            try:
+                closure = closures[item]
+            except KeyError:
+                closure = closures[item] = builder.closure({item: marker})
+            for closure_item, mask in closure.items():
+                symbol = builder.item_next[closure_item]
+                if symbol < 0:
+                    continue
+                target = node.transitions[builder.symbols[symbol].Name][0], closure_item + 1
+                lookaheads[target] |= mask & ~marker
+                if mask & marker:
+                    propagation[node, item].append(target)
+
+    start_item = builder.item_id(Item(G.startSymbol.productions[0], 0))
+    lookaheads[lr0, start_item] |= 1 << builder.symbol_ids[G.EOF]
+
+    pending = [key for key, mask in lookaheads.items() if mask]
+    while pending:
+        source = pending.pop()
+        mask = lookaheads[source]
+        for target in propagation[source]:
+            if lookaheads[target] | mask != lookaheads[target]:
+                lookaheads[target] |= mask
+                pending.append(target)
 
-    initial = frozenset([item.Center() for item in automaton.state])
-    automaton = State(automaton.state, True)
+    def build_state(node):
+        kernel = {item: lookaheads[node, item] for item in kernels[node]}
+        return State(builder.items(builder.closure(kernel)), True)
 
-    visited = {initial: automaton}
-    pending = [initial]
+    automaton = build_state(lr0)
+    visited = {lr0: automaton}
+    pending = [lr0]
 
     while pending:
         current = pending.pop()
         current_state = visited[current]
-        lr1_state = stKernel[current][0]
 
         for symbol in G.terminals + G.nonTerminals:
-            if symbol.Name in lr1_state.transitions:
-                dest_core = frozenset([item.Center() for item in lr1_state.transitions[symbol.Name][0].state])
-
+            if symbol.Name in current.transitions:
+                node = current.transitions[symbol.Name][0]
                 try:
-                    next_state = visited[dest_core]
-
+                    next_state = visited[node]
                 except KeyError:
-                    union_core = {center: set() for center in dest_core}
-                    for node in stKernel[dest_core]:
-                        for item in node.state:
-                            union_core[item.Center()].update(item.lookaheads)
-                    union_core = frozenset(
-                        [Item(center.production, center.pos, lookaheads=lookaheads) for center, lookaheads in
-                         union_core.items()])
-                    next_state = State(union_core, True)
-                    visited[dest_core] = next_state
-                    pending.append(dest_core)
+                    next_state = visited[node] = build_state(node)
+                    pending.append(node)
                 current_state.add_transition(symbol.Name, next_state)
 
     automaton.set_formatter(multiline_formatter)
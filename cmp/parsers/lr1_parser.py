@@ -58,43 +58,155 @@ def goto_lr1(items, symbol, firsts=None, just_kernel=False):
     return items if just_kernel else closure_lr1(items, firsts)
 
 
-def build_LR1_automaton(G):
-    assert len(G.startSymbol.productions) == 1, 'Grammar must be augmented'
-
-    firsts = compute_firsts(G)
-    firsts[G.EOF] = ContainerSet(G.EOF)
-
-    start_production = G.startSymbol.productions[0]
-    start_item = Item(start_production, 0, lookaheads=(G.EOF,))
-    start = frozenset([start_item])
-
-    closure = closure_lr1(start, firsts)
-    automaton = State(frozenset(closure), True)
-
-    pending = [start]
-    visited = {start: automaton}
-
-    while pending:
-        current = pending.pop()
-        current_state = visited[current]
-
-        for symbol in G.terminals + G.nonTerminals:
-            closure = closure_lr1(current, firsts)
-            goto = goto_lr1(closure, symbol, firsts, True)
-
-            if not goto:
+class LR1Builder:
+    """
+    Canonical LR(1) construction over interned items.
+
+    Terminals (EOF included) and nonterminals are numbered, an item `(production, pos)` is a single integer and a
+    lookahead set is an integer bitmask over terminal numbers. FIRST of every item suffix is precomputed once, and the
+    closure of each kernel is computed once with a worklist, so goto sets for every symbol come from a single pass
+    over the closure.
+    """
+
+    def __init__(self, G):
+        assert len(G.startSymbol.productions) == 1, 'Grammar must be augmented'
+        self.G = G
+        self.symbols = [G.EOF] + G.terminals + G.nonTerminals
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.terminals = len(G.terminals) + 1
+
+        firsts = compute_firsts(G)
+        first_masks = {}
+        for symbol in self.symbols:
+            first = ContainerSet(G.EOF) if symbol == G.EOF else firsts[symbol]
+            first_masks[symbol] = (self._mask(first), first.contains_epsilon)
+
+        # item `i` is `(self.productions[self.item_production[i]], i - self.item_offset[production])`
+        self.productions = list(G.Productions)
+        self.production_ids = {production: p for p, production in enumerate(self.productions)}
+        self.item_offset = []
+        self.item_production = []
+        self.item_next = []
+        self.item_suffix = []
+        for p, production in enumerate(self.productions):
+            self.item_offset.append(len(self.item_next))
+            body = list(production.Right)
+            for pos in range(len(body) + 1):
+                self.item_production.append(p)
+                self.item_next.append(self.symbol_ids[body[pos]] if pos < len(body) else -1)
+                mask, nullable = 0, True
+                for symbol in body[pos + 1:]:
+                    first, epsilon = first_masks[symbol]
+                    mask |= first
+                    if not epsilon:
+                        nullable = False
+                        break
+                self.item_suffix.append((mask, nullable))
+
+        self.initial_items = [[] for _ in self.symbols]
+        for p, production in enumerate(self.productions):
+            self.initial_items[self.symbol_ids[production.Left]].append(self.item_offset[p])
+
+        self._lookaheads = {}
+
+    def item_id(self, item):
+        return self.item_offset[self.production_ids[item.production]] + item.pos
+
+    def _mask(self, symbols):
+        mask = 0
+        for symbol in symbols:
+            mask |= 1 << self.symbol_ids[symbol]
+        return mask
+
+    def closure(self, kernel):
+        closure = dict(kernel)
+        pending = list(kernel)
+        item_next = self.item_next
+        item_suffix = self.item_suffix
+        initial_items = self.initial_items
+        terminals = self.terminals
+        while pending:
+            item = pending.pop()
+            symbol = item_next[item]
+            if symbol < terminals:
+                continue
+            mask, nullable = item_suffix[item]
+            if nullable:
+                mask |= closure[item]
+            for initial in initial_items[symbol]:
+                current = closure.get(initial, 0)
+                if current | mask != current:
+                    closure[initial] = current | mask
+                    pending.append(initial)
+        return closure
+
+    def gotos(self, closure):
+        gotos = {}
+        item_next = self.item_next
+        for item, mask in closure.items():
+            symbol = item_next[item]
+            if symbol < 0:
                 continue
             try:
-                next_state = visited[goto]
+                kernel = gotos[symbol]
             except KeyError:
-                closure = closure_lr1(goto, firsts)
-                next_state = visited[goto] = State(frozenset(closure), True)
-                pending.append(goto)
+                kernel = gotos[symbol] = {}
+            kernel[item + 1] = kernel.get(item + 1, 0) | mask
+        return gotos
+
+    def items(self, closure):
+        items = []
+        for item, mask in closure.items():
+            production = self.item_production[item]
+            items.append(Item(self.productions[production], item - self.item_offset[production],
+                              self.lookaheads(mask)))
+        return frozenset(items)
+
+    def lookaheads(self, mask):
+        try:
+            return self._lookaheads[mask]
+        except KeyError:
+            symbols = self.symbols
+            lookaheads = self._lookaheads[mask] = frozenset(symbols[i] for i in range(self.terminals) if mask >> i & 1)
+            return lookaheads
+
+    def build(self):
+        G = self.G
+        start = {self.item_offset[self.production_ids[G.startSymbol.productions[0]]]: 1 << self.symbol_ids[G.EOF]}
+        start_key = frozenset(start.items())
+        closure = self.closure(start)
+        automaton = State(self.items(closure), True)
+
+        pending = [(start_key, closure)]
+        visited = {start_key: automaton}
+        order = [self.symbol_ids[symbol] for symbol in G.terminals + G.nonTerminals]
+
+        while pending:
+            current, closure = pending.pop()
+            current_state = visited[current]
+            gotos = self.gotos(closure)
+
+            for symbol in order:
+                try:
+                    kernel = gotos[symbol]
+                except KeyError:
+                    continue
+                key = frozenset(kernel.items())
+                try:
+                    next_state = visited[key]
+                except KeyError:
+                    next_closure = self.closure(kernel)
+                    next_state = visited[key] = State(self.items(next_closure), True)
+                    pending.append((key, next_closure))
+
+                current_state.add_transition(self.symbols[symbol].Name, next_state)
+
+        automaton.set_formatter(multiline_formatter)
+        return automaton
 
-            current_state.add_transition(symbol.Name, next_state)
 
-    automaton.set_formatter(multiline_formatter)
-    return automaton
+def build_LR1_automaton(G):
+    return LR1Builder(G).build()
 
 
 class LR1Parser(ShiftReduceParser):
@@ -0,0 +1,202 @@
+from array import array
+import struct
+
+# Action encoding: 0 is an error, n > 0 shifts to state n - 1, ACCEPT accepts and n < ACCEPT reduces production
+# ACCEPT - n - 1 (an index into `Grammar.Productions`).
+ERROR = 0
+ACCEPT = -1
+
+MAGIC = b'LRTB'
+
+
+def encode_shift(state):
+    return state + 1
+
+
+def encode_reduce(production):
+    return ACCEPT - production - 1
+
+
+def decode_reduce(action):
+    return ACCEPT - action - 1
+
+
+def displace(rows, width):
+    """
+    Row-displacement compression of sparse rows, given as `{column: value}` dicts.
+
+    Row `r` is overlaid on a single `value` array starting at `base[r]`; `check[base[r] + c] == r` tells whether
+    column `c` of row `r` is stored there. Every `base[r] + c` with `0 <= c < width` is a valid index.
+    """
+    base = array('i', [0]) * len(rows)
+    check = array('i')
+    value = array('i')
+    occupied = 0  # bit i is set when slot i is taken
+    free = 0  # every slot below `free` is taken
+
+    for r in sorted(range(len(rows)), key=lambda r: -len(rows[r])):
+        row = rows[r]
+        if not row:
+            continue
+        columns = sorted(row)
+        # bit o of `fits` is set when every column of the row is free at offset o
+        fits = -1
+        for c in columns:
+            fits &= ~(occupied >> c)
+        lowest = max(0, free - columns[0])
+        fits >>= lowest
+        offset = lowest + (fits & -fits).bit_length() - 1
+        base[r] = offset
+        for c in columns:
+            occupied |= 1 << (offset + c)
+        missing = offset + width - len(value)
+        if missing > 0:
+            check.extend([-1] * missing)
+            value.extend([0] * missing)
+        for c in columns:
+            check[offset + c] = r
+            value[offset + c] = row[c]
+        while (occupied >> free) & 1:
+            free += 1
+
+    if len(value) < width:
+        check.extend([-1] * (width - len(value)))
+        value.extend([0] * (width - len(value)))
+    return base, check, value
+
+
+class LRTable:
+    """
+    Integer ACTION/GOTO tables of a shift-reduce parser.
+
+    Terminals and nonterminals are numbered by their position in `terminals` and `nonterminals` (names); terminal 0 is
+    always EOF and terminal `len(terminals)` stands for any unknown token type. ACTION rows are row-displacement
+    compressed (`action_base`, `action_check`, `action_value`), with the most common reduction of each state moved to
+    `default`. GOTO rows are compressed the same way and need no check, since the parser only asks for valid gotos.
+    `lengths[p]` and `lefts[p]` are the body length and the head of production `p`.
+    """
+
+    def __init__(self, terminals, nonterminals, lengths, lefts, default, action_base, action_check, action_value,
+                 goto_base, goto_value):
+        self.terminals = terminals
+        self.nonterminals = nonterminals
+        self.terminal_ids = {name: i for i, name in enumerate(terminals)}
+        self.lengths = lengths
+        self.lefts = lefts
+        self.default = default
+        self.action_base = action_base
+        self.action_check = action_check
+        self.action_value = action_value
+        self.goto_base = goto_base
+        self.goto_value = goto_value
+
+    @property
+    def unknown(self):
+        return len(self.terminals)
+
+    @property
+    def states(self):
+        return len(self.default)
+
+    def action(self, state, terminal):
+        index = self.action_base[state] + terminal
+        if self.action_check[index] == state:
+            return self.action_value[index]
+        return self.default[state]
+
+    def goto(self, state, nonterminal):
+        return self.goto_value[self.goto_base[state] + nonterminal]
+
+    @staticmethod
+    def compile(G, action, goto):
+        """
+        Lowers the `(state, symbol) -> [entries]` dicts filled by `_build_parsing_table` into an `LRTable`.
+        Symbols may be given as `Symbol`s or names; as in the dict tables, the first entry of a conflict wins.
+        """
+        terminals = [G.EOF.Name] + [t.Name for t in G.terminals]
+        nonterminals = [n.Name for n in G.nonTerminals]
+        terminal_ids = {name: i for i, name in enumerate(terminals)}
+        nonterminal_ids = {name: i for i, name in enumerate(nonterminals)}
+        production_ids = {production: i for i, production in enumerate(G.Productions)}
+
+        states = 1 + max([state for state, _ in action] + [state for state, _ in goto])
+        action_rows = [{} for _ in range(states)]
+        goto_rows = [{} for _ in range(states)]
+
+        for (state, symbol), entries in action.items():
+            kind, tag = entries[0]
+            if kind == 'SHIFT':
+                value = encode_shift(tag)
+            elif kind == 'REDUCE':
+                value = encode_reduce(production_ids[tag])
+            else:
+                value = ACCEPT
+            action_rows[state][terminal_ids[getattr(symbol, 'Name', symbol)]] = value
+
+        for (state, symbol), entries in goto.items():
+            goto_rows[state][nonterminal_ids[getattr(symbol, 'Name', symbol)]] = entries[0]
+
+        default = array('i', [ERROR]) * states
+        for state, row in enumerate(action_rows):
+            reductions = [value for value in row.values() if value < ACCEPT]
+            if reductions:
+                value = max(set(reductions), key=reductions.count)
+                default[state] = value
+                action_rows[state] = {c: v for c, v in row.items() if v != value}
+
+        action_base, action_check, action_value = displace(action_rows, len(terminals) + 1)
+        goto_base, _, goto_value = displace(goto_rows, len(nonterminals))
+
+        lengths = array('i', (len(production.Right) for production in G.Productions))
+        lefts = array('i', (nonterminal_ids.get(production.Left.Name, -1) for production in G.Productions))
+
+        return LRTable(terminals, nonterminals, lengths, lefts, default, action_base, action_check, action_value,
+                       goto_base, goto_value)
+
+    def _arrays(self):
+        return [self.lengths, self.lefts, self.default, self.action_base, self.action_check, self.action_value,
+                self.goto_base, self.goto_value]
+
+    def to_bytes(self):
+        """
+        Compact serialization: the symbol names followed by every integer array as length-prefixed raw bytes.
+        """
+        chunks = [MAGIC]
+        for names in (self.terminals, self.nonterminals):
+            data = '\0'.join(names).encode()
+            chunks.append(struct.pack('<I', len(data)))
+            chunks.append(data)
+        for column in self._arrays():
+            chunks.append(struct.pack('<I', len(column)))
+            chunks.append(column.tobytes())
+        return b''.join(chunks)
+
+    @staticmethod
+    def from_bytes(data, byteswap=False):
+        """
+        Inverse of `to_bytes`; `byteswap` converts arrays written on a machine with the other byte order.
+        """
+        data = memoryview(data)
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError('Not an LR table')
+        offset = len(MAGIC)
+
+        names = []
+        for _ in range(2):
+            size, = struct.unpack_from('<I', data, offset)
+            offset += 4
+            names.append(bytes(data[offset:offset + size]).decode().split('\0'))
+            offset += size
+
+        columns = []
+        for _ in range(8):
+            size, = struct.unpack_from('<I', data, offset)
+            offset += 4
+            column = array('i')
+            column.frombytes(data[offset:offset + size * column.itemsize])
+            if byteswap:
+                column.byteswap()
+            offset += size * column.itemsize
+            columns.append(column)
+
+        return LRTable(*names, *columns)
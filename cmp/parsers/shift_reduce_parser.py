@@ -1,3 +1,27 @@
+from cmp.parsers.lr_table import ACCEPT, LRTable, decode_reduce
+from cmp.utils import TokenBuffer
+
+
+class LazySymbols:
+    """
+    Values of the body symbols of a reduced production, as seen by its rule through `s[i]`. Terminals are stored as
+    indices into a `TokenBuffer` and their lexeme is only sliced out of the text when the rule reads it.
+    """
+    __slots__ = ('values', 'terminals', 'lex')
+
+    def __init__(self, values, terminals, lex):
+        self.values = values
+        self.terminals = terminals
+        self.lex = lex
+
+    def __getitem__(self, i):
+        value = self.values[i]
+        return self.lex(value) if i in self.terminals else value
+
+    def __len__(self):
+        return len(self.values)
+
+
 class ShiftReduceParser:
     SHIFT = 'SHIFT'
     REDUCE = 'REDUCE'
@@ -9,34 +33,161 @@ class ShiftReduceParser:
         self.action = {}
         self.goto = {}
         self._build_parsing_table()
+        self.table = LRTable.compile(self.G, self.action, self.goto)
+
+    @classmethod
+    def from_table(cls, G, table):
+        """
+        Builds a parser around already generated tables. The dict tables are left empty.
+        """
+        parser = cls.__new__(cls)
+        parser.G = G
+        parser.verbose = False
+        parser.action = {}
+        parser.goto = {}
+        parser.table = table
+        return parser
 
     def _build_parsing_table(self):
         raise NotImplementedError()
 
+    def _lookahead(self, w):
+        """
+        Yields `(terminal, lex, token)` for every token of `w`, where `terminal` is its terminal number. `w` may be a
+        `TokenBuffer`, then both `lex` and `token` are the index of the token in it and the lexeme is left to
+        `TokenBuffer.lex`, or any iterable of `Token`s, including a generator that is still lexing: tokens are pulled
+        one at a time, as the parser needs its lookahead.
+        """
+        terminal_ids = self.table.terminal_ids
+        unknown = self.table.unknown
+        if isinstance(w, TokenBuffer):
+            ids = [terminal_ids.get(token_type.Name, unknown) for token_type in w.token_types]
+            for i, token_type in enumerate(w.types):
+                yield ids[token_type], i, i
+            return
+
+        ids = {}
+        for token in w:
+            token_type = token.token_type
+            try:
+                terminal = ids[token_type]
+            except KeyError:
+                # token types are terminals, or their names for the generated lexer in tools/cool_lexer.py
+                terminal = ids[token_type] = terminal_ids.get(getattr(token_type, 'Name', token_type), unknown)
+            yield terminal, token.lex, token
+
     def __call__(self, w, get_shift_reduce=False):
+        table = self.table
+        default = table.default
+        action_base = table.action_base
+        action_check = table.action_check
+        action_value = table.action_value
+        goto_base = table.goto_base
+        goto_value = table.goto_value
+        lengths = table.lengths
+        lefts = table.lefts
+        productions = self.G.Productions
+
         stack = [0]
-        cursor = 0
         output = []
         operations = []
+        tokens = self._lookahead(w)
+        terminal, lex, token = next(tokens)
 
         while True:
             state = stack[-1]
-            lookahead = w[cursor]
-            if self.verbose: print(stack, w[cursor:])
-            try:
-                action, tag = self.action[state, lookahead.token_type.Name][0]
-                if action == ShiftReduceParser.SHIFT:
-                    operations.append(self.SHIFT)
-                    stack.append(tag)
-                    cursor += 1
-                elif action == ShiftReduceParser.REDUCE:
-                    operations.append(self.REDUCE)
-                    for _ in range(len(tag.Right)): stack.pop()
-                    stack.append(self.goto[stack[-1], tag.Left.Name][0])
-                    output.append(tag)
-                elif action == ShiftReduceParser.OK:
-                    return output if not get_shift_reduce else (output, operations)
+            if self.verbose: print(stack, lex)
+            index = action_base[state] + terminal
+            action = action_value[index] if action_check[index] == state else default[state]
+
+            if action > 0:
+                operations.append(self.SHIFT)
+                stack.append(action - 1)
+                terminal, lex, token = next(tokens)
+            elif action < ACCEPT:
+                production = decode_reduce(action)
+                operations.append(self.REDUCE)
+                length = lengths[production]
+                if length:
+                    del stack[-length:]
+                stack.append(goto_value[goto_base[stack[-1]] + lefts[production]])
+                output.append(productions[production])
+            elif action == ACCEPT:
+                return output if not get_shift_reduce else (output, operations)
+            else:
+                self._syntax_error(w, token)
+
+    def evaluate(self, w, trace=None):
+        """
+        Parses `w` and evaluates the synthesized attributes of the grammar in the same pass: every reduction calls
+        its production's rule on the values of the popped symbols and pushes the result, so the value left when the
+        input is accepted is returned directly. The reduced productions are appended to `trace` when given.
+        Lexemes of a `TokenBuffer` are only sliced out of the text when a rule reads the value of a terminal.
+        """
+        table = self.table
+        default = table.default
+        action_base = table.action_base
+        action_check = table.action_check
+        action_value = table.action_value
+        goto_base = table.goto_base
+        goto_value = table.goto_value
+        lengths = table.lengths
+        lefts = table.lefts
+        productions = self.G.Productions
+        rules = self._rules()
+        if isinstance(w, TokenBuffer):
+            lexeme = w.lex
+            # body positions, as indexed by the rules, that hold a terminal
+            terminals = [frozenset(i for i, symbol in enumerate(production.Right, 1) if symbol.IsTerminal)
+                         for production in productions]
+        else:
+            terminals = None
+
+        stack = [0]
+        values = [None]
+        tokens = self._lookahead(w)
+        terminal, lex, token = next(tokens)
+
+        while True:
+            state = stack[-1]
+            if self.verbose: print(stack, lex)
+            index = action_base[state] + terminal
+            action = action_value[index] if action_check[index] == state else default[state]
+
+            if action > 0:
+                stack.append(action - 1)
+                values.append(lex)
+                terminal, lex, token = next(tokens)
+            elif action < ACCEPT:
+                production = decode_reduce(action)
+                length = lengths[production]
+                if length:
+                    symbols = [None] + values[-length:]
+                    if terminals is not None and terminals[production]:
+                        symbols = LazySymbols(symbols, terminals[production], lexeme)
+                    value = rules[production](None, symbols)
+                    del stack[-length:]
+                    del values[-length:]
                 else:
-                    assert False, 'Must be something wrong!'
-            except KeyError:
-                raise Exception(f'Aborting parsing: syntax error near token {lookahead.lex} line:{lookahead.row} col:{lookahead.col}')
+                    value = rules[production](None, None)
+                stack.append(goto_value[goto_base[stack[-1]] + lefts[production]])
+                values.append(value)
+                if trace is not None:
+                    trace.append(productions[production])
+            elif action == ACCEPT:
+                return values[-1]
+            else:
+                self._syntax_error(w, token)
+
+    def _rules(self):
+        rules = []
+        for production in self.G.Productions:
+            attributes = production.attributes
+            assert all(rule is None for rule in attributes[1:]), 'There must be only synteticed attributes.'
+            rules.append(attributes[0])
+        return rules
+
+    @staticmethod
+    def _syntax_error(w, token):
+        lookahead = w[token] if isinstance(w, TokenBuffer) else token
+        raise Exception(f'Aborting parsing: syntax error near token {lookahead.lex} line:{lookahead.row} col:{lookahead.col}')
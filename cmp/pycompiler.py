@@ -483,7 +483,7 @@ class Item:
         return (
                 (self.pos == other.pos) and
                 (self.production == other.production) and
-                (set(self.lookaheads) == set(other.lookaheads))
+                (self.lookaheads == other.lookaheads)
         )
 
     def __hash__(self):
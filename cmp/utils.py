@@ -1,3 +1,4 @@
+from array import array
 from cmp.pycompiler import Production, Sentence, Symbol, EOF, Epsilon
 
 
@@ -186,6 +187,72 @@ class UnknownToken(Token):
         return False
 
 
+class TokenBuffer:
+    """
+    Struct-of-arrays token stream.
+
+    Token `i` is described by `types[i]` (index into `token_types`), `starts[i]` and `lengths[i]` (its span in `text`),
+    `rows[i]` and `cols[i]`. No per-token object is kept: lexemes are sliced out of the source text on demand, passed
+    through `formats[token_type]` when the lexeme needs post-processing (e.g. string literals).
+    """
+
+    def __init__(self, text, eof, formats=None):
+        self.text = text
+        self.eof = eof
+        self.formats = {} if formats is None else formats
+        self.token_types = []
+        self.types = array('i')
+        self.starts = array('i')
+        self.lengths = array('i')
+        self.rows = array('i')
+        self.cols = array('i')
+        self._ids = {}
+
+    def type_id(self, token_type):
+        try:
+            return self._ids[token_type]
+        except KeyError:
+            self.token_types.append(token_type)
+            type_id = self._ids[token_type] = len(self.token_types) - 1
+            return type_id
+
+    def append(self, type_id, start, length, row, col):
+        self.types.append(type_id)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.rows.append(row)
+        self.cols.append(col)
+
+    def close(self, row, col):
+        self.append(self.type_id(self.eof), len(self.text), 0, row, col)
+
+    def token_type(self, i):
+        return self.token_types[self.types[i]]
+
+    def lex(self, i):
+        token_type = self.token_types[self.types[i]]
+        if token_type is self.eof:
+            return '$'
+        start = self.starts[i]
+        lex = self.text[start:start + self.lengths[i]]
+        format_lex = self.formats.get(token_type)
+        return lex if format_lex is None else format_lex(lex)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('token index out of range')
+        return Token(self.lex(i), self.token_types[self.types[i]], self.rows[i], self.cols[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
 def tokenizer(G, fixed_tokens):
     def decorate(func):
         def tokenize_text(text):
@@ -214,9 +281,27 @@ def tokenizer(G, fixed_tokens):
 
 
 class DisjointSet:
+    """
+    Union-find over hashable items, with union by rank and path compression. Items can be given up front or added
+    as they show up, by `add` or `union`.
+    """
+
     def __init__(self, *items):
         self.nodes = {x: DisjointNode(x) for x in items}
 
+    def add(self, item) -> 'DisjointNode':
+        try:
+            return self.nodes[item]
+        except KeyError:
+            node = self.nodes[item] = DisjointNode(item)
+            return node
+
+    def find(self, item) -> 'DisjointNode':
+        return self.nodes[item].representative
+
+    def union(self, a, b) -> 'DisjointNode':
+        return self.add(a).merge(self.add(b))
+
     def merge(self, items):
         items = (self.nodes[x] for x in items)
         try:
@@ -240,6 +325,9 @@ class DisjointSet:
     def __getitem__(self, item):
         return self.nodes[item]
 
+    def __contains__(self, item):
+        return item in self.nodes
+
     def __str__(self):
         return str(self.groups)
 
@@ -251,15 +339,32 @@ class DisjointNode:
     def __init__(self, value):
         self.value = value
         self.parent = self
+        self.rank = 0
 
     @property
     def representative(self):
-        if self.parent != self:
-            self.parent = self.parent.representative
-        return self.parent
+        root = self
+        while root.parent is not root:
+            root = root.parent
+        # path compression
+        node = self
+        while node.parent is not root:
+            node.parent, node = root, node.parent
+        return root
 
     def merge(self, other):
-        other.representative.parent = self.representative
+        """
+        Joins the sets of both nodes, hanging the lower ranked root from the other, and returns the new root.
+        """
+        root, other_root = self.representative, other.representative
+        if root is other_root:
+            return root
+        if root.rank < other_root.rank:
+            root, other_root = other_root, root
+        other_root.parent = root
+        if root.rank == other_root.rank:
+            root.rank += 1
+        return root
 
     def __str__(self):
         return str(self.value)
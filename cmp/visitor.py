@@ -42,8 +42,17 @@ def when(param_type):
             dispatcher = dispatcher.dispatcher
         dispatcher.add_target(param_type, fn)
 
+        param_index = dispatcher.param_index
+        cache = dispatcher.cache
+        resolve = dispatcher.resolve
+
         def ff(*args, **kw):
-            return dispatcher(*args, **kw)
+            typ = args[param_index].__class__
+            try:
+                target = cache[typ]
+            except KeyError:
+                target = resolve(typ)
+            return target(*args, **kw)
 
         ff.dispatcher = dispatcher
         return ff
@@ -57,24 +66,33 @@ class Dispatcher(object):
         top_level = frame.f_locals == frame.f_globals
         self.param_index = self.__argspec(fn).args.index(param_name)
         self.param_name = param_name
+        self.default = fn
         self.targets = {}
+        # Most specific target for every concrete class seen so far. `ff` wrappers hold a reference to this dict, so
+        # it is cleared in place instead of being replaced.
+        self.cache = {}
 
     def __call__(self, *args, **kw):
         typ = args[self.param_index].__class__
-        d = self.targets.get(typ)
-        if d is not None:
-            return d(*args, **kw)
-        else:
-            issub = issubclass
-            t = self.targets
-            ks = t.keys()
-            ans = [t[k](*args, **kw) for k in ks if issub(typ, k)]
-            if len(ans) == 1:
-                return ans.pop()
-            return ans
+        try:
+            target = self.cache[typ]
+        except KeyError:
+            target = self.resolve(typ)
+        return target(*args, **kw)
+
+    def resolve(self, typ):
+        """
+        Returns the target registered for the nearest class in `typ`'s MRO, falling back to the function decorated
+        with `on` when there is none, and memoizes the result for `typ`.
+        """
+        targets = self.targets
+        target = next((targets[klass] for klass in typ.__mro__ if klass in targets), self.default)
+        self.cache[typ] = target
+        return target
 
     def add_target(self, typ, target):
         self.targets[typ] = target
+        self.cache.clear()
 
     @staticmethod
     def __argspec(fn):
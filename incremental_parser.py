@@ -0,0 +1,129 @@
+import copy
+from typing import List
+
+from cmp.parsers.shift_reduce_parser import ShiftReduceParser
+from cmp.pycompiler import EOF
+from cmp.utils import Token
+from cool_ast import ClassDeclarationNode, ProgramNode
+from grammar import G, classx
+from re_lexer import CoolLexer, Cursor
+
+
+class Segment:
+    """
+    Source span of a class declaration, from its `class` keyword to its closing `;`, the parsed declaration and
+    whether it holds an AUTO_TYPE annotation.
+    """
+
+    def __init__(self, start: int, end: int, node: ClassDeclarationNode, auto_typed: bool):
+        self.start = start
+        self.end = end
+        self.node = node
+        self.auto_typed = auto_typed
+
+
+class IncrementalParser:
+    """
+    Parses successive versions of a program, re-lexing and re-parsing only the class declarations touched by the
+    edit since the previous call.
+
+    The edited range is the text between the common prefix and the common suffix of both versions. Declarations
+    that end before it are kept, and lexing resumes at the end of the last of them. Declarations that start after it
+    are kept once the lexer reaches a `class` keyword exactly at the (shifted) start of one of them, since from there
+    on the lexer sees the same text as before. Every other declaration is parsed on its own, as a one-class program.
+
+    The returned `ProgramNode` shares its declarations with the next calls. `TypesUpdater` only rewrites the
+    AUTO_TYPE annotations of the tree, so with `inference` the declarations holding one are returned as copies and
+    the others are shared.
+    """
+
+    def __init__(self, lexer: CoolLexer, parser: ShiftReduceParser):
+        self.lexer = lexer
+        self.parser = parser
+        self.text = ''
+        self.segments: List[Segment] = []
+
+    def __call__(self, text: str, inference: bool = False) -> ProgramNode:
+        try:
+            segments = self._reparse(text)
+        except Exception:
+            # the whole program is parsed again so errors are reported as the non-incremental pipeline does: the
+            # parser can stop at a syntax error before the lexer reaches an unknown token further on. The segments of
+            # the last valid version are kept for the next call.
+            return self.parser.evaluate(self.lexer.buffer(text))
+        return ProgramNode([copy.deepcopy(segment.node) if inference and segment.auto_typed else segment.node
+                            for segment in segments])
+
+    def _reparse(self, text: str) -> List[Segment]:
+        old, segments = self.text, self.segments
+        prefix = IncrementalParser._common_prefix(old, text)
+        suffix = IncrementalParser._common_suffix(old[prefix:], text[prefix:])
+        offset = len(text) - len(old)
+
+        head = 0
+        while head < len(segments) and segments[head].end <= prefix:
+            head += 1
+        tail = head
+        while tail < len(segments) and segments[tail].start < len(old) - suffix:
+            tail += 1
+
+        # rows and columns of the tokens only matter for syntax errors, which are reported by a full parse
+        cursor = Cursor()
+        if head:
+            cursor.position = segments[head - 1].end
+
+        parsed = segments[:head]
+        tokens = []
+        start = end = None
+        for token in self.lexer(text, cursor):
+            if token.token_type is classx or isinstance(token.token_type, EOF):
+                if tokens:
+                    auto_typed = any(class_token.lex == 'AUTO_TYPE' for class_token in tokens)
+                    parsed.append(Segment(start, end, self._parse(tokens), auto_typed))
+                    tokens = []
+                if isinstance(token.token_type, EOF):
+                    if not parsed:
+                        self.parser.evaluate([token])
+                    break
+
+                start = cursor.position - len(token.lex)
+                while tail < len(segments) and segments[tail].start + offset < start:
+                    tail += 1
+                if tail < len(segments) and segments[tail].start + offset == start:
+                    parsed.extend(Segment(segment.start + offset, segment.end + offset, segment.node,
+                                          segment.auto_typed) for segment in segments[tail:])
+                    break
+
+            tokens.append(token)
+            end = cursor.position
+
+        self.text, self.segments = text, parsed
+        return parsed
+
+    def _parse(self, tokens: List[Token]) -> ClassDeclarationNode:
+        # tokens outside any class declaration end up in a segment of their own, which fails to parse
+        program = self.parser.evaluate(tokens + [Token('$', G.EOF)])
+        return program.declarations[0]
+
+    @staticmethod
+    def _common_prefix(a: str, b: str) -> int:
+        # binary search over slice comparisons, which run in C
+        low, high = 0, min(len(a), len(b))
+        while low < high:
+            middle = (low + high + 1) // 2
+            if a[:middle] == b[:middle]:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    @staticmethod
+    def _common_suffix(a: str, b: str) -> int:
+        low, high = 0, min(len(a), len(b))
+        while low < high:
+            middle = (low + high + 1) // 2
+            if a[len(a) - middle:] == b[len(b) - middle:]:
+                low = middle
+            else:
+                high = middle - 1
+        return low
@@ -1,7 +1,7 @@
-from typing import List, Optional, Union, Any, Dict
+from typing import List, Optional, Union, Any, Dict, Callable, Tuple
 from cmp import visitor
 import cool_ast
-from semantics import Context, Scope, Attribute, Type, VoidType, Method
+from semantics import Context, Attribute, Type, VoidType, Method, TypeHierarchy, VariablesResolver
 
 
 class CoolRuntimeError(Exception):
@@ -42,14 +42,11 @@ class CoolObject:
         except KeyError:
             return self.type.get_attribute(name)
 
-    def get_method(self, name: str, typex: Type) -> Optional[Method]:
-        tmp_type = self.type
-        while tmp_type != typex:
-            if tmp_type.parent is not None:
-                tmp_type = tmp_type.parent
-            else:
-                return None
-        return tmp_type.get_method(name)
+    def get_method(self, name: str, typex: Type) -> Method:
+        """
+        Method `name` as seen from `typex`, the dynamic type of the object or, in a static dispatch, an ancestor of it.
+        """
+        return typex.get_method(name)
 
 
 class VoidObject(CoolObject):
@@ -105,39 +102,84 @@ def in_int(obj: CoolObject, context: Context) -> CoolObject:
     return CoolObject(context.get_type('Int'), int(input()))
 
 
+BUILTIN_FUNCTIONS = {
+    ('Object', 'abort'): abort,
+    ('Object', 'type_name'): type_name,
+    ('Object', 'copy'): copy,
+    ('IO', 'out_string'): out_string,
+    ('IO', 'out_int'): out_int,
+    ('IO', 'in_string'): in_string,
+    ('IO', 'in_int'): in_int,
+    ('String', 'length'): length,
+    ('String', 'concat'): concat,
+    ('String', 'substr'): substr,
+}
+
+
+def defining_type(typex: Optional[Type], name: str) -> Optional[Type]:
+    if typex is None:
+        return None
+    try:
+        return typex.method_table[name][1]
+    except KeyError:
+        return None
+
+
+def resolve_dispatch(context: Context, name: str, dynamic_type: Type,
+                     static_type: Optional[Type] = None) -> Tuple[Optional[Callable], Type]:
+    """
+    Resolves a call to `name` on an object of `dynamic_type` the same way `Interpreter` does, returning the builtin
+    function that handles it (if any) and the type that defines the method.
+    """
+    if isinstance(dynamic_type, VoidType):
+        raise CoolRuntimeError(f'Dispatch to void in call to method {name}')
+
+    typex = dynamic_type if static_type is None else static_type
+    if typex not in Type.ancestors(dynamic_type):
+        raise CoolRuntimeError(f'Type {dynamic_type.name} does not conform to {typex.name}')
+    owner = defining_type(typex, name)
+    if owner is None:
+        raise CoolRuntimeError(f'Method {name} is not defined in {typex.name}')
+
+    for base in ('Object', 'String', 'IO'):
+        if (base, name) in BUILTIN_FUNCTIONS and dynamic_type.conforms_to(context.get_type(base)):
+            return BUILTIN_FUNCTIONS[base, name], owner
+    return None, owner
+
+
+def new_frame(this: CoolObject, size: int) -> List[Optional[CoolObject]]:
+    """
+    Frame of a method body or attribute initializer resolved by `VariablesResolver`, with `this` bound to `self`.
+    """
+    frame = [None] * size
+    frame[0] = this
+    return frame
+
+
 class Interpreter:
     def __init__(self, context: Context):
         self.context = context
+        self.hierarchy = TypeHierarchy(context)
         self.stack: List[CoolObject] = []
         self.current_object: CoolObject = None
-        self.builtin_functions = {
-            ('Object', 'abort'): abort,
-            ('Object', 'type_name'): type_name,
-            ('Object', 'copy'): copy,
-            ('IO', 'out_string'): out_string,
-            ('IO', 'out_int'): out_int,
-            ('IO', 'in_string'): in_string,
-            ('IO', 'in_int'): in_int,
-            ('String', 'length'): length,
-            ('String', 'concat'): concat,
-            ('String', 'substr'): substr,
-        }
+        self.builtin_functions = BUILTIN_FUNCTIONS
 
     @visitor.on('node')
-    def visit(self, node, scope: Scope):
+    def visit(self, node, frame: List[CoolObject]):
         pass
 
     @visitor.when(cool_ast.ProgramNode)
-    def visit(self, node: cool_ast.ProgramNode, scope: Scope) -> None:
+    def visit(self, node: cool_ast.ProgramNode, frame: List[CoolObject] = None) -> None:
+        VariablesResolver().visit(node)
         for class_decl in node.declarations:
-            self.visit(class_decl, scope)
+            self.visit(class_decl, frame)
 
         self.current_object = CoolObject(self.context.get_type('Main'))
-        scope.define_variable('self', self.current_object.type, self.current_object)
-        self.visit(self.current_object.get_method('main', self.current_object.type).expression, scope)
+        main = self.current_object.get_method('main', self.current_object.type)
+        self.visit(main.expression, new_frame(self.current_object, main.frame_size))
 
     @visitor.when(cool_ast.ClassDeclarationNode)
-    def visit(self, node: cool_ast.ClassDeclarationNode, scope: Scope) -> None:
+    def visit(self, node: cool_ast.ClassDeclarationNode, frame: List[CoolObject]) -> None:
         attributes = [feature for feature in node.features if isinstance(feature, cool_ast.AttrDeclarationNode)]
         methods = [feature for feature in node.features if isinstance(feature, cool_ast.MethodDeclarationNode)]
 
@@ -145,49 +187,48 @@ class Interpreter:
         for attr in attributes:
             type_attr = current_type.get_attribute(attr.id)
             type_attr.expression = attr.expression
+            type_attr.frame_size = attr.frame_size
 
         for method in methods:
             type_method = current_type.get_method(method.id)
             type_method.expression = method.body
+            type_method.frame_size = method.frame_size
 
     @visitor.when(cool_ast.BlocksNode)
-    def visit(self, node: cool_ast.BlocksNode, scope: Scope) -> CoolObject:
+    def visit(self, node: cool_ast.BlocksNode, frame: List[CoolObject]) -> CoolObject:
         cool_object = VoidObject()
         for expr in node.expr_list:
-            cool_object = self.visit(expr, scope)
+            cool_object = self.visit(expr, frame)
         return cool_object
 
     @visitor.when(cool_ast.ConditionalNode)
-    def visit(self, node: cool_ast.ConditionalNode, scope: Scope) -> CoolObject:
-        condition = self.visit(node.condition, scope)
+    def visit(self, node: cool_ast.ConditionalNode, frame: List[CoolObject]) -> CoolObject:
+        condition = self.visit(node.condition, frame)
         if condition.value:
-            return self.visit(node.then_body, scope.create_child())
-        return self.visit(node.else_body, scope.create_child())
+            return self.visit(node.then_body, frame)
+        return self.visit(node.else_body, frame)
 
     @visitor.when(cool_ast.LoopNode)
-    def visit(self, node: cool_ast.LoopNode, scope: Scope) -> VoidObject:
-        child_scope = scope.create_child()
-        while self.visit(node.condition, child_scope).value:
-            self.visit(node.body, child_scope)
+    def visit(self, node: cool_ast.LoopNode, frame: List[CoolObject]) -> VoidObject:
+        while self.visit(node.condition, frame).value:
+            self.visit(node.body, frame)
         return VoidObject()
 
     @visitor.when(cool_ast.LetNode)
-    def visit(self, node: cool_ast.LetNode, scope: Scope) -> CoolObject:
-        child_scope = scope.create_child()
+    def visit(self, node: cool_ast.LetNode, frame: List[CoolObject]) -> CoolObject:
         for var in node.var_decl_list:
             var_type = self.context.get_type(var.typex)
-            var_object = CoolObject(var_type) if var.expr is None else self.visit(var.expr, child_scope)
-            child_scope.define_variable(var.id, var_type, var_object)
-        return self.visit(node.in_expr, child_scope)
+            frame[var.slot] = CoolObject(var_type) if var.expr is None else self.visit(var.expr, frame)
+        return self.visit(node.in_expr, frame)
 
     @visitor.when(cool_ast.CaseNode)
-    def visit(self, node: cool_ast.CaseNode, scope: Scope) -> CoolObject:
-        expr = self.visit(node.case_expr, scope)
+    def visit(self, node: cool_ast.CaseNode, frame: List[CoolObject]) -> CoolObject:
+        expr = self.visit(node.case_expr, frame)
         min = 1e10
         most_suitable_type = 0
         for index, option in enumerate(node.options):
             option_type = self.context.get_type(option.type)
-            types_distance = Type.types_distance(expr.type, option_type)
+            types_distance = self.hierarchy.types_distance(expr.type, option_type)
             if types_distance != -1 and types_distance < min:
                 most_suitable_type = index
                 min = types_distance
@@ -195,97 +236,99 @@ class Interpreter:
         if most_suitable_type == -1:
             raise CoolRuntimeError('Execution error')
 
-        child_scope = scope.create_child()
-        new_var_type = self.context.get_type(node.options[most_suitable_type].type)
-        new_var_name = node.options[most_suitable_type].id
-        child_scope.define_variable(vname=new_var_name, vtype=new_var_type, value=CoolObject(new_var_type))
-        case_object = self.visit(node.options[most_suitable_type].expr, child_scope)
-        return case_object
+        option = node.options[most_suitable_type]
+        frame[option.slot] = expr
+        return self.visit(option.expr, frame)
 
     @visitor.when(cool_ast.MethodCallNode)
-    def visit(self, node: cool_ast.MethodCallNode, scope: Scope) -> CoolObject:
-        expr = self.visit(node.expr, scope) if node.expr is not None else self.current_object
+    def visit(self, node: cool_ast.MethodCallNode, frame: List[CoolObject]) -> CoolObject:
+        expr = self.visit(node.expr, frame) if node.expr is not None else self.current_object
         typex = self.context.get_type(node.type) if node.type is not None else expr.type
+        if node.type is not None and not self.hierarchy.conforms_to(expr.type, typex):
+            raise CoolRuntimeError(f'Type {expr.type.name} does not conform to {typex.name}')
         method = expr.get_method(node.id, typex)
 
-        if expr.type.conforms_to(self.context.get_type('Object')) and ('Object', node.id) in self.builtin_functions:
-            args = [expr] + [self.visit(arg, scope) for arg in node.args] + [self.context]
+        if self.hierarchy.conforms_to(expr.type, self.context.get_type('Object')) and ('Object', node.id) in self.builtin_functions:
+            args = [expr] + [self.visit(arg, frame) for arg in node.args] + [self.context]
             return self.builtin_functions['Object', node.id](*args)
 
-        if expr.type.conforms_to(self.context.get_type('String')) and ('String', node.id) in self.builtin_functions:
-            args = [expr] + [self.visit(arg, scope) for arg in node.args] + [self.context]
+        if self.hierarchy.conforms_to(expr.type, self.context.get_type('String')) and ('String', node.id) in self.builtin_functions:
+            args = [expr] + [self.visit(arg, frame) for arg in node.args] + [self.context]
             return self.builtin_functions['String', node.id](*args)
 
-        if expr.type.conforms_to(self.context.get_type('IO')) and ('IO', node.id) in self.builtin_functions:
-            args = [expr] + [self.visit(arg, scope) for arg in node.args] + [self.context]
+        if self.hierarchy.conforms_to(expr.type, self.context.get_type('IO')) and ('IO', node.id) in self.builtin_functions:
+            args = [expr] + [self.visit(arg, frame) for arg in node.args] + [self.context]
             return self.builtin_functions['IO', node.id](*args)
 
-        new_scope = Scope()
-        new_scope.define_variable('self', expr.type, expr)
-        for param_name, param_type, arg in zip(method.param_names, method.param_types, node.args):
-            new_scope.define_variable(vname=param_name, vtype=param_type, value=self.visit(arg, scope))
+        method_frame = new_frame(expr, method.frame_size)
+        for slot, arg in enumerate(node.args, 1):
+            method_frame[slot] = self.visit(arg, frame)
 
         self.stack.append(self.current_object)
         self.current_object = expr
-        method_return = self.visit(method.expression, new_scope)
+        method_return = self.visit(method.expression, method_frame)
         self.current_object = self.stack.pop()
         return method_return
 
     @visitor.when(cool_ast.MethodDeclarationNode)
-    def visit(self, node: cool_ast.MethodDeclarationNode, scope: Scope) -> CoolObject:
-        return VoidObject() if node.body is None else self.visit(node.body, scope)
+    def visit(self, node: cool_ast.MethodDeclarationNode, frame: List[CoolObject]) -> CoolObject:
+        return VoidObject() if node.body is None else self.visit(node.body, frame)
 
     @visitor.when(cool_ast.VariableNode)
-    def visit(self, node: cool_ast.VariableNode, scope: Scope) -> CoolObject:
-        var = scope.find_variable(node.lex)
-        if var is None:
-            objectx = self.current_object.get_attribute(node.lex)
-            if isinstance(objectx, Attribute):
-                new_scope = Scope()
-                new_scope.define_variable('self', self.current_object.type, self.current_object)
-                objectx = self.visit(objectx.expression, new_scope)
-                self.current_object.set_attribute(node.lex, objectx)
-            return objectx
-        return var.value
+    def visit(self, node: cool_ast.VariableNode, frame: List[CoolObject]) -> CoolObject:
+        if node.slot is not None:
+            return frame[node.slot]
+        objectx = self.current_object.get_attribute(node.lex)
+        if isinstance(objectx, Attribute):
+            if objectx.expression is None:
+                # the default value, as the closure compiler and the VM give it
+                objectx = CoolObject(objectx.type)
+            else:
+                objectx = self.visit(objectx.expression, new_frame(self.current_object, objectx.frame_size))
+            self.current_object.set_attribute(node.lex, objectx)
+        return objectx
 
     @visitor.when(cool_ast.AssignNode)
-    def visit(self, node: cool_ast.AssignNode, scope: Scope) -> CoolObject:
-        expr = self.visit(node.expr, scope)
-        var = scope.find_variable(node.id)
-        if var is not None:
-            var.value = expr
+    def visit(self, node: cool_ast.AssignNode, frame: List[CoolObject]) -> CoolObject:
+        expr = self.visit(node.expr, frame)
+        if node.slot is not None:
+            frame[node.slot] = expr
         else:
             self.current_object.set_attribute(node.id, expr)
         return expr
 
     @visitor.when(cool_ast.NotNode)
-    def visit(self, node: cool_ast.NotNode, scope: Scope) -> CoolObject:
-        return CoolObject(self.context.get_type('Bool'), not self.visit(node.expr, scope))
+    def visit(self, node: cool_ast.NotNode, frame: List[CoolObject]) -> CoolObject:
+        return CoolObject(self.context.get_type('Bool'), not self.visit(node.expr, frame).value)
+
+    @visitor.when(cool_ast.ComplementNode)
+    def visit(self, node: cool_ast.ComplementNode, frame: List[CoolObject]) -> CoolObject:
+        return CoolObject(self.context.get_type('Int'), -self.visit(node.expr, frame).value)
 
     @visitor.when(cool_ast.IsVoidNode)
-    def visit(self, node: cool_ast.IsVoidNode, scope: Scope) -> CoolObject:
-        return CoolObject(self.context.get_type('Bool'), isinstance(self.visit(node.expr, scope), VoidObject))
+    def visit(self, node: cool_ast.IsVoidNode, frame: List[CoolObject]) -> CoolObject:
+        return CoolObject(self.context.get_type('Bool'), isinstance(self.visit(node.expr, frame), VoidObject))
 
     @visitor.when(cool_ast.ConstantNumNode)
-    def visit(self, node: cool_ast.ConstantNumNode, scope: Scope) -> CoolObject:
+    def visit(self, node: cool_ast.ConstantNumNode, frame: List[CoolObject]) -> CoolObject:
         return CoolObject(self.context.get_type('Int'), int(node.lex))
 
     @visitor.when(cool_ast.InstantiateNode)
-    def visit(self, node: cool_ast.InstantiateNode, scope: Scope) -> CoolObject:
+    def visit(self, node: cool_ast.InstantiateNode, frame: List[CoolObject]) -> CoolObject:
         return CoolObject(self.context.get_type(node.lex))
 
     @visitor.when(cool_ast.BooleanNode)
-    def visit(self, node: cool_ast.BooleanNode, scope: Scope) -> CoolObject:
+    def visit(self, node: cool_ast.BooleanNode, frame: List[CoolObject]) -> CoolObject:
         return CoolObject(self.context.get_type('Bool'), node.lex == 'true')
 
     @visitor.when(cool_ast.StringNode)
-    def visit(self, node: cool_ast.StringNode, scope: Scope) -> CoolObject:
+    def visit(self, node: cool_ast.StringNode, frame: List[CoolObject]) -> CoolObject:
         return CoolObject(self.context.get_type('String'), node.lex)
 
     @visitor.when(cool_ast.BinaryNode)
-    def visit(self, node: cool_ast.BinaryNode, scope: Scope) -> CoolObject:
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+    def visit(self, node: cool_ast.BinaryNode, frame: List[CoolObject]) -> CoolObject:
+        left = self.visit(node.left, frame)
+        right = self.visit(node.right, frame)
         return self.operate(node, left.value, right.value)
 
     @visitor.on('node')
@@ -1,17 +1,40 @@
+import codecs
 import re
-from typing import Dict, Generator, Tuple, Pattern, Any
+from typing import Dict, Generator, Tuple, Pattern, Any, Iterator, Optional
 from grammar import *
-from cmp.utils import Token
+from cmp.utils import Token, TokenBuffer
+
+
+class Cursor:
+    """
+    Tokenization state of a single call: offset of the next character in the input and the row/column of the next
+    token. Lexers keep only immutable tables, so one instance can tokenize any number of programs concurrently.
+    """
+
+    def __init__(self):
+        self.position = 0
+        self.row = 0
+        self.column = 0
 
 
 class ReLexer:
-    def __init__(self, regex: List[Tuple[Any, str, str]], eof):
+    CHUNK_SIZE = 1 << 16
+
+    # (opener, closer) pairs of tokens that can grow past a chunk boundary without the regex noticing it: while the
+    # closer of a pending opener is not buffered yet a shorter alternative (e.g. '(' for '(*') could match instead.
+    delimiters: List[Tuple[str, str]] = []
+
+    def __init__(self, regex: List[Tuple[Any, str, str]], eof, keywords: Optional[Dict[str, Any]] = None,
+                 identifier: Optional[str] = None):
+        """
+        `regex` holds (token type, group name, pattern) triples tried in order. Lexemes matched by the `identifier`
+        group are looked up in `keywords` (lexeme -> token type), so reserved words need no pattern of their own.
+        """
         self.patterns: Pattern = ReLexer._build_regex(regex)
         self.token_types: Dict[Any, str] = ReLexer._get_token_types(regex)
-        self.position = 0
+        self.keywords: Dict[str, Any] = {} if keywords is None else dict(keywords)
+        self.identifier = identifier
         self.EOF = eof
-        self.row = 0
-        self.column = 0
 
     @staticmethod
     def _build_regex(regex: List[Tuple[Any, str, str]]) -> Pattern:
@@ -24,41 +47,117 @@ class ReLexer:
             token_type[name] = terminal
         return token_type
 
-    def __call__(self, text: str) -> Generator[Token, None, None]:
-        while self.position < len(text):
-            match = self.patterns.match(text, pos=self.position)
+    def __call__(self, text: str, cursor: Optional[Cursor] = None) -> Generator[Token, None, None]:
+        cursor = Cursor() if cursor is None else cursor
+        while cursor.position < len(text):
+            match = self.patterns.match(text, pos=cursor.position)
             if match is None:
-                raise Exception(f'Unknown token in row:{self.row} col:{self.column}')
+                raise Exception(f'Unknown token in row:{cursor.row} col:{cursor.column}')
 
-            lex = match.group()
-            token_type = self.token_types[match.lastgroup]
-            yield Token(lex, token_type)
-            self.position = match.end()
+            cursor.position = match.end()
+            yield self._token(match)
+
+        yield Token('$', self.EOF)
+
+    def stream(self, source, chunk_size: int = CHUNK_SIZE,
+               cursor: Optional[Cursor] = None) -> Generator[Token, None, None]:
+        """
+        Tokenizes `source` lazily, reading it `chunk_size` characters at a time.
+
+        `source` is anything with a `read(size)` method returning `str` or `bytes`: text or binary file objects and
+        `mmap.mmap` objects. Only the unconsumed tail of the input is buffered, so memory is bounded by the chunk size
+        plus the longest token.
+        """
+        cursor = Cursor() if cursor is None else cursor
+        chunks = ReLexer._read_chunks(source, chunk_size)
+        buffer = ''
+        position = 0
+        exhausted = False
+        while True:
+            match = None
+            if position < len(buffer):
+                match = self.patterns.match(buffer, pos=position)
+            if not exhausted and self._needs_input(buffer, position, match):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                continue
+
+            if position == len(buffer):
+                break
+            if match is None:
+                raise Exception(f'Unknown token in row:{cursor.row} col:{cursor.column}')
+
+            cursor.position += match.end() - position
+            position = match.end()
+            yield self._token(match)
 
         yield Token('$', self.EOF)
 
+    def _token(self, match: re.Match) -> Token:
+        lex = match.group()
+        group = match.lastgroup
+        if group == self.identifier:
+            return Token(lex, self.keywords.get(lex, self.token_types[group]))
+        return Token(lex, self.token_types[group])
+
+    def _needs_input(self, buffer: str, position: int, match: Optional[re.Match]) -> bool:
+        if match is None or match.end() == len(buffer):
+            return True
+        for opener, closer in self.delimiters:
+            if buffer.startswith(opener, position) and buffer.find(closer, position + len(opener)) < 0:
+                return True
+        return False
+
+    @staticmethod
+    def _read_chunks(source, chunk_size: int) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while True:
+            chunk = source.read(chunk_size)
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk, final=not chunk)
+            if chunk:
+                yield chunk
+            elif not decoder.getstate()[0]:
+                return
+
 
 class CoolLexer(ReLexer):
+    delimiters = [('(*', '*)'), ('--', '\n'), ('"', '"')]
+
+    SKIPPED = ('tabulation', 'whitespace', 'newline', 'comment')
+
+    KEYWORDS = {
+        'class': classx,
+        'inherits': inherits,
+        'let': let,
+        'if': ifx,
+        'then': thenx,
+        'else': elsex,
+        'fi': fi,
+        'while': whilex,
+        'loop': loop,
+        'pool': pool,
+        'case': case,
+        'of': of,
+        'esac': esac,
+        'new': new,
+        'isvoid': isvoid,
+        'in': inx,
+        'not': notx,
+        'true': true,
+        'false': false,
+    }
+
     def __init__(self):
         super().__init__(
             [
-                (classx, 'class', r'class(?=\s)'),
-                (inherits, 'inherits', r'inherits(?=\s)'),
-                (let, 'let', r'let(?=\s)'),
+                (idx, 'identifier', r'[a-zA-Z][a-zA-Z0-9_]*'),
                 (assigment, 'assigment', r'<-'),
-                (ifx, 'if', r'if(?=\s)'),
-                (thenx, 'then', r'then(?=\s)'),
-                (elsex, 'else', r'else(?=\s)'),
-                (fi, 'fi', r'fi'),
-                (whilex, 'while', r'while(?=\s)'),
-                (loop, 'loop', r'loop(?=\s)'),
-                (pool, 'pool', r'pool'),
-                (case, 'case', r'case(?=\s)'),
-                (of, 'of', r'of(?=\s)'),
-                (esac, 'esac', r'esac(?=\s)'),
                 (case_assigment, 'case_assigment', r'=>'),
-                (new, 'new', r'new(?=\s)'),
-                (isvoid, 'isvoid', r'isvoid(?=\s)'),
                 (equal, 'equal', r'='),
                 (less_equal, 'less_equal', r'<='),
                 (less, 'less', r'<'),
@@ -72,13 +171,8 @@ class CoolLexer(ReLexer):
                 (cpar, 'cpar', r'\)'),
                 (ocur, 'ocur', r'{'),
                 (ccur, 'ccur', r'}'),
-                (inx, 'in', r'in(?=\s)'),
-                (notx, 'not', r'not(?=\s)'),
                 (at, 'at', r'@'),
-                (true, 'true', r'true'),
-                (false, 'false', r'false'),
                 (intx, 'integer', r'[\d][\d]*'),
-                (idx, 'identifier', r'[a-zA-Z][a-zA-Z0-9_]*'),
                 (string, 'string', r'\"[^\"]*\"'),
                 ('whitespace', 'whitespace', r' +'),
                 ('newline', 'newline', r'\n'),
@@ -87,41 +181,81 @@ class CoolLexer(ReLexer):
                 (opar, 'opar', r'\('),
                 (minus, 'minus', r'-'),
                 (complement, 'complement', r'~')
-            ], G.EOF
+            ], G.EOF, CoolLexer.KEYWORDS, 'identifier'
         )
 
-    def __call__(self, text: str) -> Generator[Token, None, None]:
-        tokens: Generator[Token, None, None] = super().__call__(text)
+    def __call__(self, text: str, cursor: Optional[Cursor] = None) -> Generator[Token, None, None]:
+        cursor = Cursor() if cursor is None else cursor
+        return self._locate(super().__call__(text, cursor), cursor)
+
+    def stream(self, source, chunk_size: int = ReLexer.CHUNK_SIZE,
+               cursor: Optional[Cursor] = None) -> Generator[Token, None, None]:
+        cursor = Cursor() if cursor is None else cursor
+        return self._locate(super().stream(source, chunk_size, cursor), cursor)
+
+    def buffer(self, text: str) -> TokenBuffer:
+        """
+        Tokenizes `text` into a `TokenBuffer`, without creating a `Token` per lexeme. Whitespace and comments only
+        move the cursor.
+        """
+        tokens = TokenBuffer(text, self.EOF, {string: CoolLexer.format_str})
+        cursor = Cursor()
+        patterns = self.patterns
+        length = len(text)
+        while cursor.position < length:
+            match = patterns.match(text, pos=cursor.position)
+            if match is None:
+                raise Exception(f'Unknown token in row:{cursor.row} col:{cursor.column}')
+
+            group = match.lastgroup
+            lex = match.group()
+            token_type = self.token_types[group]
+            if group == self.identifier:
+                token_type = self.keywords.get(lex, token_type)
+            if token_type not in CoolLexer.SKIPPED:
+                tokens.append(tokens.type_id(token_type), cursor.position, len(lex), cursor.row, cursor.column)
+                if token_type is string:
+                    lex = CoolLexer.format_str(lex)
+            CoolLexer._advance(cursor, token_type, lex)
+            cursor.position = match.end()
+
+        tokens.close(cursor.row, cursor.column)
+        return tokens
+
+    @staticmethod
+    def _locate(tokens: Iterator[Token], cursor: Cursor) -> Generator[Token, None, None]:
         for token in tokens:
-            token.row, token.col = self.row, self.column
-            if token.token_type not in ('tabulation', 'whitespace', 'newline', 'comment'):
+            token.row, token.col = cursor.row, cursor.column
+            if token.token_type not in CoolLexer.SKIPPED:
                 if token.token_type.Name == string.Name:
                     token.lex = CoolLexer.format_str(token.lex)
                 yield token
+            CoolLexer._advance(cursor, token.token_type, token.lex)
 
-            if token.token_type == 'tabulation':
-                self.column += 4
-            elif token.token_type == 'whitespace':
-                self.column += len(token.lex)
-            elif token.token_type == 'newline':
-                self.column = 0
-                self.row += 1
-            elif str(token.token_type) == string.Name or token.token_type == 'comment':
-                new_lines = max(token.lex.count('\n') - token.lex.count('\\n'), 0)
-                self.row += new_lines
-                print(token.lex)
-                if new_lines == 0:
-                    self.column += len(token.lex)
-                else:
-                    index = token.lex.rfind('\n')
-                    self.column += len(token.lex[index:]) + 1
+    @staticmethod
+    def _advance(cursor: Cursor, token_type, lex: str) -> None:
+        if token_type == 'tabulation':
+            cursor.column += 4
+        elif token_type == 'whitespace':
+            cursor.column += len(lex)
+        elif token_type == 'newline':
+            cursor.column = 0
+            cursor.row += 1
+        elif str(token_type) == string.Name or token_type == 'comment':
+            new_lines = max(lex.count('\n') - lex.count('\\n'), 0)
+            cursor.row += new_lines
+            if new_lines == 0:
+                cursor.column += len(lex)
             else:
-                new_lines = token.lex.count('\n')
-                if new_lines != 0:
-                    self.row += new_lines
-                    self.column = 0
-                else:
-                    self.column += len(token.lex)
+                index = lex.rfind('\n')
+                cursor.column += len(lex[index:]) + 1
+        else:
+            new_lines = lex.count('\n')
+            if new_lines != 0:
+                cursor.row += new_lines
+                cursor.column = 0
+            else:
+                cursor.column += len(lex)
 
     @staticmethod
     def format_str(string_lex: str) -> str:
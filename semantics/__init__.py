@@ -5,3 +5,5 @@ from semantics.types_checker import *
 from semantics.types_inferencer import *
 from semantics.types_updater import *
 from semantics.utils import *
+from semantics.variables_resolver import *
+from semantics.pass_manager import *
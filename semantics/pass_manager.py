@@ -0,0 +1,132 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from semantics.types_builder import TypeBuilder
+from semantics.types_checker import TypeChecker
+from semantics.types_collector import TypeCollector
+from semantics.types_inferencer import TypeInferencer
+from semantics.types_updater import ContextUpdater, TypesUpdater
+from semantics.utils import Scope
+
+
+class Pass:
+    """
+    Step of a `PassManager` pipeline. `run` receives the state entries named in `inputs`, in order, and returns the
+    entries named in `outputs`: a single value when there is one output, a tuple when there are more.
+    """
+
+    def __init__(self, name: str, inputs: Sequence[str], outputs: Sequence[str], run: Callable[..., Any]):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.run = run
+
+    def __repr__(self):
+        return f'<pass {self.name}: ({", ".join(self.inputs)}) -> ({", ".join(self.outputs)})>'
+
+
+class PassManager:
+    """
+    Runs a sequence of passes over a shared state, a dict from names to values, and records how long each one took.
+    Every input of a pass must be an initial entry of the state or the output of an earlier pass, which is checked
+    when the manager is built.
+    """
+
+    def __init__(self, passes: Sequence[Pass], inputs: Sequence[str]):
+        available = set(inputs)
+        for p in passes:
+            missing = [name for name in p.inputs if name not in available]
+            if missing:
+                raise ValueError(f'Pass {p.name} needs {", ".join(missing)}, which no earlier pass produces')
+            available.update(p.outputs)
+
+        self.passes = list(passes)
+        self.inputs = tuple(inputs)
+        self.timings: List[Tuple[str, float]] = []
+
+    def run(self, on_pass: Optional[Callable[[Pass, Dict[str, Any]], None]] = None, **state) -> Dict[str, Any]:
+        """
+        Runs every pass over the initial entries given as keyword arguments and returns the final state. `on_pass`
+        is called with each pass and the state right after the pass runs.
+        """
+        missing = [name for name in self.inputs if name not in state]
+        if missing:
+            raise ValueError(f'Missing pipeline inputs: {", ".join(missing)}')
+
+        self.timings = []
+        for p in self.passes:
+            start = time.perf_counter()
+            result = p.run(*[state[name] for name in p.inputs])
+            self.timings.append((p.name, time.perf_counter() - start))
+
+            if len(p.outputs) == 1:
+                state[p.outputs[0]] = result
+            elif p.outputs:
+                state.update(zip(p.outputs, result))
+            if on_pass is not None:
+                on_pass(p, state)
+        return state
+
+    def report(self) -> str:
+        """
+        Time taken by each pass of the last run, in milliseconds.
+        """
+        width = max((len(name) for name, _ in self.timings), default=0)
+        lines = [f'{name:<{width}}  {seconds * 1000:8.2f} ms' for name, seconds in self.timings]
+        lines.append(f'{"total":<{width}}  {sum(seconds for _, seconds in self.timings) * 1000:8.2f} ms')
+        return '\n'.join(lines)
+
+
+def _collect(ast, context, errors):
+    TypeCollector(context, errors).visit(ast)
+
+
+def _build(ast, context, errors):
+    TypeBuilder(context, errors).visit(ast)
+
+
+def _infer(ast, context, errors):
+    scope = Scope()
+    inferencer = TypeInferencer(context, scope, errors)
+    inferencer.visit(ast, scope)
+    return inferencer.scope, inferencer.functions, inferencer.attributes, inferencer.substitutions
+
+
+def _update_types(ast, context, scope, functions, attributes, substitutions, errors):
+    TypesUpdater(context, scope, functions, attributes, substitutions, errors).visit(ast, scope, 0)
+
+
+def _update_context(ast, context, errors):
+    ContextUpdater(context, errors).visit(ast)
+
+
+def _forbid_auto_type(context):
+    # without inference AUTO_TYPE is not a type, so its uses are reported by the checker
+    context.types.pop('AUTO_TYPE')
+
+
+def _check(ast, context, errors):
+    TypeChecker(context, errors).visit(ast)
+
+
+def semantic_pipeline(inference: bool = True) -> PassManager:
+    """
+    Pipeline that checks a parsed program, from the state entries `ast`, `context` (an empty `Context`) and `errors`
+    (a list the passes append their errors to). With `inference`, the AUTO_TYPE annotations of the tree and the
+    context are replaced by the inferred types before checking.
+    """
+    passes = [
+        Pass('collect', ('ast', 'context', 'errors'), (), _collect),
+        Pass('build', ('ast', 'context', 'errors'), (), _build),
+    ]
+    if inference:
+        passes += [
+            Pass('infer', ('ast', 'context', 'errors'), ('scope', 'functions', 'attributes', 'substitutions'), _infer),
+            Pass('update types', ('ast', 'context', 'scope', 'functions', 'attributes', 'substitutions', 'errors'), (),
+                 _update_types),
+            Pass('update context', ('ast', 'context', 'errors'), (), _update_context),
+        ]
+    else:
+        passes.append(Pass('forbid AUTO_TYPE', ('context',), (), _forbid_auto_type))
+    passes.append(Pass('check', ('ast', 'context', 'errors'), (), _check))
+    return PassManager(passes, ('ast', 'context', 'errors'))
@@ -1,7 +1,8 @@
 from typing import List
 import cool_ast
 from cmp import visitor
-from semantics.utils import Context, Type, Method, ErrorType, Attribute, Scope, VariableInfo, SemanticError, SelfType
+from semantics.utils import Context, Type, Method, ErrorType, Attribute, Scope, VariableInfo, SemanticError, SelfType, \
+    TypeHierarchy
 from semantics.errors import *
 
 
@@ -10,6 +11,7 @@ class TypeChecker:
         if errors is None:
             errors = []
         self.context = context
+        self.hierarchy = TypeHierarchy(context)
         self.current_type = None
         self.current_method = None
         self.errors = errors
@@ -39,7 +41,7 @@ class TypeChecker:
         att_type: Type = self.context.get_type(node.typex)  # if node.typex != 'SELF_TYPE' else self.current_type
         if node.expression is not None:
             expr_type: Type = self.visit(node.expression, scope)
-            if not expr_type.conforms_to(att_type):
+            if not self.hierarchy.conforms_to(expr_type, att_type):
                 self.errors.append(INCOMPATIBLE_TYPES % (expr_type.name, att_type.name))
 
     @visitor.when(cool_ast.MethodDeclarationNode)
@@ -72,7 +74,7 @@ class TypeChecker:
         if node.body is not None:
             expr_type = self.visit(node.body, child_scope)
         if self.current_method.return_type != self.context.get_type('Void') \
-                and not expr_type.conforms_to(return_type):
+                and not self.hierarchy.conforms_to(expr_type, return_type):
             self.errors.append(INCOMPATIBLE_TYPES % (expr_type.name, self.current_method.return_type.name))
 
     @visitor.when(cool_ast.VarDeclarationNode)
@@ -85,7 +87,7 @@ class TypeChecker:
             scope.define_variable(node.id, var_type)
 
         expr_type: Type = self.visit(node.expr, scope)
-        if not expr_type.conforms_to(var_type):
+        if not self.hierarchy.conforms_to(expr_type, var_type):
             self.errors.append(INCOMPATIBLE_TYPES % (expr_type.name, var_type.name))
 
     @visitor.when(cool_ast.AssignNode)
@@ -102,7 +104,7 @@ class TypeChecker:
             except SemanticError:
                 self.errors.append(VARIABLE_NOT_DEFINED % (node.id, self.current_method.name))
                 var_type = ErrorType()
-        if not expr_type.conforms_to(var_type):
+        if not self.hierarchy.conforms_to(expr_type, var_type):
             self.errors.append(INCOMPATIBLE_TYPES % (expr_type.name, var_type.name))
         return var_type
 
@@ -115,7 +117,7 @@ class TypeChecker:
                 node_type = self.context.get_type(node.type)
                 if node_type.name == 'SELF_TYPE':
                     node_type = object_type
-                if object_type.conforms_to(node_type):
+                if self.hierarchy.conforms_to(object_type, node_type):
                     object_type = node_type
                 else:
                     self.errors.append(f'Invalid method call')
@@ -135,7 +137,7 @@ class TypeChecker:
             for arg in node.args:
                 arg_types.append(self.visit(arg, scope.create_child()))
             for arg_type, typex in zip(arg_types, method.param_types):
-                if not arg_type.conforms_to(typex):
+                if not self.hierarchy.conforms_to(arg_type, typex):
                     self.errors.append(f'Incorrect argument type in method {self.current_type.name}.{node.id}:'
                                        + INCOMPATIBLE_TYPES % (arg_type.name, typex.name))
         except SemanticError:
@@ -153,7 +155,7 @@ class TypeChecker:
         then_type: Type = self.visit(node.then_body, scope.create_child())
         else_type: Type = self.visit(node.else_body, scope.create_child())
 
-        return Type.join_types(then_type, else_type)
+        return self.hierarchy.join_types(then_type, else_type)
 
     @visitor.when(cool_ast.LoopNode)
     def visit(self, node: cool_ast.LoopNode, scope: Scope):
@@ -176,7 +178,7 @@ class TypeChecker:
             child_scope.define_variable(var.id, var_type)
             if var.expr is not None:
                 var_expr_type: Type = self.visit(var.expr, child_scope)
-                if not var_expr_type.conforms_to(var_type):
+                if not self.hierarchy.conforms_to(var_expr_type, var_type):
                     self.errors.append(INCOMPATIBLE_TYPES % (var_expr_type.name, var_type.name))
 
         return_type: Type = self.context.get_type('Void')
@@ -200,7 +202,7 @@ class TypeChecker:
             typex: Type = self.visit(option.expr, child_scope)
             case_types.append(typex)
 
-        return Type.join_types(*case_types)
+        return self.hierarchy.join_types(*case_types)
 
     @visitor.when(cool_ast.BlocksNode)
     def visit(self, node: cool_ast.BlocksNode, scope: Scope):
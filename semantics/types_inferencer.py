@@ -1,23 +1,19 @@
-from typing import Dict, List, Set
-from collections import OrderedDict
+from typing import List
 import cool_ast
 from cmp import visitor
 from semantics.errors import INFERENCE_ERROR
 from semantics.utils import Context, Type, TypeVariable, FunctionType, Method, ErrorType, \
-    Scope, SemanticError, AttrMap, MethodMap
-import typing
-
-TypeGraph = typing.OrderedDict[Type, Set[Type]]
+    Scope, SemanticError, AttrMap, MethodMap, TypeHierarchy, Substitutions
 
 
 class TypeInferencer:
     def __init__(self, context: Context, scope: Scope, errors: List[str]):
         self.errors = errors
         self.context = context
+        self.hierarchy = TypeHierarchy(context)
         self.scope = scope
 
-        self.substitutions: Dict[str, Type] = {}
-        self.types_graph: TypeGraph = OrderedDict()
+        self.substitutions = Substitutions()
 
         self.functions: MethodMap = MethodMap(context)
         self.attributes: AttrMap = AttrMap(context)
@@ -68,20 +64,12 @@ class TypeInferencer:
         bool_type = self.context.get_type('Bool')
         cond_type = self.visit(node.condition, scope)
         self.unify(bool_type, cond_type)
-        then_type = self.visit(node.then_body, scope.create_child())
-        else_type = self.visit(node.else_body, scope.create_child())
-        try:
-            then_type = self.substitutions[then_type]
-        except KeyError:
-            pass
-        try:
-            else_type = self.substitutions[else_type]
-        except KeyError:
-            pass
+        then_type = self.resolve(self.visit(node.then_body, scope.create_child()))
+        else_type = self.resolve(self.visit(node.else_body, scope.create_child()))
         if isinstance(then_type, TypeVariable) or isinstance(else_type, TypeVariable):
             return TypeVariable()
 
-        return Type.join_types(then_type, else_type)
+        return self.hierarchy.join_types(then_type, else_type)
 
     @visitor.when(cool_ast.CaseNode)
     def visit(self, node: cool_ast.CaseNode, scope: Scope) -> Type:
@@ -90,31 +78,19 @@ class TypeInferencer:
         for option in node.options:
             child_scope = scope.create_child()
             child_scope.define_variable(option.id, self.context.get_type(option.type))
-            option_type = self.visit(option.expr, child_scope)
-            if isinstance(option_type, TypeVariable):
-                try:
-                    option_type = self.substitutions[option_type.name]
-                except KeyError:
-                    pass
-            types.append(option_type)
+            types.append(self.resolve(self.visit(option.expr, child_scope)))
 
         if any(isinstance(typex, TypeVariable) for typex in types):
             return TypeVariable()
 
-        return Type.join_types(*types)
+        return self.hierarchy.join_types(*types)
 
     @visitor.when(cool_ast.LetNode)
     def visit(self, node: cool_ast.LetNode, scope: Scope):
         child_scope = scope.create_child()
         for var in node.var_decl_list:
             var_type = self.visit(var, child_scope)
-        body_type = self.visit(node.in_expr, child_scope)
-        if isinstance(body_type, TypeVariable):
-            try:
-                return self.substitutions[body_type.name]
-            except KeyError:
-                pass
-        return body_type
+        return self.resolve(self.visit(node.in_expr, child_scope))
 
     @visitor.when(cool_ast.AssignNode)
     def visit(self, node: cool_ast.AssignNode, scope: Scope) -> Type:
@@ -132,13 +108,7 @@ class TypeInferencer:
         expr_type = self.context.get_type('Void')
         for expr in node.expr_list:
             expr_type = self.visit(expr, child_scope)
-
-        if isinstance(expr_type, TypeVariable):
-            try:
-                expr_type = self.substitutions[expr_type.name]
-            except KeyError:
-                pass
-        return expr_type
+        return self.resolve(expr_type)
 
     @visitor.when(cool_ast.MethodCallNode)
     def visit(self, node: cool_ast.MethodCallNode, scope: Scope) -> Type:
@@ -153,11 +123,9 @@ class TypeInferencer:
             typex = self.context.get_type(node.type)
 
         # checks if the type is known
+        typex = self.resolve(typex)
         if isinstance(typex, TypeVariable):
-            try:
-                typex = self.substitutions[typex.name]
-            except KeyError:
-                return typex
+            return typex
 
         function = self.functions.get_function(typex, node.id)
         args_type: List[Type] = []
@@ -165,12 +133,7 @@ class TypeInferencer:
             arg = self.visit(arg, scope)
             args_type.append(arg)
         return_type = self.unify(function, FunctionType(tuple(args_type), function.return_type))
-        if isinstance(return_type, TypeVariable):
-            try:
-                return_type = self.substitutions[return_type.name]
-            except KeyError:
-                pass
-        return return_type
+        return self.resolve(return_type)
 
     @visitor.when(cool_ast.LoopNode)
     def visit(self, node: cool_ast.LoopNode, scope: Scope) -> Type:
@@ -188,14 +151,7 @@ class TypeInferencer:
             expr_type = self.visit(node.expr, scope)
             var_type = self.unify(var_type, expr_type)
             scope.define_variable(node.id, var_type)
-
-        if isinstance(var_type, TypeVariable):
-            try:
-                var_type = self.substitutions[var_type.name]
-            except KeyError:
-                pass
-
-        return var_type
+        return self.resolve(var_type)
 
     @visitor.when(cool_ast.ComparerNode)
     def visit(self, node: cool_ast.ComparerNode, scope: Scope) -> Type:
@@ -223,10 +179,7 @@ class TypeInferencer:
             return var_info.type
         var_type = self.attributes.get_attribute(self.current_type, node.lex)
         if isinstance(var_type, TypeVariable):
-            try:
-                return self.substitutions[var_type.name]
-            except KeyError:
-                return var_type
+            return self.resolve(var_type)
         if var_type is None:
             return ErrorType()
         return var_type
@@ -265,20 +218,18 @@ class TypeInferencer:
     def visit(self, node: cool_ast.InstantiateNode, scope: Scope) -> Type:
         return self.context.get_type(node.lex)
 
-    def var_bind(self, a, b):
-        try:
-            self.types_graph[a].add(b)
-        except KeyError:
-            self.types_graph[a] = {b}
-
-        try:
-            self.types_graph[b].add(a)
-        except KeyError:
-            self.types_graph[b] = {a}
+    def resolve(self, typex: Type) -> Type:
+        """
+        Concrete type bound to `typex` if it is a type variable whose class has one, `typex` otherwise.
+        """
+        if isinstance(typex, TypeVariable):
+            try:
+                return self.substitutions[typex.name]
+            except KeyError:
+                pass
+        return typex
 
     def unify(self, type1: Type, type2: Type):
-        if isinstance(type1, TypeVariable) or isinstance(type2, TypeVariable):
-            self.var_bind(type1, type2)
         if isinstance(type1, FunctionType) and isinstance(type2, FunctionType) \
                 and len(type1.params_types) == len(type2.params_types):
             for i, j in zip(type1.params_types, type2.params_types):
@@ -286,15 +237,15 @@ class TypeInferencer:
             return self.unify(type1.return_type, type2.return_type)
 
         if isinstance(type1, TypeVariable) and not isinstance(type2, TypeVariable):
-            self.substitutions[type1.name] = type2
+            self.substitutions.bind(type1, type2)
             return type2
 
         if isinstance(type2, TypeVariable) and not isinstance(type1, TypeVariable):
-            self.substitutions[type2.name] = type1
+            self.substitutions.bind(type2, type1)
             return type1
 
         if not isinstance(type2, TypeVariable) and not isinstance(type1, TypeVariable):
             return type1
 
-        if isinstance(type2, TypeVariable) and isinstance(type1, TypeVariable):
-            return type1
+        self.substitutions.union(type1, type2)
+        return type1
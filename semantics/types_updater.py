@@ -1,6 +1,6 @@
-from typing import Dict, List
+from typing import List
 
-from semantics.utils import Context, Scope, Type, TypeVariable
+from semantics.utils import Context, Scope, Type, TypeVariable, Substitutions, SemanticError, ErrorType
 from cmp import visitor
 import cool_ast
 
@@ -11,7 +11,7 @@ class TypesUpdater:
                  scope: Scope,
                  functions,
                  attributes,
-                 subst: Dict[str, Type],
+                 subst: Substitutions,
                  errors: List[str]):
         self.context = context
         self.scope = scope
@@ -156,3 +156,53 @@ class TypesUpdater:
     @visitor.when(cool_ast.AtomicNode)
     def visit(self, node: cool_ast.AtomicNode, scope: Scope, index: int) -> int:
         return index
+
+
+class ContextUpdater:
+    """
+    Patches the context built before inference with the types `TypesUpdater` wrote into the tree: every attribute,
+    parameter and return type still declared as AUTO_TYPE in the context takes the type now annotated in its
+    declaration, so the context does not have to be collected and built again.
+    """
+
+    def __init__(self, context: Context, errors: List[str]):
+        self.context = context
+        self.errors = errors
+        self.current_type: Type = None
+
+    def get_type(self, name: str) -> Type:
+        try:
+            return self.context.get_type(name)
+        except SemanticError as error:
+            self.errors.append(str(error))
+            return ErrorType()
+
+    @visitor.on('node')
+    def visit(self, node):
+        pass
+
+    @visitor.when(cool_ast.ProgramNode)
+    def visit(self, node: cool_ast.ProgramNode):
+        for class_declaration in node.declarations:
+            self.visit(class_declaration)
+
+    @visitor.when(cool_ast.ClassDeclarationNode)
+    def visit(self, node: cool_ast.ClassDeclarationNode):
+        self.current_type = self.context.get_type(node.id)
+        attributes = {attribute.name: attribute for attribute in self.current_type.attributes}
+        methods = {method.name: method for method in self.current_type.methods}
+        for feature in node.features:
+            # a redefined feature was rejected by the builder, the type keeps its first declaration
+            if isinstance(feature, cool_ast.AttrDeclarationNode):
+                attribute = attributes.pop(feature.id, None)
+                if attribute is not None and attribute.type.name == 'AUTO_TYPE' and feature.typex != 'AUTO_TYPE':
+                    attribute.type = self.get_type(feature.typex)
+            elif isinstance(feature, cool_ast.MethodDeclarationNode):
+                method = methods.pop(feature.id, None)
+                if method is None:
+                    continue
+                for i, param in enumerate(feature.params):
+                    if method.param_types[i].name == 'AUTO_TYPE' and param.typex != 'AUTO_TYPE':
+                        method.param_types[i] = self.get_type(param.typex)
+                if method.return_type.name == 'AUTO_TYPE' and feature.type != 'AUTO_TYPE':
+                    method.return_type = self.get_type(feature.type)
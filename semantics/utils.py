@@ -1,6 +1,7 @@
 import itertools as itt
 from collections import OrderedDict
-from typing import List, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple, Mapping
 
 
 class SemanticError(Exception):
@@ -10,11 +11,19 @@ class SemanticError(Exception):
 
 
 class Type:
+    # bumped whenever the parent of any type is assigned or a type gains an attribute or a method: the flattened
+    # tables of a type depend on its ancestors, so every table built before is stale
+    generation = 0
+
     def __init__(self, name: str):
         self.name = name
         self.attributes: List[Attribute] = []
         self.methods: List[Method] = []
-        self.parent = None
+        self._parent: Optional[Type] = None
+        self._tables_generation = -1
+        self._method_table: Mapping[str, Tuple[Method, Type]] = {}
+        self._attribute_table: Mapping[str, Tuple[Attribute, Type]] = {}
+        self._attribute_slots: Mapping[str, int] = {}
 
     @staticmethod
     def types_distance(a: 'Type', b: 'Type') -> int:
@@ -57,21 +66,68 @@ class Type:
             elders.append(a)
         return elders
 
+    @property
+    def parent(self) -> Optional['Type']:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional['Type']):
+        # the collector and the builder assign it directly
+        self._parent = parent
+        Type.generation += 1
+
     def set_parent(self, parent):
         if self.parent is not None:
             raise SemanticError(f'Parent type is already set for {self.name}.')
         self.parent = parent
 
+    @property
+    def method_table(self) -> Mapping[str, Tuple['Method', 'Type']]:
+        """
+        Read-only name -> (method, defining type) table of every method of the type, inherited ones included.
+        """
+        if self._tables_generation != Type.generation:
+            self._build_tables()
+        return self._method_table
+
+    @property
+    def attribute_table(self) -> Mapping[str, Tuple['Attribute', 'Type']]:
+        """
+        Read-only name -> (attribute, defining type) table of every attribute of the type, inherited ones included.
+        """
+        if self._tables_generation != Type.generation:
+            self._build_tables()
+        return self._attribute_table
+
+    @property
+    def attribute_slots(self) -> Mapping[str, int]:
+        """
+        Position of every attribute in the layout of the instances: inherited attributes first, as in `all_attributes`.
+        """
+        if self._tables_generation != Type.generation:
+            self._build_tables()
+        return self._attribute_slots
+
+    def _build_tables(self):
+        if self.parent is None:
+            methods, attributes = {}, {}
+        else:
+            methods, attributes = dict(self.parent.method_table), dict(self.parent.attribute_table)
+        for method in self.methods:
+            methods[method.name] = (method, self)
+        for attribute in self.attributes:
+            attributes[attribute.name] = (attribute, self)
+
+        self._method_table = MappingProxyType(methods)
+        self._attribute_table = MappingProxyType(attributes)
+        self._attribute_slots = MappingProxyType({name: slot for slot, name in enumerate(attributes)})
+        self._tables_generation = Type.generation
+
     def get_attribute(self, name: str):
         try:
-            return next(attr for attr in self.attributes if attr.name == name)
-        except StopIteration:
-            if self.parent is None:
-                raise SemanticError(f'Attribute "{name}" is not defined in {self.name}.')
-            try:
-                return self.parent.get_attribute(name)
-            except SemanticError:
-                raise SemanticError(f'Attribute "{name}" is not defined in {self.name}.')
+            return self.attribute_table[name][0]
+        except KeyError:
+            raise SemanticError(f'Attribute "{name}" is not defined in {self.name}.')
 
     def define_attribute(self, name: str, typex):
         try:
@@ -79,20 +135,16 @@ class Type:
         except SemanticError:
             attribute = Attribute(name, typex)
             self.attributes.append(attribute)
+            Type.generation += 1
             return attribute
         else:
             raise SemanticError(f'Attribute "{name}" is already defined in {self.name}.')
 
     def get_method(self, name: str):
         try:
-            return next(method for method in self.methods if method.name == name)
-        except StopIteration:
-            if self.parent is None:
-                raise SemanticError(f'Method "{name}" is not defined in {self.name}.')
-            try:
-                return self.parent.get_method(name)
-            except SemanticError:
-                raise SemanticError(f'Method "{name}" is not defined in {self.name}.')
+            return self.method_table[name][0]
+        except KeyError:
+            raise SemanticError(f'Method "{name}" is not defined in {self.name}.')
 
     def define_method(self, name: str, param_names: list, param_types: list, return_type):
         if name in (method.name for method in self.methods):
@@ -100,6 +152,7 @@ class Type:
 
         method = Method(name, param_names, param_types, return_type)
         self.methods.append(method)
+        Type.generation += 1
         return method
 
     def all_attributes(self, clean=True):
@@ -171,6 +224,43 @@ class TypeVariable(Type):
         TypeVariable.next_var_type_id += 1
 
 
+class Substitutions:
+    """
+    Equivalence classes of the type variables unified during inference, kept in a `DisjointSet` keyed by variable
+    name, and the concrete type each class is bound to, stored with its representative.
+
+    Indexing by the name of a type variable returns the concrete type of its class and raises KeyError while the class
+    has none, as the name -> type dict it replaces did.
+    """
+
+    def __init__(self):
+        # imported here: cmp.utils loads the grammar machinery, which running a program does not need otherwise
+        from cmp.utils import DisjointSet
+
+        self.classes = DisjointSet()
+        self.concrete = {}
+
+    def union(self, a: TypeVariable, b: TypeVariable) -> None:
+        classes = self.classes
+        root_a, root_b = classes.add(a.name).representative, classes.add(b.name).representative
+        if root_a is root_b:
+            return
+        concrete = self.concrete.pop(root_a, None)
+        other = self.concrete.pop(root_b, None)
+        root = root_a.merge(root_b)
+        if concrete is not None or other is not None:
+            self.concrete[root] = concrete if concrete is not None else other
+
+    def bind(self, variable: TypeVariable, typex: Type) -> None:
+        self.concrete[self.classes.add(variable.name).representative] = typex
+
+    def __getitem__(self, name: str) -> Type:
+        return self.concrete[self.classes.find(name)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.classes and self.classes.find(name) in self.concrete
+
+
 class FunctionType(Type):
     def __init__(self, params_types: Tuple[Type, ...], return_type: Type):
         super().__init__('Function')
@@ -240,6 +330,107 @@ class Context:
         return str(self)
 
 
+class TypeHierarchy:
+    """
+    Index over the inheritance tree of a finished context that answers `conforms_to`, `types_distance` and
+    `join_types` without walking parent chains.
+
+    Types are numbered in DFS preorder, so the subtree of type `j` is the range `j <= i < end[j]` and conformance is
+    an interval check. Joins are lowest common ancestors, found in constant time with a sparse table over the Euler
+    tour of the tree. Types outside the context (SELF_TYPE, errors, type variables) or on an inheritance cycle are not
+    indexed, and queries about them fall back to the `Type` methods.
+    """
+
+    def __init__(self, context: Context):
+        children: Dict[int, List[Type]] = {id(typex): [] for typex in context.types.values()}
+        roots = []
+        for typex in context.types.values():
+            if typex.parent is None:
+                roots.append(typex)
+            elif id(typex.parent) in children:
+                children[id(typex.parent)].append(typex)
+
+        self.types: List[Type] = []
+        self.index: Dict[int, int] = {}
+        self.depth: List[int] = []
+        self.end: List[int] = []
+        self.root: List[int] = []
+        self.first: List[int] = []
+        euler: List[int] = []
+
+        for root in roots:
+            pending = [(root, iter(children[id(root)]))]
+            self._enter(root, root=len(self.types), depth=0, euler=euler)
+            while pending:
+                typex, remaining = pending[-1]
+                child = next(remaining, None)
+                i = self.index[id(typex)]
+                if child is None:
+                    pending.pop()
+                    self.end[i] = len(self.types)
+                    if pending:
+                        euler.append(self.index[id(pending[-1][0])])
+                else:
+                    self._enter(child, root=self.root[i], depth=self.depth[i] + 1, euler=euler)
+                    pending.append((child, iter(children[id(child)])))
+
+        # sparse[k][p] is the shallowest type in euler[p:p + 2 ** k]: an ancestor precedes its whole subtree in preorder,
+        # so it is simply the smallest number
+        self.sparse = [euler]
+        width = 1
+        while 2 * width <= len(euler):
+            previous = self.sparse[-1]
+            self.sparse.append([min(previous[p], previous[p + width]) for p in range(len(euler) - 2 * width + 1)])
+            width *= 2
+
+    def _enter(self, typex: Type, root: int, depth: int, euler: List[int]) -> None:
+        i = len(self.types)
+        self.types.append(typex)
+        self.index[id(typex)] = i
+        self.depth.append(depth)
+        self.end.append(i + 1)
+        self.root.append(root)
+        self.first.append(len(euler))
+        euler.append(i)
+
+    def conforms_to(self, a: Type, b: Type) -> bool:
+        i = self.index.get(id(a))
+        j = self.index.get(id(b))
+        if i is None or j is None:
+            return a.conforms_to(b)
+        return j <= i < self.end[j]
+
+    def types_distance(self, a: Type, b: Type) -> int:
+        i = self.index.get(id(a))
+        j = self.index.get(id(b))
+        if i is None or j is None:
+            return Type.types_distance(a, b)
+        if j <= i < self.end[j]:
+            return self.depth[i] - self.depth[j]
+        if i <= j < self.end[i]:
+            return self.depth[j] - self.depth[i]
+        return -1
+
+    def join_types(self, *types) -> Type:
+        typex: Type = types[0]
+        for i in range(1, len(types)):
+            typex = self._join(typex, types[i])
+        return typex
+
+    def _join(self, a: Type, b: Type) -> Type:
+        if a is None or b is None:
+            return ErrorType()
+        i = self.index.get(id(a))
+        j = self.index.get(id(b))
+        if i is None or j is None or self.root[i] != self.root[j]:
+            return Type.join_types_aux(a, b)
+
+        low, high = sorted((self.first[i], self.first[j]))
+        k = (high - low + 1).bit_length() - 1
+        row = self.sparse[k]
+        return self.types[min(row[low], row[high - (1 << k) + 1])]
+
+
 class VariableInfo:
     def __init__(self, name: str, vtype: Type, value=None):
         self.name = name
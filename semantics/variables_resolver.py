@@ -0,0 +1,129 @@
+from typing import List, Optional
+
+import cool_ast
+from cmp import visitor
+
+
+class VariablesResolver:
+    """
+    Resolves every variable of a checked program to where it is stored at runtime, so the backends never look a name
+    up in a chain of scopes.
+
+    Every method body and attribute initializer runs in a flat frame: slot 0 holds `self`, then come the parameters
+    and the variables declared by `let` and `case`. A slot is reused once the expression that declared it ends.
+    The pass sets:
+        - `slot` of every `VariableNode` and `AssignNode`: the frame slot of the variable, or None for an attribute
+          of `self`
+        - `slot` of every `VarDeclarationNode` of a `let` and every `CaseOptionNode`: the slot of its variable
+        - `frame_size` of every `MethodDeclarationNode` and `AttrDeclarationNode`: the number of slots of its frame
+    """
+
+    def __init__(self):
+        self.variables: List[str] = []
+        self.frame_size = 0
+
+    def _enter(self, params: List[str]) -> None:
+        self.variables = ['self']
+        self.frame_size = 1
+        for param in params:
+            self._declare(param)
+
+    def _declare(self, name: str) -> int:
+        slot = len(self.variables)
+        self.variables.append(name)
+        self.frame_size = max(self.frame_size, slot + 1)
+        return slot
+
+    def _lookup(self, name: str) -> Optional[int]:
+        # the innermost declaration shadows the others
+        for slot in range(len(self.variables) - 1, -1, -1):
+            if self.variables[slot] == name:
+                return slot
+        return None
+
+    @visitor.on('node')
+    def visit(self, node):
+        pass
+
+    @visitor.when(cool_ast.ProgramNode)
+    def visit(self, node: cool_ast.ProgramNode) -> None:
+        for class_decl in node.declarations:
+            self.visit(class_decl)
+
+    @visitor.when(cool_ast.ClassDeclarationNode)
+    def visit(self, node: cool_ast.ClassDeclarationNode) -> None:
+        for feature in node.features:
+            self.visit(feature)
+
+    @visitor.when(cool_ast.AttrDeclarationNode)
+    def visit(self, node: cool_ast.AttrDeclarationNode) -> None:
+        self._enter([])
+        if node.expression is not None:
+            self.visit(node.expression)
+        node.frame_size = self.frame_size
+
+    @visitor.when(cool_ast.MethodDeclarationNode)
+    def visit(self, node: cool_ast.MethodDeclarationNode) -> None:
+        self._enter([param.id for param in node.params])
+        if node.body is not None:
+            self.visit(node.body)
+        node.frame_size = self.frame_size
+
+    @visitor.when(cool_ast.BlocksNode)
+    def visit(self, node: cool_ast.BlocksNode) -> None:
+        for expr in node.expr_list:
+            self.visit(expr)
+
+    @visitor.when(cool_ast.ConditionalNode)
+    def visit(self, node: cool_ast.ConditionalNode) -> None:
+        self.visit(node.condition)
+        self.visit(node.then_body)
+        self.visit(node.else_body)
+
+    @visitor.when(cool_ast.LoopNode)
+    def visit(self, node: cool_ast.LoopNode) -> None:
+        self.visit(node.condition)
+        self.visit(node.body)
+
+    @visitor.when(cool_ast.LetNode)
+    def visit(self, node: cool_ast.LetNode) -> None:
+        size = len(self.variables)
+        for var in node.var_decl_list:
+            if var.expr is not None:
+                self.visit(var.expr)
+            var.slot = self._declare(var.id)
+        self.visit(node.in_expr)
+        del self.variables[size:]
+
+    @visitor.when(cool_ast.CaseNode)
+    def visit(self, node: cool_ast.CaseNode) -> None:
+        self.visit(node.case_expr)
+        for option in node.options:
+            option.slot = self._declare(option.id)
+            self.visit(option.expr)
+            self.variables.pop()
+
+    @visitor.when(cool_ast.MethodCallNode)
+    def visit(self, node: cool_ast.MethodCallNode) -> None:
+        if node.expr is not None:
+            self.visit(node.expr)
+        for arg in node.args:
+            self.visit(arg)
+
+    @visitor.when(cool_ast.VariableNode)
+    def visit(self, node: cool_ast.VariableNode) -> None:
+        node.slot = self._lookup(node.lex)
+
+    @visitor.when(cool_ast.AssignNode)
+    def visit(self, node: cool_ast.AssignNode) -> None:
+        self.visit(node.expr)
+        node.slot = self._lookup(node.id)
+
+    @visitor.when(cool_ast.UnaryNode)
+    def visit(self, node: cool_ast.UnaryNode) -> None:
+        self.visit(node.expr)
+
+    @visitor.when(cool_ast.BinaryNode)
+    def visit(self, node: cool_ast.BinaryNode) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
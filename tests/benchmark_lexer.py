@@ -0,0 +1,62 @@
+import timeit
+from grammar import *
+from re_lexer import CoolLexer, ReLexer
+
+# Same token table CoolLexer used before keywords moved to a lookup table: every keyword is its own alternative,
+# tried before `identifier`.
+alternation = ReLexer([
+    (classx, 'class', r'class(?=\s)'),
+    (inherits, 'inherits', r'inherits(?=\s)'),
+    (let, 'let', r'let(?=\s)'),
+    (assigment, 'assigment', r'<-'),
+    (ifx, 'if', r'if(?=\s)'),
+    (thenx, 'then', r'then(?=\s)'),
+    (elsex, 'else', r'else(?=\s)'),
+    (fi, 'fi', r'fi'),
+    (whilex, 'while', r'while(?=\s)'),
+    (loop, 'loop', r'loop(?=\s)'),
+    (pool, 'pool', r'pool'),
+    (case, 'case', r'case(?=\s)'),
+    (of, 'of', r'of(?=\s)'),
+    (esac, 'esac', r'esac(?=\s)'),
+    (case_assigment, 'case_assigment', r'=>'),
+    (new, 'new', r'new(?=\s)'),
+    (isvoid, 'isvoid', r'isvoid(?=\s)'),
+    (equal, 'equal', r'='),
+    (less_equal, 'less_equal', r'<='),
+    (less, 'less', r'<'),
+    (plus, 'plus', r'\+'),
+    (star, 'star', r'\*'),
+    (div, 'div', r'/'),
+    (semi, 'semi', r';'),
+    (colon, 'colon', r':'),
+    (comma, 'comma', r','),
+    (dot, 'dot', r'\.'),
+    (cpar, 'cpar', r'\)'),
+    (ocur, 'ocur', r'{'),
+    (ccur, 'ccur', r'}'),
+    (inx, 'in', r'in(?=\s)'),
+    (notx, 'not', r'not(?=\s)'),
+    (at, 'at', r'@'),
+    (true, 'true', r'true'),
+    (false, 'false', r'false'),
+    (intx, 'integer', r'[\d][\d]*'),
+    (idx, 'identifier', r'[a-zA-Z][a-zA-Z0-9_]*'),
+    (string, 'string', r'\"[^\"]*\"'),
+    ('whitespace', 'whitespace', r' +'),
+    ('newline', 'newline', r'\n'),
+    ('tabulation', 'tabulation', r'\t'),
+    ('comment', 'comment', r'(\(\*[\s\S]*?\*\))|(--[^\n]*\n)'),
+    (opar, 'opar', r'\('),
+    (minus, 'minus', r'-'),
+    (complement, 'complement', r'~')
+], G.EOF)
+table = CoolLexer()
+
+line = 'value <- counter . increment ( offset , total_sum ) + accumulator * factor_2 ;\n'
+text = line * 5000
+tokens = sum(1 for _ in ReLexer.__call__(table, text))
+
+for name, lexer in [('alternation', alternation), ('keyword table', table)]:
+    seconds = min(timeit.repeat(lambda: sum(1 for _ in ReLexer.__call__(lexer, text)), number=1, repeat=5))
+    print(f'{name:<14} {seconds:.4f}s  {tokens / seconds / 1e6:.2f} Mtokens/s')
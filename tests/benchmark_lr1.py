@@ -0,0 +1,56 @@
+import time
+from cmp.automata import State, multiline_formatter
+from cmp.parsers.lr1_parser import build_LR1_automaton, closure_lr1, goto_lr1
+from cmp.first_follow import compute_firsts
+from cmp.pycompiler import Item
+from cmp.utils import ContainerSet
+from grammar import G
+
+
+# Previous build_LR1_automaton, built on the Item-level closure_lr1/goto_lr1 helpers
+def build_LR1_automaton_items(G):
+    firsts = compute_firsts(G)
+    firsts[G.EOF] = ContainerSet(G.EOF)
+
+    start_production = G.startSymbol.productions[0]
+    start_item = Item(start_production, 0, lookaheads=(G.EOF,))
+    start = frozenset([start_item])
+
+    closure = closure_lr1(start, firsts)
+    automaton = State(frozenset(closure), True)
+
+    pending = [start]
+    visited = {start: automaton}
+
+    while pending:
+        current = pending.pop()
+        current_state = visited[current]
+
+        for symbol in G.terminals + G.nonTerminals:
+            closure = closure_lr1(current, firsts)
+            goto = goto_lr1(closure, symbol, firsts, True)
+
+            if not goto:
+                continue
+            try:
+                next_state = visited[goto]
+            except KeyError:
+                closure = closure_lr1(goto, firsts)
+                next_state = visited[goto] = State(frozenset(closure), True)
+                pending.append(goto)
+
+            current_state.add_transition(symbol.Name, next_state)
+
+    automaton.set_formatter(multiline_formatter)
+    return automaton
+
+
+augmented = G.AugmentedGrammar(True)
+automata = {}
+for name, build in [('items', build_LR1_automaton_items), ('interned', build_LR1_automaton)]:
+    start = time.time()
+    automata[name] = build(augmented)
+    print(f'{name:<9} {time.time() - start:.3f}s')
+
+states = [[(node.state, sorted(node.transitions)) for node in automaton] for automaton in automata.values()]
+print('states:', len(states[0]), 'identical:', states[0] == states[1])
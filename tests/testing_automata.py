@@ -0,0 +1,63 @@
+import itertools
+import random
+import re
+
+from cmp.automata import DFA, automata_minimization
+from cmp.lexer.regex import Regex
+
+ALPHABET = 'ab'
+WORDS = [''.join(word) for length in range(7) for word in itertools.product(ALPHABET, repeat=length)]
+
+
+def random_dfa(rng: random.Random) -> DFA:
+    states = rng.randint(1, 8)
+    transitions = {(origin, symbol): rng.randrange(states)
+                   for origin in range(states) for symbol in ALPHABET if rng.random() < 0.8}
+    finals = [state for state in range(states) if rng.random() < 0.4]
+    return DFA(states, finals, transitions)
+
+
+def random_regex(rng: random.Random, depth: int = 4):
+    """
+    Returns the same random expression in the syntax of `Regex` and in the one of `re`.
+    """
+    kind = rng.choice('ss' if depth == 0 else 'sscuk')
+    if kind == 's':
+        symbol = rng.choice(ALPHABET)
+        return symbol, symbol
+    if kind == 'k':
+        regex, python = random_regex(rng, depth - 1)
+        return f'«{regex}»∀', f'({python})*'
+    left, python_left = random_regex(rng, depth - 1)
+    right, python_right = random_regex(rng, depth - 1)
+    if kind == 'c':
+        return f'«{left}»«{right}»', f'({python_left})({python_right})'
+    return f'«{left}§{right}»', f'({python_left}|{python_right})'
+
+
+rng = random.Random(0)
+
+failures = 0
+for _ in range(3000):
+    dfa = random_dfa(rng)
+    minimized = automata_minimization(dfa)
+    for word in WORDS:
+        if dfa.recognize(word) != minimized.recognize(word):
+            failures += 1
+            print('Minimized DFA differs on', repr(word), dfa.map, dfa.finals)
+            break
+print(f'Random DFAs: {failures} failures')
+assert failures == 0
+
+failures = 0
+for expression, python in [('««b»∀»««a§«b§a»»§««a»a»«a§b»»', '((b)*)((a|(b|a))|((a)a)(a|b))'),
+                           ('««««b»∀»«b»∀§««b»a»«a§b»»»∀', '((((b)*)(b)*|((b)a)(a|b)))*')] + \
+                          [random_regex(rng) for _ in range(300)]:
+    regex = Regex(expression)
+    for word in WORDS:
+        if regex(word) != (re.fullmatch(python, word) is not None):
+            failures += 1
+            print('Regex', expression, 'differs from', python, 'on', repr(word))
+            break
+print(f'Random regexes: {failures} failures')
+assert failures == 0
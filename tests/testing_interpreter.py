@@ -1,13 +1,13 @@
 import os
 
-from cmp.evaluation import evaluate_reverse_parse
 from interpreter import Interpreter
 from semantics import TypeBuilder, TypeCollector, Context, Scope
-from tools.serializers import Serializer as sr
+from re_lexer import CoolLexer
+from grammar import G
+from tools.tables import load_parser
 
-path = os.getcwd().replace('tests', '') + 'tools'
-tokenizer = sr.load(path + '/lexer')
-parser = sr.load(path + '/parser')
+tokenizer = CoolLexer()
+parser = load_parser(G)
 
 for i, file in enumerate(os.listdir('runtime_tests')):
     txt = open('runtime_tests/' + file)
@@ -19,11 +19,11 @@ for i, file in enumerate(os.listdir('runtime_tests')):
         print('Tokens:')
         for token in tokens:
             print(token.lex)
-        parse, operations = parser(tokens, get_shift_reduce=True)
+        parse = []
+        ast = parser.evaluate(tokens, parse)
         print('Parsing:')
         for j in parse:
             print(j)
-        ast = evaluate_reverse_parse(parse, operations, tokens)
         print(ast)
 
         if ast is not None:
@@ -34,4 +34,4 @@ for i, file in enumerate(os.listdir('runtime_tests')):
             TypeCollector(context, errors).visit(ast)
             TypeBuilder(context, errors).visit(ast)
             print(context)
-            Interpreter(context).visit(ast, Scope())
+            Interpreter(context).visit(ast)
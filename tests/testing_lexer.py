@@ -1,8 +1,6 @@
-from tools.serializers import Serializer as sr
-import os
+from re_lexer import CoolLexer
 
-path = os.getcwd().replace('tests', '') + 'tools'
-tokenizer = sr.load(path + '/lexer')
+tokenizer = CoolLexer()
 text = '''--efre3132fdvfv_2fr2f'''
 text2 = '''"\n"'''
 text3 = '''classx'''
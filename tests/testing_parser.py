@@ -1,10 +1,9 @@
-from cmp.evaluation import evaluate_reverse_parse
-from tools.serializers import Serializer as sr
-import os
+from re_lexer import CoolLexer
+from grammar import G
+from tools.tables import load_parser
 
-path = os.getcwd().replace('tests', '') + 'tools'
-tokenizer = sr.load(path + '/lexer')
-parser = sr.load(path + '/parser')
+tokenizer = CoolLexer()
+parser = load_parser(G)
 code = '''
 class Main inherits CellularAutomaton {
     cells : CellularAutomaton;
@@ -64,9 +63,9 @@ tokens = list(tokenizer(code2))
 print('Tokens:')
 for token in tokens:
     print(token)
-parse, operations = parser(tokens, get_shift_reduce=True)
+parse = []
+ast = parser.evaluate(tokens, parse)
 print('Parsing:')
 for j in parse:
     print(j)
-ast = evaluate_reverse_parse(parse, operations, tokens)
 print(ast)
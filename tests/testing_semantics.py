@@ -1,13 +1,13 @@
-from cmp.evaluation import evaluate_reverse_parse
 from format_visitor import FormatVisitor
 from semantics.types_updater import TypesUpdater
-from tools.serializers import Serializer as sr
+from re_lexer import CoolLexer
+from grammar import G
+from tools.tables import load_parser
 import os
 from semantics import TypeBuilder, TypeCollector, TypeInferencer, Context, Scope, TypeChecker
 
-path = os.getcwd().replace('tests', '') + 'tools'
-tokenizer = sr.load(path + '/lexer')
-parser = sr.load(path + '/parser')
+tokenizer = CoolLexer()
+parser = load_parser(G)
 a = os.listdir('semantics_tests')
 for i, file in enumerate(os.listdir('semantics_tests')):
     txt = open('semantics_tests/' + file)
@@ -18,11 +18,11 @@ for i, file in enumerate(os.listdir('semantics_tests')):
         tokens = list(tokenizer(code))
         print('Tokens:')
         print(tokens, '\n')
-        parse, operations = parser(tokens, get_shift_reduce=True)
+        parse = []
+        ast = parser.evaluate(tokens, parse)
         print('Parsing:')
         for j in parse:
             print(j)
-        ast = evaluate_reverse_parse(parse, operations, tokens)
         print(ast)
 
         if ast is not None:
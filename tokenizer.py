@@ -53,16 +53,7 @@ class CoolTokenizer:
         ], G.EOF)
 
     def __call__(self, input_text: str) -> List[Token]:
-        text = ""
-        for i in input_text:
-            if i == '\n':
-                text += '\\n'
-            elif i == '\t':
-                text += '\\t'
-            elif i == '\'':
-                pass
-            else:
-                text += i
+        text = input_text.replace('\n', '\\n').replace('\t', '\\t').replace('\'', '')
 
         tokens: List[Token] = self.lexer(text)
         col = 1
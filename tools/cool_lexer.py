@@ -0,0 +1,178 @@
+# Generated by tools/lexer_generator.py from re_lexer.CoolLexer, do not edit.
+# Regenerate with: python -m tools.lexer_generator
+import codecs
+import re
+
+SPECIFICATION_DIGEST = '0f88bb6aed5a3a8a33e85ad4e7ffa6edb60f4512d255fc4299d7691de22fa43c'
+
+PATTERN = re.compile('(?P<identifier>[a-zA-Z][a-zA-Z0-9_]*)|(?P<assigment><-)|(?P<case_assigment>=>)|(?P<equal>=)|(?P<less_equal><=)|(?P<less><)|(?P<plus>\\+)|(?P<star>\\*)|(?P<div>/)|(?P<semi>;)|(?P<colon>:)|(?P<comma>,)|(?P<dot>\\.)|(?P<cpar>\\))|(?P<ocur>{)|(?P<ccur>})|(?P<at>@)|(?P<integer>[\\d][\\d]*)|(?P<string>\\"[^\\"]*\\")|(?P<whitespace> +)|(?P<newline>\\n)|(?P<tabulation>\\t)|(?P<comment>(\\(\\*[\\s\\S]*?\\*\\))|(--[^\\n]*\\n))|(?P<opar>\\()|(?P<minus>-)|(?P<complement>~)')
+
+TOKEN_TYPES = {
+    'identifier': 'id',
+    'assigment': '<-',
+    'case_assigment': '=>',
+    'equal': '=',
+    'less_equal': '<=',
+    'less': '<',
+    'plus': '+',
+    'star': '*',
+    'div': '/',
+    'semi': ';',
+    'colon': ':',
+    'comma': ',',
+    'dot': '.',
+    'cpar': ')',
+    'ocur': '{',
+    'ccur': '}',
+    'at': '@',
+    'integer': 'int',
+    'string': 'string',
+    'whitespace': 'whitespace',
+    'newline': 'newline',
+    'tabulation': 'tabulation',
+    'comment': 'comment',
+    'opar': '(',
+    'minus': '-',
+    'complement': '~',
+}
+
+KEYWORDS = {
+    'class': 'class',
+    'inherits': 'inherits',
+    'let': 'let',
+    'if': 'if',
+    'then': 'then',
+    'else': 'else',
+    'fi': 'fi',
+    'while': 'while',
+    'loop': 'loop',
+    'pool': 'pool',
+    'case': 'case',
+    'of': 'of',
+    'esac': 'esac',
+    'new': 'new',
+    'isvoid': 'isvoid',
+    'in': 'in',
+    'not': 'not',
+    'true': 'true',
+    'false': 'false',
+}
+
+IDENTIFIER = 'identifier'
+STRING = 'string'
+EOF = '$'
+
+CHUNK_SIZE = 65536
+DELIMITERS = [('(*', '*)'), ('--', '\n'), ('"', '"')]
+
+
+
+class Token:
+    """
+    Token whose type is the name of a terminal of the grammar.
+    """
+
+    def __init__(self, lex, token_type, row=None, col=None):
+        self.col = col
+        self.row = row
+        self.lex = lex
+        self.token_type = token_type
+
+    def __str__(self):
+        return f'{self.token_type}: {self.lex}'
+
+    def __repr__(self):
+        return str(self)
+
+
+def tokenize(source, chunk_size=CHUNK_SIZE):
+    """
+    Yields the tokens of `source`, whitespace and comments excluded, followed by the EOF token.
+
+    `source` is the program text, anything with a `read(size)` method returning `str` or `bytes` (file objects), or
+    an iterable of `str` or `bytes` chunks. Files are read `chunk_size` characters at a time and only the unconsumed
+    tail of the input is buffered.
+    """
+    match = PATTERN.match
+    chunks = _chunks(source, chunk_size)
+    # a whole text needs no further input
+    buffer, exhausted = (source, True) if isinstance(source, str) else ('', False)
+    position = 0
+    row = column = 0
+    while True:
+        found = match(buffer, position) if position < len(buffer) else None
+        if not exhausted and (found is None or found.end() == len(buffer) or _pending(buffer, position)):
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+            else:
+                buffer = buffer[position:] + chunk
+                position = 0
+            continue
+
+        if position == len(buffer):
+            break
+        if found is None:
+            raise Exception(f'Unknown token in row:{row} col:{column}')
+
+        group = found.lastgroup
+        lex = found.group()
+        position = found.end()
+        token_type = TOKEN_TYPES[group]
+
+        if group == 'tabulation':
+            column += 4
+        elif group == 'whitespace':
+            column += len(lex)
+        elif group == 'newline':
+            column = 0
+            row += 1
+        elif group == 'comment':
+            row, column = _skip(lex, row, column)
+        else:
+            if group == IDENTIFIER:
+                token_type = KEYWORDS.get(lex, token_type)
+            elif token_type == STRING:
+                lex = lex[1:-1].replace('\\n', '\n').replace('\\t', '\t')
+            yield Token(lex, token_type, row, column)
+            if token_type == STRING:
+                row, column = _skip(lex, row, column)
+            else:
+                new_lines = lex.count('\n')
+                if new_lines:
+                    row += new_lines
+                    column = 0
+                else:
+                    column += len(lex)
+
+    yield Token(EOF, EOF, row, column)
+
+
+def _chunks(source, chunk_size):
+    if hasattr(source, 'read'):
+        read = source.read
+        source = iter(lambda: read(chunk_size), read(0))
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _pending(buffer, position):
+    # a token that opens with one of DELIMITERS may still grow: its closer is not buffered yet
+    for opener, closer in DELIMITERS:
+        if buffer.startswith(opener, position) and buffer.find(closer, position + len(opener)) < 0:
+            return True
+    return False
+
+
+def _skip(lex, row, column):
+    new_lines = max(lex.count('\n') - lex.count('\\n'), 0)
+    if new_lines == 0:
+        return row, column + len(lex)
+    return row + new_lines, column + len(lex[lex.rfind('\n'):]) + 1
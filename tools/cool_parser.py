@@ -0,0 +1,1454 @@
+# Generated by tools/parser_generator.py from grammar.py, do not edit.
+# Regenerate with: python -m tools.parser_generator
+from cool_ast import *
+
+GRAMMAR_DIGEST = '51aa56c1f62e19778f0b81f385ebf1dd848a28ce13bf2b8d03de442a556e2d93'
+
+TERMINALS = ('$', 'class', 'inherits', 'self', 'let', '<-', 'if', 'then', 'else', 'fi', 'while', 'loop', 'pool', 'case', 'of', 'esac', '=>', 'new', 'isvoid', '=', '<', '<=', '+', '-', '*', '/', ';', ':', ',', '~', '.', '(', ')', '{', '}', 'in', 'not', 'id', 'int', 'string', 'true', 'false', '@')
+TERMINAL_IDS = {name: i for i, name in enumerate(TERMINALS)}
+UNKNOWN = len(TERMINALS)
+
+PRODUCTIONS = (
+    '<program> := <class-list>',
+    '<class-list> := <class> ; <class-list>',
+    '<class-list> := <class> ;',
+    '<class> := class id { <feature_list> }',
+    '<class> := class id inherits id { <feature_list> }',
+    '<feature_list> := <def-attr> ; <feature_list>',
+    '<feature_list> := <def-func> ; <feature_list>',
+    '<feature_list> := e',
+    '<def-attr> := id : id',
+    '<def-attr> := id : id <- <expr>',
+    '<def-func> := id ( <params-list> ) : id { <expr> }',
+    '<params-list> := <param> , <params-list>',
+    '<params-list> := <param>',
+    '<params-list> := e',
+    '<param> := id : id',
+    '<expr-list> := <expr> ;',
+    '<expr-list> := <expr> ; <expr-list>',
+    '<expr> := id <- <expr>',
+    '<expr> := if <expr> then <expr> else <expr> fi',
+    '<expr> := while <expr> loop <expr> pool',
+    '<expr> := { <expr-list> }',
+    '<expr> := let <let-list> in <expr>',
+    '<expr> := case <expr> of <case-list> esac',
+    '<expr> := isvoid <expr>',
+    '<expr> := not <expr>',
+    '<expr> := ~ <expr>',
+    '<expr> := <cmp>',
+    '<cmp> := <cmp> < <arith>',
+    '<cmp> := <cmp> <= <arith>',
+    '<cmp> := <cmp> = <arith>',
+    '<cmp> := <arith>',
+    '<arith> := <arith> + <term>',
+    '<arith> := <arith> - <term>',
+    '<arith> := <term>',
+    '<term> := <term> * <factor>',
+    '<term> := <term> / <factor>',
+    '<term> := <factor>',
+    '<factor> := <atom>',
+    '<factor> := ( <expr> )',
+    '<factor> := new id',
+    '<atom> := false',
+    '<atom> := true',
+    '<atom> := int',
+    '<atom> := string',
+    '<atom> := id',
+    '<atom> := <factor> @ id . id ( <arg-list> )',
+    '<atom> := <factor> . id ( <arg-list> )',
+    '<atom> := id ( <arg-list> )',
+    '<arg-list> := <expr>',
+    '<arg-list> := <expr> , <arg-list>',
+    '<arg-list> := e',
+    '<let-list> := <let-single> , <let-list>',
+    '<let-list> := <let-single>',
+    '<let-single> := id : id',
+    '<let-single> := id : id <- <expr>',
+    '<case-list> := <case-single> <case-list>',
+    '<case-list> := <case-single>',
+    '<case-single> := id : id => <expr> ;',
+)
+
+# body positions of every production, as indexed by its semantic action, that hold a terminal
+BODY_TERMINALS = (
+    frozenset(),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset({1, 2, 3, 5}),
+    frozenset({1, 2, 3, 4, 5, 7}),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset(),
+    frozenset({1, 2, 3}),
+    frozenset({1, 2, 3, 4}),
+    frozenset({1, 2, 4, 5, 6, 7, 9}),
+    frozenset({2}),
+    frozenset(),
+    frozenset(),
+    frozenset({1, 2, 3}),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset({1, 2}),
+    frozenset({1, 3, 5, 7}),
+    frozenset({1, 3, 5}),
+    frozenset({1, 3}),
+    frozenset({1, 3}),
+    frozenset({1, 3, 5}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset(),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset(),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset(),
+    frozenset({2}),
+    frozenset({2}),
+    frozenset(),
+    frozenset(),
+    frozenset({1, 3}),
+    frozenset({1, 2}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset({1}),
+    frozenset({2, 3, 4, 5, 6, 8}),
+    frozenset({2, 3, 4, 6}),
+    frozenset({1, 2, 4}),
+    frozenset(),
+    frozenset({2}),
+    frozenset(),
+    frozenset({2}),
+    frozenset(),
+    frozenset({1, 2, 3}),
+    frozenset({1, 2, 3, 4}),
+    frozenset(),
+    frozenset(),
+    frozenset({1, 2, 3, 4, 6}),
+)
+
+LENGTHS = (
+    1, 3, 2, 5, 7, 3, 3, 0, 3, 5, 9, 3, 1, 0, 3, 2, 3, 3, 7, 5,
+    3, 4, 5, 2, 2, 2, 1, 3, 3, 3, 1, 3, 3, 1, 3, 3, 1, 1, 3, 2,
+    1, 1, 1, 1, 1, 8, 6, 4, 1, 3, 0, 3, 1, 3, 5, 2, 1, 6,
+)
+
+LEFTS = (
+    0, 1, 1, 2, 2, 3, 3, 3, 5, 5, 4, 6, 6, 6, 7, 8, 8, 9, 9, 9,
+    9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 11, 11, 11, 12, 12, 12, 13, 13, 13,
+    14, 14, 14, 14, 14, 14, 14, 14, 16, 16, 16, 17, 17, 18, 18, 19, 19, 20,
+)
+
+DEFAULT = (
+    0, 0, 0, 0, 0, -9, 0, 0, -10, 0, 0, 0, 0, -55, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -41, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -41, 0, 0, 0, 0, 0, 0,
+    0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, -41, 0, 0, 0, 0, 0, 0, 0, -46, 0, -44, -45, -43, -42, -19, -28,
+    0, -46, -52, 0, 0, 0, 0, 0, 0, 0, 0, -41, 0, 0, 0, 0, -41, 0, 0, 0,
+    0, 0, 0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, -41, 0, 0, 0, 0,
+    -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, 0, -22, 0, -17, -18, -32, 0, -33,
+    0, -36, 0, 0, -52, 0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, -50, -52, -32,
+    0, -33, 0, -36, 0, 0, -52, -35, 0, -37, 0, 0, 0, 0, -52, -38, -39, 0, -47, 0,
+    -48, 0, -34, -51, 0, -49, -31, 0, -29, 0, -30, -26, 0, -48, 0, 0, 0, 0, -52, 0,
+    -47, -39, 0, -37, -38, 0, -34, -35, 0, -49, -31, 0, -33, 0, -36, 0, 0, -52, 0, -48,
+    0, 0, 0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -29, 0, -30, -32, -26,
+    0, -40, -27, -25, 0, -49, -31, 0, -29, 0, -30, -26, 0, -22, 0, -22, 0, -40, -27, -25,
+    0, -40, -27, -25, 0, -59, 0, -24, -58, -57, -32, 0, -33, 0, -36, 0, 0, -52, 0, -48,
+    0, 0, 0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -49, -31, 0, -29, 0,
+    -30, -26, 0, 0, 0, -24, 0, -22, 0, 0, 0, -24, 0, -40, -27, -25, 0, 0, 0, -24,
+    0, 0, 0, -24, 0, -41, 0, 0, 0, 0, -40, 0, 0, -22, 0, -46, 0, -44, -45, -43,
+    -42, -19, -28, 0, -46, -52, 0, -49, -31, 0, -33, 0, -36, 0, 0, -52, 0, -48, 0, 0,
+    0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -29, 0, -30, -32, -26, -27, -25,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    -24, 0, -41, 0, 0, 0, 0, -40, 0, 0, -22, 0, -46, 0, -44, -45, -43, -42, -19, -28,
+    0, -46, -52, 0, -49, -31, 0, -33, 0, -36, 0, 0, -52, 0, -48, 0, 0, 0, 0, -52,
+    0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -29, 0, -30, -32, -26, -27, -25, 0, -21, -32,
+    0, -33, 0, -36, 0, 0, -52, 0, -48, 0, 0, 0, 0, -52, 0, -47, -39, 0, -37, -38,
+    0, -34, -35, 0, -21, 0, 0, 0, 0, -24, 0, -41, 0, 0, 0, 0, -40, 0, 0, -22,
+    0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, -49, -31, 0, -33, 0, -36, 0,
+    0, -52, 0, -48, 0, 0, 0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -29,
+    0, -30, -32, -26, -27, -25, 0, -20, -32, 0, -33, 0, -36, 0, 0, -52, 0, -48, 0, 0,
+    0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35, -23, -54, 0, -53, 0, -20, -23, 0,
+    -21, 0, -49, -31, 0, -29, 0, -30, -26, 0, 0, 0, -21, 0, -22, 0, 0, 0, -21, 0,
+    -40, -27, -25, 0, 0, 0, -21, 0, 0, 0, -24, 0, 0, 0, -21, 0, 0, 0, -21, 0,
+    0, 0, -20, -23, 0, 0, 0, -20, -23, 0, -49, -31, 0, -29, 0, -30, -26, 0, 0, 0,
+    0, 0, -20, 0, -22, 0, 0, 0, 0, 0, -20, -23, 0, -40, -27, -25, 0, 0, 0, 0,
+    0, -20, -23, 0, 0, 0, -24, 0, 0, 0, 0, 0, -20, -23, 0, 0, 0, -21, 0, 0,
+    0, 0, 0, -20, -23, 0, 0, 0, 0, 0, -20, 0, 0, 0, 0, -21, 0, 0, 0, 0,
+    -24, 0, -41, 0, 0, 0, 0, -40, 0, 0, -22, 0, -46, 0, -44, -45, -43, -42, -19, -28,
+    0, -46, -52, 0, -49, -31, 0, -33, 0, -36, 0, 0, -52, 0, -48, 0, 0, 0, 0, -52,
+    0, -47, -39, 0, -37, -38, 0, -34, -35, 0, -29, 0, -30, -32, -26, -27, -25, -23, -56, 0,
+    0, -23, -11, -15, 0, 0, -16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, -20, 0, 0, 0, 0, -21, 0, 0, 0, 0, -24, 0, -41, 0, 0, 0, 0, -40, 0,
+    0, -22, 0, -46, 0, -44, -45, -43, -42, -19, -28, 0, -46, -52, 0, -49, -31, 0, -33, 0,
+    -36, 0, 0, -52, 0, -48, 0, 0, 0, 0, -52, 0, -47, -39, 0, -37, -38, 0, -34, -35,
+    0, -29, 0, -30, -32, -26, -27, -25, -23, 0, -12, -14, -15, -13, 0, -6, 0, -9, -8, 0,
+    -9, -7, -9, 0, -5, 0, -2, 0, -4, -3,
+)
+
+ACTION_BASE = (
+    0, 10, 12, 15, 27, 46, 1, 50, 0, 0, 65, 80, 78, 2, 17, 101, 107, 55, 72, 120,
+    124, 110, 127, 165, 133, 141, 182, 220, 237, 150, 175, 275, 292, 175, 0, 330, 347, 385, 177, 190,
+    402, 440, 457, 495, 512, 44, 550, 0, 0, 0, 0, 0, 5, 4978, 211, 567, 209, 232, 605, 622,
+    1, 660, 232, 245, 677, 715, 2, 732, 770, 787, 825, 842, 260, 0, 880, 897, 935, 952, 990, 1007,
+    1045, 46, 1062, 0, 0, 0, 0, 0, 23, 4993, 270, 1100, 1117, 0, 1155, 285, 289, 1172, 1210, 5,
+    1227, 1265, 1282, 298, 0, 1320, 1337, 1375, 1392, 1430, 1447, 1485, 69, 1502, 0, 0, 0, 0, 0, 43,
+    5004, 308, 1540, 1557, 1, 315, 329, 325, 0, 1595, 340, 0, 1612, 1650, 1667, 353, 0, 1705, 1722, 1760,
+    1777, 1815, 1832, 99, 1870, 0, 0, 0, 0, 0, 50, 5009, 363, 1887, 363, 0, 1925, 1942, 1980, 1997,
+    101, 2035, 0, 0, 0, 0, 0, 60, 5020, 376, 2052, 2090, 398, 0, 408, 2107, 0, 44, 5035, 97,
+    5046, 147, 408, 418, 2145, 2162, 124, 2200, 0, 0, 0, 0, 0, 78, 5051, 431, 2217, 438, 2255, 139,
+    5062, 155, 5077, 151, 448, 456, 2272, 160, 5088, 167, 452, 470, 465, 486, 2310, 186, 0, 489, 0, 510,
+    0, 5093, 166, 0, 512, 0, 185, 5104, 209, 5119, 212, 0, 523, 0, 522, 539, 535, 545, 2327, 546,
+    0, 0, 5130, 187, 197, 5135, 220, 238, 565, 0, 242, 5146, 247, 5161, 206, 562, 579, 2365, 580, 0,
+    590, 620, 615, 623, 2382, 633, 0, 0, 5172, 210, 252, 5177, 259, 262, 5188, 267, 5203, 277, 295, 0,
+    635, 0, 0, 0, 637, 0, 297, 5214, 304, 5219, 315, 0, 648, 0, 652, 0, 660, 0, 0, 0,
+    675, 0, 0, 0, 683, 0, 4, 0, 683, 0, 319, 5230, 320, 5245, 261, 687, 699, 2420, 705, 0,
+    710, 732, 738, 748, 2437, 753, 0, 0, 5256, 265, 316, 5261, 325, 330, 757, 0, 350, 5272, 352, 5287,
+    359, 0, 6, 755, 7, 0, 781, 0, 803, 782, 815, 0, 802, 0, 0, 0, 825, 803, 826, 0,
+    830, 808, 832, 0, 812, 0, 2475, 2492, 2530, 818, 0, 2547, 817, 0, 2585, 374, 2602, 0, 0, 0,
+    0, 0, 98, 5298, 822, 2640, 825, 0, 370, 5303, 372, 5314, 369, 830, 837, 2657, 837, 0, 833, 842,
+    837, 845, 2695, 845, 0, 0, 5329, 371, 387, 5340, 385, 403, 5345, 414, 5356, 425, 429, 0, 0, 0,
+    877, 2712, 850, 853, 2750, 2767, 882, 2805, 883, 2822, 2860, 881, 2877, 2915, 883, 2932, 2970, 881, 859, 884,
+    0, 863, 0, 2987, 3025, 3042, 870, 0, 3080, 870, 0, 3097, 399, 3135, 0, 0, 0, 0, 0, 105,
+    5371, 874, 3152, 874, 0, 432, 5382, 435, 5387, 426, 871, 881, 3190, 890, 0, 886, 894, 888, 896, 3207,
+    897, 0, 0, 5398, 442, 461, 5413, 440, 458, 5424, 484, 5429, 487, 492, 0, 0, 0, 919, 0, 497,
+    5440, 513, 5455, 462, 895, 909, 3245, 910, 0, 906, 914, 909, 916, 3262, 917, 0, 0, 5466, 481, 497,
+    5471, 522, 533, 938, 0, 3300, 937, 917, 940, 0, 920, 0, 3317, 3355, 3372, 927, 0, 3410, 926, 0,
+    3427, 535, 3465, 0, 0, 0, 0, 0, 115, 5482, 930, 3482, 931, 0, 539, 5497, 540, 5508, 540, 930,
+    946, 3520, 946, 0, 942, 950, 945, 953, 3537, 954, 0, 0, 5513, 571, 572, 5524, 550, 568, 5539, 572,
+    5550, 594, 597, 0, 0, 0, 978, 0, 602, 5555, 605, 5566, 591, 958, 966, 3575, 966, 0, 962, 971,
+    965, 973, 3592, 973, 0, 0, 5581, 607, 626, 5592, 623, 647, 0, 978, 972, 0, 1001, 0, 0, 1000,
+    0, 982, 0, 652, 5597, 657, 5608, 662, 0, 1004, 3630, 1004, 0, 984, 0, 1011, 3647, 1020, 0, 1001,
+    0, 0, 0, 1023, 3685, 1023, 0, 1023, 1002, 1026, 0, 1031, 3702, 1038, 0, 1041, 3740, 1041, 0, 1046,
+    3757, 1047, 0, 0, 1049, 3795, 1050, 0, 0, 1028, 0, 680, 5623, 682, 5634, 689, 0, 1054, 3812, 1056,
+    3850, 1056, 0, 1033, 0, 1062, 3867, 1062, 3905, 1062, 0, 0, 1041, 0, 0, 0, 1070, 3922, 1079, 3960,
+    1079, 0, 0, 1075, 1053, 1077, 0, 1087, 3977, 1088, 4015, 1088, 0, 0, 1094, 4032, 1095, 0, 1101, 4070,
+    1101, 4087, 1102, 0, 0, 1105, 4125, 1106, 4142, 1106, 0, 4180, 1105, 4197, 1107, 0, 4235, 1106, 1085, 1109,
+    0, 1088, 0, 4252, 4290, 4307, 1094, 0, 4345, 1094, 0, 4362, 626, 4400, 0, 0, 0, 0, 0, 133,
+    5639, 1101, 4417, 1110, 0, 700, 5650, 702, 5665, 646, 1106, 1113, 4455, 1113, 0, 1110, 1119, 1114, 1121, 4472,
+    1128, 0, 0, 5676, 699, 701, 5681, 710, 715, 5692, 735, 5707, 737, 744, 0, 0, 0, 0, 0, 1127,
+    4510, 0, 0, 1126, 1137, 1129, 0, 1135, 1142, 1133, 1138, 4527, 1137, 1140, 4565, 4582, 1170, 4620, 1171, 4637,
+    1171, 0, 4675, 1170, 4692, 1171, 0, 4730, 1173, 1160, 1183, 0, 1162, 0, 4747, 4785, 4802, 1168, 0, 4840,
+    1168, 0, 4857, 759, 4895, 0, 0, 0, 0, 0, 153, 5718, 1173, 4912, 1174, 0, 755, 5723, 757, 5734,
+    754, 1170, 1184, 4950, 1185, 0, 1181, 1189, 1184, 1191, 4967, 1192, 0, 0, 5749, 756, 772, 5760, 770, 788,
+    5765, 799, 5776, 810, 814, 0, 0, 0, 0, 1191, 0, 1198, 1192, 0, 1196, 0, 1206, 1197, 0, 1209,
+    1199, 0, 1201, 1208, 0, 0, 0, 1226, 1, 0,
+)
+
+ACTION_CHECK = (
+    905, 0, 908, -1, 9, 8, 9, 13, 60, 66, 9, 93, 99, 9, 2, 124, 128, 9, 9, 306,
+    342, 14, 344, 14, 52, 52, 52, 14, 6, 9, 14, 9, 6, 9, 14, 14, 9, 9, 9, 9,
+    9, 9, 88, 88, 88, 2, 14, 1, 14, 45, 14, 81, 3, 14, 14, 14, 14, 14, 14, 17,
+    4, 17, 119, 119, 119, 17, 177, 177, 17, 150, 150, 150, 17, 17, 112, 45, 18, 81, 18, 167,
+    167, 167, 18, 5, 17, 18, 17, 7, 17, 18, 18, 17, 17, 17, 17, 17, 17, 193, 193, 193,
+    112, 18, 10, 18, 143, 18, 160, 11, 18, 18, 18, 18, 18, 18, 21, 12, 21, 382, 382, 382,
+    21, 179, 179, 21, 459, 459, 459, 21, 21, 186, 143, 22, 160, 22, 548, 548, 548, 22, 15, 21,
+    22, 21, 16, 21, 22, 22, 21, 21, 21, 21, 21, 21, 759, 759, 759, 186, 22, 19, 22, 20,
+    22, 199, 199, 22, 22, 22, 22, 22, 22, 23, 24, 23, 850, 850, 850, 23, 25, 181, 23, 201,
+    201, 203, 23, 23, 207, 207, 26, 29, 26, 181, 222, 222, 26, 203, 23, 26, 23, 209, 23, 26,
+    26, 23, 23, 23, 23, 23, 23, 226, 226, 209, 30, 26, 33, 26, 38, 26, 215, 243, 26, 26,
+    26, 26, 26, 26, 27, 39, 27, 244, 215, 243, 27, 228, 228, 27, 230, 230, 254, 27, 27, 244,
+    269, 28, 54, 28, 246, 246, 56, 28, 254, 27, 28, 27, 269, 27, 28, 28, 27, 27, 27, 27,
+    27, 27, 247, 247, 250, 250, 28, 57, 28, 62, 28, 252, 252, 28, 28, 28, 28, 28, 28, 31,
+    63, 31, 270, 272, 272, 31, 273, 273, 31, 275, 275, 314, 31, 31, 270, 329, 32, 72, 32, 277,
+    277, 90, 32, 314, 31, 32, 31, 329, 31, 32, 32, 31, 31, 31, 31, 31, 31, 278, 278, 286,
+    286, 32, 95, 32, 96, 32, 288, 288, 32, 32, 32, 32, 32, 32, 35, 103, 35, 290, 290, 121,
+    35, 310, 310, 35, 312, 312, 330, 35, 35, 332, 332, 36, 125, 36, 333, 333, 126, 36, 330, 35,
+    36, 35, 127, 35, 36, 36, 35, 35, 35, 35, 35, 35, 336, 336, 338, 338, 36, 130, 36, 375,
+    36, 340, 340, 36, 36, 36, 36, 36, 36, 37, 135, 37, 388, 388, 152, 37, 390, 390, 37, 392,
+    154, 407, 37, 37, 452, 375, 40, 169, 40, 410, 410, 392, 40, 407, 37, 40, 37, 408, 37, 40,
+    40, 37, 37, 37, 37, 37, 37, 411, 411, 408, 452, 40, 172, 40, 174, 40, 413, 413, 40, 40,
+    40, 40, 40, 40, 41, 182, 41, 415, 415, 183, 41, 416, 416, 41, 465, 465, 469, 41, 41, 467,
+    467, 42, 195, 42, 487, 487, 197, 42, 469, 41, 42, 41, 484, 41, 42, 42, 41, 41, 41, 41,
+    41, 41, 488, 488, 484, 204, 42, 205, 42, 210, 42, 485, 503, 42, 42, 42, 42, 42, 42, 43,
+    211, 43, 212, 485, 503, 43, 490, 490, 43, 492, 492, 518, 43, 43, 493, 493, 44, 213, 44, 499,
+    499, 217, 44, 518, 43, 44, 43, 519, 43, 44, 44, 43, 43, 43, 43, 43, 43, 501, 501, 519,
+    541, 44, 219, 44, 224, 44, 521, 521, 44, 44, 44, 44, 44, 44, 46, 232, 46, 522, 522, 234,
+    46, 554, 554, 46, 556, 556, 541, 46, 46, 235, 558, 55, 236, 55, 576, 576, 237, 55, 239, 46,
+    55, 46, 558, 46, 55, 55, 46, 46, 46, 46, 46, 46, 577, 577, 579, 579, 55, 248, 55, 255,
+    55, 573, 574, 55, 55, 55, 55, 55, 55, 58, 256, 58, 258, 573, 574, 58, 581, 581, 58, 582,
+    582, 592, 58, 58, 588, 588, 59, 260, 59, 590, 590, 752, 59, 592, 58, 59, 58, 607, 58, 59,
+    59, 58, 58, 58, 58, 58, 58, 610, 610, 607, 261, 59, 262, 59, 263, 59, 608, 752, 59, 59,
+    59, 59, 59, 59, 61, 265, 61, 280, 608, 284, 61, 611, 611, 61, 623, 623, 769, 61, 61, 625,
+    625, 64, 292, 64, 627, 627, 294, 64, 769, 61, 64, 61, 296, 61, 64, 64, 61, 61, 61, 61,
+    61, 61, 671, 671, 673, 673, 64, 300, 64, 304, 64, 675, 675, 64, 64, 64, 64, 64, 64, 65,
+    308, 65, 765, 765, 315, 65, 767, 767, 65, 784, 316, 785, 65, 65, 787, 787, 67, 318, 67, 788,
+    788, 784, 67, 785, 65, 67, 65, 320, 65, 67, 67, 65, 65, 65, 65, 65, 65, 790, 790, 792,
+    792, 67, 321, 67, 843, 67, 793, 793, 67, 67, 67, 67, 67, 67, 68, 322, 68, 856, 856, 323,
+    68, 858, 858, 68, 860, 325, 875, 68, 68, 334, 843, 69, 343, 69, 878, 878, 860, 69, 875, 68,
+    69, 68, 876, 68, 69, 69, 68, 68, 68, 68, 68, 68, 879, 879, 876, 346, 69, 348, 69, 349,
+    69, 881, 881, 69, 69, 69, 69, 69, 69, 70, 350, 70, 883, 883, 352, 70, 884, 884, 70, 356,
+    357, 358, 70, 70, 360, 361, 71, 362, 71, 364, 369, 372, 71, 384, 70, 71, 70, 386, 70, 71,
+    71, 70, 70, 70, 70, 70, 70, 393, 394, 396, 398, 71, 399, 71, 400, 71, 401, 403, 71, 71,
+    71, 71, 71, 71, 74, 420, 74, 422, 423, 426, 74, 428, 431, 74, 434, 437, 438, 74, 74, 439,
+    441, 75, 446, 75, 449, 461, 463, 75, 470, 74, 75, 74, 471, 74, 75, 75, 74, 74, 74, 74,
+    74, 74, 473, 475, 476, 477, 75, 478, 75, 480, 75, 497, 504, 75, 75, 75, 75, 75, 75, 76,
+    505, 76, 507, 509, 510, 76, 511, 512, 76, 514, 523, 526, 76, 76, 527, 528, 77, 530, 77, 535,
+    538, 550, 77, 552, 76, 77, 76, 559, 76, 77, 77, 76, 76, 76, 76, 76, 76, 560, 562, 564,
+    565, 77, 566, 77, 567, 77, 569, 586, 77, 77, 77, 77, 77, 77, 78, 593, 78, 594, 596, 598,
+    78, 599, 600, 78, 601, 603, 613, 78, 78, 614, 616, 79, 619, 79, 621, 629, 631, 79, 633, 78,
+    79, 78, 635, 78, 79, 79, 78, 78, 78, 78, 78, 78, 637, 639, 643, 645, 79, 647, 79, 648,
+    79, 649, 651, 79, 79, 79, 79, 79, 79, 80, 653, 80, 655, 657, 659, 80, 661, 664, 80, 666,
+    669, 677, 80, 80, 679, 681, 82, 683, 82, 685, 687, 689, 82, 692, 80, 82, 80, 696, 80, 82,
+    82, 80, 80, 80, 80, 80, 80, 698, 700, 703, 704, 82, 705, 82, 707, 82, 709, 711, 82, 82,
+    82, 82, 82, 82, 91, 714, 91, 716, 718, 720, 91, 722, 725, 91, 727, 729, 732, 91, 91, 734,
+    737, 92, 738, 92, 739, 741, 746, 92, 749, 91, 92, 91, 761, 91, 92, 92, 91, 91, 91, 91,
+    91, 91, 763, 770, 771, 773, 92, 775, 92, 776, 92, 777, 778, 92, 92, 92, 92, 92, 92, 94,
+    780, 94, 799, 803, 804, 94, 805, 807, 94, 808, 809, 810, 94, 94, 812, 813, 97, 816, 97, 818,
+    820, 823, 97, 825, 94, 97, 94, 828, 94, 97, 97, 94, 94, 94, 94, 94, 94, 829, 830, 832,
+    837, 97, 840, 97, 852, 97, 854, 861, 97, 97, 97, 97, 97, 97, 98, 862, 98, 864, 866, 867,
+    98, 868, 869, 98, 871, 889, 891, 98, 98, 892, 894, 100, 896, 100, 897, 899, 900, 100, 902, 98,
+    100, 98, 903, 98, 100, 100, 98, 98, 98, 98, 98, 98, 907, -1, -1, -1, 100, -1, 100, -1,
+    100, -1, -1, 100, 100, 100, 100, 100, 100, 101, -1, 101, -1, -1, -1, 101, -1, -1, 101, -1,
+    -1, -1, 101, 101, -1, -1, 102, -1, 102, -1, -1, -1, 102, -1, 101, 102, 101, -1, 101, 102,
+    102, 101, 101, 101, 101, 101, 101, -1, -1, -1, -1, 102, -1, 102, -1, 102, -1, -1, 102, 102,
+    102, 102, 102, 102, 105, -1, 105, -1, -1, -1, 105, -1, -1, 105, -1, -1, -1, 105, 105, -1,
+    -1, 106, -1, 106, -1, -1, -1, 106, -1, 105, 106, 105, -1, 105, 106, 106, 105, 105, 105, 105,
+    105, 105, -1, -1, -1, -1, 106, -1, 106, -1, 106, -1, -1, 106, 106, 106, 106, 106, 106, 107,
+    -1, 107, -1, -1, -1, 107, -1, -1, 107, -1, -1, -1, 107, 107, -1, -1, 108, -1, 108, -1,
+    -1, -1, 108, -1, 107, 108, 107, -1, 107, 108, 108, 107, 107, 107, 107, 107, 107, -1, -1, -1,
+    -1, 108, -1, 108, -1, 108, -1, -1, 108, 108, 108, 108, 108, 108, 109, -1, 109, -1, -1, -1,
+    109, -1, -1, 109, -1, -1, -1, 109, 109, -1, -1, 110, -1, 110, -1, -1, -1, 110, -1, 109,
+    110, 109, -1, 109, 110, 110, 109, 109, 109, 109, 109, 109, -1, -1, -1, -1, 110, -1, 110, -1,
+    110, -1, -1, 110, 110, 110, 110, 110, 110, 111, -1, 111, -1, -1, -1, 111, -1, -1, 111, -1,
+    -1, -1, 111, 111, -1, -1, 113, -1, 113, -1, -1, -1, 113, -1, 111, 113, 111, -1, 111, 113,
+    113, 111, 111, 111, 111, 111, 111, -1, -1, -1, -1, 113, -1, 113, -1, 113, -1, -1, 113, 113,
+    113, 113, 113, 113, 122, -1, 122, -1, -1, -1, 122, -1, -1, 122, -1, -1, -1, 122, 122, -1,
+    -1, 123, -1, 123, -1, -1, -1, 123, -1, 122, 123, 122, -1, 122, 123, 123, 122, 122, 122, 122,
+    122, 122, -1, -1, -1, -1, 123, -1, 123, -1, 123, -1, -1, 123, 123, 123, 123, 123, 123, 129,
+    -1, 129, -1, -1, -1, 129, -1, -1, 129, -1, -1, -1, 129, 129, -1, -1, 132, -1, 132, -1,
+    -1, -1, 132, -1, 129, 132, 129, -1, 129, 132, 132, 129, 129, 129, 129, 129, 129, -1, -1, -1,
+    -1, 132, -1, 132, -1, 132, -1, -1, 132, 132, 132, 132, 132, 132, 133, -1, 133, -1, -1, -1,
+    133, -1, -1, 133, -1, -1, -1, 133, 133, -1, -1, 134, -1, 134, -1, -1, -1, 134, -1, 133,
+    134, 133, -1, 133, 134, 134, 133, 133, 133, 133, 133, 133, -1, -1, -1, -1, 134, -1, 134, -1,
+    134, -1, -1, 134, 134, 134, 134, 134, 134, 137, -1, 137, -1, -1, -1, 137, -1, -1, 137, -1,
+    -1, -1, 137, 137, -1, -1, 138, -1, 138, -1, -1, -1, 138, -1, 137, 138, 137, -1, 137, 138,
+    138, 137, 137, 137, 137, 137, 137, -1, -1, -1, -1, 138, -1, 138, -1, 138, -1, -1, 138, 138,
+    138, 138, 138, 138, 139, -1, 139, -1, -1, -1, 139, -1, -1, 139, -1, -1, -1, 139, 139, -1,
+    -1, 140, -1, 140, -1, -1, -1, 140, -1, 139, 140, 139, -1, 139, 140, 140, 139, 139, 139, 139,
+    139, 139, -1, -1, -1, -1, 140, -1, 140, -1, 140, -1, -1, 140, 140, 140, 140, 140, 140, 141,
+    -1, 141, -1, -1, -1, 141, -1, -1, 141, -1, -1, -1, 141, 141, -1, -1, 142, -1, 142, -1,
+    -1, -1, 142, -1, 141, 142, 141, -1, 141, 142, 142, 141, 141, 141, 141, 141, 141, -1, -1, -1,
+    -1, 142, -1, 142, -1, 142, -1, -1, 142, 142, 142, 142, 142, 142, 144, -1, 144, -1, -1, -1,
+    144, -1, -1, 144, -1, -1, -1, 144, 144, -1, -1, 153, -1, 153, -1, -1, -1, 153, -1, 144,
+    153, 144, -1, 144, 153, 153, 144, 144, 144, 144, 144, 144, -1, -1, -1, -1, 153, -1, 153, -1,
+    153, -1, -1, 153, 153, 153, 153, 153, 153, 156, -1, 156, -1, -1, -1, 156, -1, -1, 156, -1,
+    -1, -1, 156, 156, -1, -1, 157, -1, 157, -1, -1, -1, 157, -1, 156, 157, 156, -1, 156, 157,
+    157, 156, 156, 156, 156, 156, 156, -1, -1, -1, -1, 157, -1, 157, -1, 157, -1, -1, 157, 157,
+    157, 157, 157, 157, 158, -1, 158, -1, -1, -1, 158, -1, -1, 158, -1, -1, -1, 158, 158, -1,
+    -1, 159, -1, 159, -1, -1, -1, 159, -1, 158, 159, 158, -1, 158, 159, 159, 158, 158, 158, 158,
+    158, 158, -1, -1, -1, -1, 159, -1, 159, -1, 159, -1, -1, 159, 159, 159, 159, 159, 159, 161,
+    -1, 161, -1, -1, -1, 161, -1, -1, 161, -1, -1, -1, 161, 161, -1, -1, 170, -1, 170, -1,
+    -1, -1, 170, -1, 161, 170, 161, -1, 161, 170, 170, 161, 161, 161, 161, 161, 161, -1, -1, -1,
+    -1, 170, -1, 170, -1, 170, -1, -1, 170, 170, 170, 170, 170, 170, 171, -1, 171, -1, -1, -1,
+    171, -1, -1, 171, -1, -1, -1, 171, 171, -1, -1, 175, -1, 175, -1, -1, -1, 175, -1, 171,
+    175, 171, -1, 171, 175, 175, 171, 171, 171, 171, 171, 171, -1, -1, -1, -1, 175, -1, 175, -1,
+    175, -1, -1, 175, 175, 175, 175, 175, 175, 184, -1, 184, -1, -1, -1, 184, -1, -1, 184, -1,
+    -1, -1, 184, 184, -1, -1, 185, -1, 185, -1, -1, -1, 185, -1, 184, 185, 184, -1, 184, 185,
+    185, 184, 184, 184, 184, 184, 184, -1, -1, -1, -1, 185, -1, 185, -1, 185, -1, -1, 185, 185,
+    185, 185, 185, 185, 187, -1, 187, -1, -1, -1, 187, -1, -1, 187, -1, -1, -1, 187, 187, -1,
+    -1, 196, -1, 196, -1, -1, -1, 196, -1, 187, 196, 187, -1, 187, 196, 196, 187, 187, 187, 187,
+    187, 187, -1, -1, -1, -1, 196, -1, 196, -1, 196, -1, -1, 196, 196, 196, 196, 196, 196, 198,
+    -1, 198, -1, -1, -1, 198, -1, -1, 198, -1, -1, -1, 198, 198, -1, -1, 206, -1, 206, -1,
+    -1, -1, 206, -1, 198, 206, 198, -1, 198, 206, 206, 198, 198, 198, 198, 198, 198, -1, -1, -1,
+    -1, 206, -1, 206, -1, 206, -1, -1, 206, 206, 206, 206, 206, 206, 214, -1, 214, -1, -1, -1,
+    214, -1, -1, 214, -1, -1, -1, 214, 214, -1, -1, 238, -1, 238, -1, -1, -1, 238, -1, 214,
+    238, 214, -1, 214, 238, 238, 214, 214, 214, 214, 214, 214, -1, -1, -1, -1, 238, -1, 238, -1,
+    238, -1, -1, 238, 238, 238, 238, 238, 238, 257, -1, 257, -1, -1, -1, 257, -1, -1, 257, -1,
+    -1, -1, 257, 257, -1, -1, 264, -1, 264, -1, -1, -1, 264, -1, 257, 264, 257, -1, 257, 264,
+    264, 257, 257, 257, 257, 257, 257, -1, -1, -1, -1, 264, -1, 264, -1, 264, -1, -1, 264, 264,
+    264, 264, 264, 264, 317, -1, 317, -1, -1, -1, 317, -1, -1, 317, -1, -1, -1, 317, 317, -1,
+    -1, 324, -1, 324, -1, -1, -1, 324, -1, 317, 324, 317, -1, 317, 324, 324, 317, 317, 317, 317,
+    317, 317, -1, -1, -1, -1, 324, -1, 324, -1, 324, -1, -1, 324, 324, 324, 324, 324, 324, 366,
+    -1, 366, -1, -1, -1, 366, -1, -1, 366, -1, -1, -1, 366, 366, -1, -1, 367, -1, 367, -1,
+    -1, -1, 367, -1, 366, 367, 366, -1, 366, 367, 367, 366, 366, 366, 366, 366, 366, -1, -1, -1,
+    -1, 367, -1, 367, -1, 367, -1, -1, 367, 367, 367, 367, 367, 367, 368, -1, 368, -1, -1, -1,
+    368, -1, -1, 368, -1, -1, -1, 368, 368, -1, -1, 371, -1, 371, -1, -1, -1, 371, -1, 368,
+    371, 368, -1, 368, 371, 371, 368, 368, 368, 368, 368, 368, -1, -1, -1, -1, 371, -1, 371, -1,
+    371, -1, -1, 371, 371, 371, 371, 371, 371, 374, -1, 374, -1, -1, -1, 374, -1, -1, 374, -1,
+    -1, -1, 374, 374, -1, -1, 376, -1, 376, -1, -1, -1, 376, -1, 374, 376, 374, -1, 374, 376,
+    376, 374, 374, 374, 374, 374, 374, -1, -1, -1, -1, 376, -1, 376, -1, 376, -1, -1, 376, 376,
+    376, 376, 376, 376, 385, -1, 385, -1, -1, -1, 385, -1, -1, 385, -1, -1, -1, 385, 385, -1,
+    -1, 395, -1, 395, -1, -1, -1, 395, -1, 385, 395, 385, -1, 385, 395, 395, 385, 385, 385, 385,
+    385, 385, -1, -1, -1, -1, 395, -1, 395, -1, 395, -1, -1, 395, 395, 395, 395, 395, 395, 402,
+    -1, 402, -1, -1, -1, 402, -1, -1, 402, -1, -1, -1, 402, 402, -1, -1, 421, -1, 421, -1,
+    -1, -1, 421, -1, 402, 421, 402, -1, 402, 421, 421, 402, 402, 402, 402, 402, 402, -1, -1, -1,
+    -1, 421, -1, 421, -1, 421, -1, -1, 421, 421, 421, 421, 421, 421, 424, -1, 424, -1, -1, -1,
+    424, -1, -1, 424, -1, -1, -1, 424, 424, -1, -1, 425, -1, 425, -1, -1, -1, 425, -1, 424,
+    425, 424, -1, 424, 425, 425, 424, 424, 424, 424, 424, 424, -1, -1, -1, -1, 425, -1, 425, -1,
+    425, -1, -1, 425, 425, 425, 425, 425, 425, 427, -1, 427, -1, -1, -1, 427, -1, -1, 427, -1,
+    -1, -1, 427, 427, -1, -1, 429, -1, 429, -1, -1, -1, 429, -1, 427, 429, 427, -1, 427, 429,
+    429, 427, 427, 427, 427, 427, 427, -1, -1, -1, -1, 429, -1, 429, -1, 429, -1, -1, 429, 429,
+    429, 429, 429, 429, 430, -1, 430, -1, -1, -1, 430, -1, -1, 430, -1, -1, -1, 430, 430, -1,
+    -1, 432, -1, 432, -1, -1, -1, 432, -1, 430, 432, 430, -1, 430, 432, 432, 430, 430, 430, 430,
+    430, 430, -1, -1, -1, -1, 432, -1, 432, -1, 432, -1, -1, 432, 432, 432, 432, 432, 432, 433,
+    -1, 433, -1, -1, -1, 433, -1, -1, 433, -1, -1, -1, 433, 433, -1, -1, 435, -1, 435, -1,
+    -1, -1, 435, -1, 433, 435, 433, -1, 433, 435, 435, 433, 433, 433, 433, 433, 433, -1, -1, -1,
+    -1, 435, -1, 435, -1, 435, -1, -1, 435, 435, 435, 435, 435, 435, 436, -1, 436, -1, -1, -1,
+    436, -1, -1, 436, -1, -1, -1, 436, 436, -1, -1, 443, -1, 443, -1, -1, -1, 443, -1, 436,
+    443, 436, -1, 436, 443, 443, 436, 436, 436, 436, 436, 436, -1, -1, -1, -1, 443, -1, 443, -1,
+    443, -1, -1, 443, 443, 443, 443, 443, 443, 444, -1, 444, -1, -1, -1, 444, -1, -1, 444, -1,
+    -1, -1, 444, 444, -1, -1, 445, -1, 445, -1, -1, -1, 445, -1, 444, 445, 444, -1, 444, 445,
+    445, 444, 444, 444, 444, 444, 444, -1, -1, -1, -1, 445, -1, 445, -1, 445, -1, -1, 445, 445,
+    445, 445, 445, 445, 448, -1, 448, -1, -1, -1, 448, -1, -1, 448, -1, -1, -1, 448, 448, -1,
+    -1, 451, -1, 451, -1, -1, -1, 451, -1, 448, 451, 448, -1, 448, 451, 451, 448, 448, 448, 448,
+    448, 448, -1, -1, -1, -1, 451, -1, 451, -1, 451, -1, -1, 451, 451, 451, 451, 451, 451, 453,
+    -1, 453, -1, -1, -1, 453, -1, -1, 453, -1, -1, -1, 453, 453, -1, -1, 462, -1, 462, -1,
+    -1, -1, 462, -1, 453, 462, 453, -1, 453, 462, 462, 453, 453, 453, 453, 453, 453, -1, -1, -1,
+    -1, 462, -1, 462, -1, 462, -1, -1, 462, 462, 462, 462, 462, 462, 472, -1, 472, -1, -1, -1,
+    472, -1, -1, 472, -1, -1, -1, 472, 472, -1, -1, 479, -1, 479, -1, -1, -1, 479, -1, 472,
+    479, 472, -1, 472, 479, 479, 472, 472, 472, 472, 472, 472, -1, -1, -1, -1, 479, -1, 479, -1,
+    479, -1, -1, 479, 479, 479, 479, 479, 479, 506, -1, 506, -1, -1, -1, 506, -1, -1, 506, -1,
+    -1, -1, 506, 506, -1, -1, 513, -1, 513, -1, -1, -1, 513, -1, 506, 513, 506, -1, 506, 513,
+    513, 506, 506, 506, 506, 506, 506, -1, -1, -1, -1, 513, -1, 513, -1, 513, -1, -1, 513, 513,
+    513, 513, 513, 513, 525, -1, 525, -1, -1, -1, 525, -1, -1, 525, -1, -1, -1, 525, 525, -1,
+    -1, 532, -1, 532, -1, -1, -1, 532, -1, 525, 532, 525, -1, 525, 532, 532, 525, 525, 525, 525,
+    525, 525, -1, -1, -1, -1, 532, -1, 532, -1, 532, -1, -1, 532, 532, 532, 532, 532, 532, 533,
+    -1, 533, -1, -1, -1, 533, -1, -1, 533, -1, -1, -1, 533, 533, -1, -1, 534, -1, 534, -1,
+    -1, -1, 534, -1, 533, 534, 533, -1, 533, 534, 534, 533, 533, 533, 533, 533, 533, -1, -1, -1,
+    -1, 534, -1, 534, -1, 534, -1, -1, 534, 534, 534, 534, 534, 534, 537, -1, 537, -1, -1, -1,
+    537, -1, -1, 537, -1, -1, -1, 537, 537, -1, -1, 540, -1, 540, -1, -1, -1, 540, -1, 537,
+    540, 537, -1, 537, 540, 540, 537, 537, 537, 537, 537, 537, -1, -1, -1, -1, 540, -1, 540, -1,
+    540, -1, -1, 540, 540, 540, 540, 540, 540, 542, -1, 542, -1, -1, -1, 542, -1, -1, 542, -1,
+    -1, -1, 542, 542, -1, -1, 551, -1, 551, -1, -1, -1, 551, -1, 542, 551, 542, -1, 542, 551,
+    551, 542, 542, 542, 542, 542, 542, -1, -1, -1, -1, 551, -1, 551, -1, 551, -1, -1, 551, 551,
+    551, 551, 551, 551, 561, -1, 561, -1, -1, -1, 561, -1, -1, 561, -1, -1, -1, 561, 561, -1,
+    -1, 568, -1, 568, -1, -1, -1, 568, -1, 561, 568, 561, -1, 561, 568, 568, 561, 561, 561, 561,
+    561, 561, -1, -1, -1, -1, 568, -1, 568, -1, 568, -1, -1, 568, 568, 568, 568, 568, 568, 595,
+    -1, 595, -1, -1, -1, 595, -1, -1, 595, -1, -1, -1, 595, 595, -1, -1, 602, -1, 602, -1,
+    -1, -1, 602, -1, 595, 602, 595, -1, 595, 602, 602, 595, 595, 595, 595, 595, 595, -1, -1, -1,
+    -1, 602, -1, 602, -1, 602, -1, -1, 602, 602, 602, 602, 602, 602, 630, -1, 630, -1, -1, -1,
+    630, -1, -1, 630, -1, -1, -1, 630, 630, -1, -1, 636, -1, 636, -1, -1, -1, 636, -1, 630,
+    636, 630, -1, 630, 636, 636, 630, 630, 630, 630, 630, 630, -1, -1, -1, -1, 636, -1, 636, -1,
+    636, -1, -1, 636, 636, 636, 636, 636, 636, 644, -1, 644, -1, -1, -1, 644, -1, -1, 644, -1,
+    -1, -1, 644, 644, -1, -1, 652, -1, 652, -1, -1, -1, 652, -1, 644, 652, 644, -1, 644, 652,
+    652, 644, 644, 644, 644, 644, 644, -1, -1, -1, -1, 652, -1, 652, -1, 652, -1, -1, 652, 652,
+    652, 652, 652, 652, 656, -1, 656, -1, -1, -1, 656, -1, -1, 656, -1, -1, -1, 656, 656, -1,
+    -1, 660, -1, 660, -1, -1, -1, 660, -1, 656, 660, 656, -1, 656, 660, 660, 656, 656, 656, 656,
+    656, 656, -1, -1, -1, -1, 660, -1, 660, -1, 660, -1, -1, 660, 660, 660, 660, 660, 660, 665,
+    -1, 665, -1, -1, -1, 665, -1, -1, 665, -1, -1, -1, 665, 665, -1, -1, 678, -1, 678, -1,
+    -1, -1, 678, -1, 665, 678, 665, -1, 665, 678, 678, 665, 665, 665, 665, 665, 665, -1, -1, -1,
+    -1, 678, -1, 678, -1, 678, -1, -1, 678, 678, 678, 678, 678, 678, 680, -1, 680, -1, -1, -1,
+    680, -1, -1, 680, -1, -1, -1, 680, 680, -1, -1, 686, -1, 686, -1, -1, -1, 686, -1, 680,
+    686, 680, -1, 680, 686, 686, 680, 680, 680, 680, 680, 680, -1, -1, -1, -1, 686, -1, 686, -1,
+    686, -1, -1, 686, 686, 686, 686, 686, 686, 688, -1, 688, -1, -1, -1, 688, -1, -1, 688, -1,
+    -1, -1, 688, 688, -1, -1, 697, -1, 697, -1, -1, -1, 697, -1, 688, 697, 688, -1, 688, 697,
+    697, 688, 688, 688, 688, 688, 688, -1, -1, -1, -1, 697, -1, 697, -1, 697, -1, -1, 697, 697,
+    697, 697, 697, 697, 699, -1, 699, -1, -1, -1, 699, -1, -1, 699, -1, -1, -1, 699, 699, -1,
+    -1, 708, -1, 708, -1, -1, -1, 708, -1, 699, 708, 699, -1, 699, 708, 708, 699, 699, 699, 699,
+    699, 699, -1, -1, -1, -1, 708, -1, 708, -1, 708, -1, -1, 708, 708, 708, 708, 708, 708, 710,
+    -1, 710, -1, -1, -1, 710, -1, -1, 710, -1, -1, -1, 710, 710, -1, -1, 715, -1, 715, -1,
+    -1, -1, 715, -1, 710, 715, 710, -1, 710, 715, 715, 710, 710, 710, 710, 710, 710, -1, -1, -1,
+    -1, 715, -1, 715, -1, 715, -1, -1, 715, 715, 715, 715, 715, 715, 719, -1, 719, -1, -1, -1,
+    719, -1, -1, 719, -1, -1, -1, 719, 719, -1, -1, 721, -1, 721, -1, -1, -1, 721, -1, 719,
+    721, 719, -1, 719, 721, 721, 719, 719, 719, 719, 719, 719, -1, -1, -1, -1, 721, -1, 721, -1,
+    721, -1, -1, 721, 721, 721, 721, 721, 721, 726, -1, 726, -1, -1, -1, 726, -1, -1, 726, -1,
+    -1, -1, 726, 726, -1, -1, 728, -1, 728, -1, -1, -1, 728, -1, 726, 728, 726, -1, 726, 728,
+    728, 726, 726, 726, 726, 726, 726, -1, -1, -1, -1, 728, -1, 728, -1, 728, -1, -1, 728, 728,
+    728, 728, 728, 728, 731, -1, 731, -1, -1, -1, 731, -1, -1, 731, -1, -1, -1, 731, 731, -1,
+    -1, 733, -1, 733, -1, -1, -1, 733, -1, 731, 733, 731, -1, 731, 733, 733, 731, 731, 731, 731,
+    731, 731, -1, -1, -1, -1, 733, -1, 733, -1, 733, -1, -1, 733, 733, 733, 733, 733, 733, 736,
+    -1, 736, -1, -1, -1, 736, -1, -1, 736, -1, -1, -1, 736, 736, -1, -1, 743, -1, 743, -1,
+    -1, -1, 743, -1, 736, 743, 736, -1, 736, 743, 743, 736, 736, 736, 736, 736, 736, -1, -1, -1,
+    -1, 743, -1, 743, -1, 743, -1, -1, 743, 743, 743, 743, 743, 743, 744, -1, 744, -1, -1, -1,
+    744, -1, -1, 744, -1, -1, -1, 744, 744, -1, -1, 745, -1, 745, -1, -1, -1, 745, -1, 744,
+    745, 744, -1, 744, 745, 745, 744, 744, 744, 744, 744, 744, -1, -1, -1, -1, 745, -1, 745, -1,
+    745, -1, -1, 745, 745, 745, 745, 745, 745, 748, -1, 748, -1, -1, -1, 748, -1, -1, 748, -1,
+    -1, -1, 748, 748, -1, -1, 751, -1, 751, -1, -1, -1, 751, -1, 748, 751, 748, -1, 748, 751,
+    751, 748, 748, 748, 748, 748, 748, -1, -1, -1, -1, 751, -1, 751, -1, 751, -1, -1, 751, 751,
+    751, 751, 751, 751, 753, -1, 753, -1, -1, -1, 753, -1, -1, 753, -1, -1, -1, 753, 753, -1,
+    -1, 762, -1, 762, -1, -1, -1, 762, -1, 753, 762, 753, -1, 753, 762, 762, 753, 753, 753, 753,
+    753, 753, -1, -1, -1, -1, 762, -1, 762, -1, 762, -1, -1, 762, 762, 762, 762, 762, 762, 772,
+    -1, 772, -1, -1, -1, 772, -1, -1, 772, -1, -1, -1, 772, 772, -1, -1, 779, -1, 779, -1,
+    -1, -1, 779, -1, 772, 779, 772, -1, 772, 779, 779, 772, 772, 772, 772, 772, 772, -1, -1, -1,
+    -1, 779, -1, 779, -1, 779, -1, -1, 779, 779, 779, 779, 779, 779, 800, -1, 800, -1, -1, -1,
+    800, -1, -1, 800, -1, -1, -1, 800, 800, -1, -1, 811, -1, 811, -1, -1, -1, 811, -1, 800,
+    811, 800, -1, 800, 811, 811, 800, 800, 800, 800, 800, 800, -1, -1, -1, -1, 811, -1, 811, -1,
+    811, -1, -1, 811, 811, 811, 811, 811, 811, 814, -1, 814, -1, -1, -1, 814, -1, -1, 814, -1,
+    -1, -1, 814, 814, -1, -1, 815, -1, 815, -1, -1, -1, 815, -1, 814, 815, 814, -1, 814, 815,
+    815, 814, 814, 814, 814, 814, 814, -1, -1, -1, -1, 815, -1, 815, -1, 815, -1, -1, 815, 815,
+    815, 815, 815, 815, 817, -1, 817, -1, -1, -1, 817, -1, -1, 817, -1, -1, -1, 817, 817, -1,
+    -1, 819, -1, 819, -1, -1, -1, 819, -1, 817, 819, 817, -1, 817, 819, 819, 817, 817, 817, 817,
+    817, 817, -1, -1, -1, -1, 819, -1, 819, -1, 819, -1, -1, 819, 819, 819, 819, 819, 819, 822,
+    -1, 822, -1, -1, -1, 822, -1, -1, 822, -1, -1, -1, 822, 822, -1, -1, 824, -1, 824, -1,
+    -1, -1, 824, -1, 822, 824, 822, -1, 822, 824, 824, 822, 822, 822, 822, 822, 822, -1, -1, -1,
+    -1, 824, -1, 824, -1, 824, -1, -1, 824, 824, 824, 824, 824, 824, 827, -1, 827, -1, -1, -1,
+    827, -1, -1, 827, -1, -1, -1, 827, 827, -1, -1, 834, -1, 834, -1, -1, -1, 834, -1, 827,
+    834, 827, -1, 827, 834, 834, 827, 827, 827, 827, 827, 827, -1, -1, -1, -1, 834, -1, 834, -1,
+    834, -1, -1, 834, 834, 834, 834, 834, 834, 835, -1, 835, -1, -1, -1, 835, -1, -1, 835, -1,
+    -1, -1, 835, 835, -1, -1, 836, -1, 836, -1, -1, -1, 836, -1, 835, 836, 835, -1, 835, 836,
+    836, 835, 835, 835, 835, 835, 835, -1, -1, -1, -1, 836, -1, 836, -1, 836, -1, -1, 836, 836,
+    836, 836, 836, 836, 839, -1, 839, -1, -1, -1, 839, -1, -1, 839, -1, -1, -1, 839, 839, -1,
+    -1, 842, -1, 842, -1, -1, -1, 842, -1, 839, 842, 839, -1, 839, 842, 842, 839, 839, 839, 839,
+    839, 839, -1, -1, -1, -1, 842, -1, 842, -1, 842, -1, -1, 842, 842, 842, 842, 842, 842, 844,
+    -1, 844, -1, -1, -1, 844, -1, -1, 844, -1, -1, -1, 844, 844, -1, -1, 853, -1, 853, -1,
+    -1, -1, 853, -1, 844, 853, 844, -1, 844, 853, 853, 844, 844, 844, 844, 844, 844, -1, -1, -1,
+    -1, 853, -1, 853, -1, 853, -1, -1, 853, 853, 853, 853, 853, 853, 863, -1, 863, -1, -1, -1,
+    863, -1, -1, 863, -1, -1, -1, 863, 863, -1, -1, 870, -1, 870, -1, -1, -1, 870, -1, 863,
+    870, 863, -1, 863, 870, 870, 863, 863, 863, 863, 863, 863, -1, -1, -1, 53, 870, -1, 870, -1,
+    870, -1, -1, 870, 870, 870, 870, 870, 870, 53, 89, -1, -1, -1, -1, 53, 53, 53, 53, 53,
+    -1, 120, -1, -1, 89, -1, 151, -1, -1, -1, 89, 89, 89, 89, 89, 120, -1, 168, -1, -1,
+    151, 120, 120, 120, 120, 120, 151, 151, 151, 151, 151, 168, 178, -1, -1, -1, -1, 168, 168, 168,
+    168, 168, -1, 180, -1, -1, 178, -1, 194, -1, -1, -1, 178, 178, 178, 178, 178, 180, -1, 200,
+    -1, -1, 194, 180, 180, 180, 180, 180, 194, 194, 194, 194, 194, 200, 202, -1, -1, -1, -1, 200,
+    200, 200, 200, 200, -1, 208, -1, -1, 202, -1, 221, -1, -1, -1, 202, 202, 202, 202, 202, 208,
+    -1, 227, -1, -1, 221, 208, 208, 208, 208, 208, 221, 221, 221, 221, 221, 227, 229, -1, -1, -1,
+    -1, 227, 227, 227, 227, 227, -1, 242, -1, -1, 229, -1, 245, -1, -1, -1, 229, 229, 229, 229,
+    229, 242, -1, 251, -1, -1, 245, 242, 242, 242, 242, 242, 245, 245, 245, 245, 245, 251, 253, -1,
+    -1, -1, -1, 251, 251, 251, 251, 251, -1, 268, -1, -1, 253, -1, 271, -1, -1, -1, 253, 253,
+    253, 253, 253, 268, -1, 274, -1, -1, 271, 268, 268, 268, 268, 268, 271, 271, 271, 271, 271, 274,
+    276, -1, -1, -1, -1, 274, 274, 274, 274, 274, -1, 287, -1, -1, 276, -1, 289, -1, -1, -1,
+    276, 276, 276, 276, 276, 287, -1, 311, -1, -1, 289, 287, 287, 287, 287, 287, 289, 289, 289, 289,
+    289, 311, 313, -1, -1, -1, -1, 311, 311, 311, 311, 311, -1, 328, -1, -1, 313, -1, 331, -1,
+    -1, -1, 313, 313, 313, 313, 313, 328, -1, 337, -1, -1, 331, 328, 328, 328, 328, 328, 331, 331,
+    331, 331, 331, 337, 339, -1, -1, -1, -1, 337, 337, 337, 337, 337, -1, 383, -1, -1, 339, -1,
+    389, -1, -1, -1, 339, 339, 339, 339, 339, 383, -1, 391, -1, -1, 389, 383, 383, 383, 383, 383,
+    389, 389, 389, 389, 389, 391, 406, -1, -1, -1, -1, 391, 391, 391, 391, 391, -1, 409, -1, -1,
+    406, -1, 412, -1, -1, -1, 406, 406, 406, 406, 406, 409, -1, 414, -1, -1, 412, 409, 409, 409,
+    409, 409, 412, 412, 412, 412, 412, 414, 460, -1, -1, -1, -1, 414, 414, 414, 414, 414, -1, 466,
+    -1, -1, 460, -1, 468, -1, -1, -1, 460, 460, 460, 460, 460, 466, -1, 483, -1, -1, 468, 466,
+    466, 466, 466, 466, 468, 468, 468, 468, 468, 483, 486, -1, -1, -1, -1, 483, 483, 483, 483, 483,
+    -1, 489, -1, -1, 486, -1, 491, -1, -1, -1, 486, 486, 486, 486, 486, 489, -1, 500, -1, -1,
+    491, 489, 489, 489, 489, 489, 491, 491, 491, 491, 491, 500, 502, -1, -1, -1, -1, 500, 500, 500,
+    500, 500, -1, 517, -1, -1, 502, -1, 520, -1, -1, -1, 502, 502, 502, 502, 502, 517, -1, 549,
+    -1, -1, 520, 517, 517, 517, 517, 517, 520, 520, 520, 520, 520, 549, 555, -1, -1, -1, -1, 549,
+    549, 549, 549, 549, -1, 557, -1, -1, 555, -1, 572, -1, -1, -1, 555, 555, 555, 555, 555, 557,
+    -1, 575, -1, -1, 572, 557, 557, 557, 557, 557, 572, 572, 572, 572, 572, 575, 578, -1, -1, -1,
+    -1, 575, 575, 575, 575, 575, -1, 580, -1, -1, 578, -1, 589, -1, -1, -1, 578, 578, 578, 578,
+    578, 580, -1, 591, -1, -1, 589, 580, 580, 580, 580, 580, 589, 589, 589, 589, 589, 591, 606, -1,
+    -1, -1, -1, 591, 591, 591, 591, 591, -1, 609, -1, -1, 606, -1, 624, -1, -1, -1, 606, 606,
+    606, 606, 606, 609, -1, 626, -1, -1, 624, 609, 609, 609, 609, 609, 624, 624, 624, 624, 624, 626,
+    672, -1, -1, -1, -1, 626, 626, 626, 626, 626, -1, 674, -1, -1, 672, -1, 760, -1, -1, -1,
+    672, 672, 672, 672, 672, 674, -1, 766, -1, -1, 760, 674, 674, 674, 674, 674, 760, 760, 760, 760,
+    760, 766, 768, -1, -1, -1, -1, 766, 766, 766, 766, 766, -1, 783, -1, -1, 768, -1, 786, -1,
+    -1, -1, 768, 768, 768, 768, 768, 783, -1, 789, -1, -1, 786, 783, 783, 783, 783, 783, 786, 786,
+    786, 786, 786, 789, 791, -1, -1, -1, -1, 789, 789, 789, 789, 789, -1, 851, -1, -1, 791, -1,
+    857, -1, -1, -1, 791, 791, 791, 791, 791, 851, -1, 859, -1, -1, 857, 851, 851, 851, 851, 851,
+    857, 857, 857, 857, 857, 859, 874, -1, -1, -1, -1, 859, 859, 859, 859, 859, -1, 877, -1, -1,
+    874, -1, 880, -1, -1, -1, 874, 874, 874, 874, 874, 877, -1, 882, -1, -1, 880, 877, 877, 877,
+    877, 877, 880, 880, 880, 880, 880, 882, -1, -1, -1, -1, -1, 882, 882, 882, 882, 882, -1, -1,
+)
+
+ACTION_VALUE = (
+    -1, 2, 2, 0, 11, 10, 44, 15, 62, 68, 80, 95, 101, 111, 4, 126, 130, 131, 133, 308,
+    344, 16, 346, 19, 54, 673, 675, 732, 8, 134, 737, 135, 804, 142, 742, 744, 143, 144, 146, 147,
+    148, 149, 90, 625, 627, 903, 745, 3, 746, 47, 749, 83, 5, 752, 753, 755, 756, 757, 758, 16,
+    6, 19, 121, 338, 340, 732, 179, 246, 737, 152, 288, 290, 742, 744, 114, 56, 20, 92, 23, 169,
+    275, 277, 24, 7, 745, 29, 746, 9, 749, 34, 36, 752, 753, 755, 756, 757, 758, 195, 228, 230,
+    123, 37, 12, 38, 145, 43, 162, 13, 45, 46, 48, 49, 50, 51, 20, 14, 23, 384, 413, 415,
+    24, 181, 243, 29, 461, 490, 492, 34, 36, 188, 154, 20, 171, 23, 550, 579, 581, 24, 12, 37,
+    29, 38, 18, 43, 34, 36, 45, 46, 48, 49, 50, 51, 761, 790, 792, 197, 37, 12, 38, 22,
+    43, 201, 222, 45, 46, 48, 49, 50, 51, 25, 12, 28, 852, 881, 883, 70, 27, 183, 71, 203,
+    209, 205, 73, 75, 203, 209, 25, 12, 28, 235, 203, 209, 70, 211, 76, 71, 77, 205, 79, 73,
+    75, 81, 82, 84, 85, 86, 87, 201, 222, 211, 32, 76, 35, 77, 12, 79, 205, 183, 81, 82,
+    84, 85, 86, 87, 20, 41, 23, 183, 211, 235, 24, 201, 222, 29, 201, 222, 256, 34, 36, 235,
+    256, 30, 56, 33, 181, 243, 12, 72, 261, 37, 103, 38, 261, 43, 104, 106, 45, 46, 48, 49,
+    50, 51, 181, 243, 252, 272, 107, 59, 108, 12, 110, 254, 269, 112, 113, 115, 116, 117, 118, 30,
+    65, 33, 256, 254, 269, 72, 254, 269, 103, 252, 272, 316, 104, 106, 261, 316, 20, 74, 23, 252,
+    272, 92, 24, 321, 107, 29, 108, 321, 110, 34, 36, 112, 113, 115, 116, 117, 118, 252, 272, 179,
+    246, 37, 12, 38, 98, 43, 179, 246, 45, 46, 48, 49, 50, 51, 20, 105, 23, 179, 246, 123,
+    24, 312, 332, 29, 314, 329, 316, 34, 36, 314, 329, 20, 127, 23, 314, 329, 128, 24, 321, 37,
+    29, 38, 129, 43, 34, 36, 45, 46, 48, 49, 50, 51, 312, 332, 312, 332, 37, 132, 38, 377,
+    43, 312, 332, 45, 46, 48, 49, 50, 51, 39, 137, 42, 390, 410, 154, 78, 392, 407, 109, 394,
+    156, 394, 136, 138, 454, 386, 39, 171, 42, 392, 407, 399, 78, 399, 139, 109, 140, 394, 141, 136,
+    138, 160, 161, 163, 164, 165, 166, 392, 407, 399, 463, 139, 174, 140, 176, 141, 390, 410, 160, 161,
+    163, 164, 165, 166, 20, 184, 23, 390, 410, 185, 24, 390, 410, 29, 467, 487, 471, 34, 36, 469,
+    484, 11, 197, 44, 469, 484, 199, 80, 476, 37, 111, 38, 471, 43, 131, 133, 45, 46, 48, 49,
+    50, 51, 469, 484, 476, 206, 134, 207, 135, 212, 142, 471, 505, 143, 144, 146, 147, 148, 149, 20,
+    213, 23, 214, 476, 510, 24, 467, 487, 29, 467, 487, 505, 34, 36, 467, 487, 20, 215, 23, 501,
+    521, 219, 24, 510, 37, 29, 38, 505, 43, 34, 36, 45, 46, 48, 49, 50, 51, 503, 518, 510,
+    543, 37, 221, 38, 226, 43, 503, 518, 45, 46, 48, 49, 50, 51, 20, 234, 23, 503, 518, 236,
+    24, 556, 576, 29, 558, 573, 552, 34, 36, 237, 560, 57, 238, 60, 558, 573, 239, 93, 241, 37,
+    124, 38, 565, 43, 155, 157, 45, 46, 48, 49, 50, 51, 558, 573, 556, 576, 158, 250, 159, 257,
+    172, 560, 560, 186, 187, 189, 190, 191, 192, 57, 258, 60, 260, 565, 565, 93, 556, 576, 124, 556,
+    576, 594, 155, 157, 590, 610, 20, 262, 23, 592, 607, 754, 24, 599, 158, 29, 159, 594, 172, 34,
+    36, 186, 187, 189, 190, 191, 192, 592, 607, 599, 263, 37, 264, 38, 265, 43, 594, 763, 45, 46,
+    48, 49, 50, 51, 63, 267, 66, 282, 599, 286, 69, 592, 607, 102, 501, 521, 771, 365, 367, 501,
+    521, 63, 294, 66, 501, 521, 296, 69, 776, 368, 102, 369, 298, 372, 365, 367, 375, 376, 378, 379,
+    380, 381, 590, 610, 590, 610, 368, 302, 369, 306, 372, 590, 610, 375, 376, 378, 379, 380, 381, 20,
+    127, 23, 767, 787, 317, 24, 769, 784, 29, 771, 318, 771, 34, 36, 769, 784, 63, 320, 66, 769,
+    784, 776, 69, 776, 37, 102, 38, 322, 43, 365, 367, 45, 46, 48, 49, 50, 51, 767, 787, 767,
+    787, 368, 323, 369, 845, 372, 767, 787, 375, 376, 378, 379, 380, 381, 25, 324, 28, 858, 878, 325,
+    70, 860, 875, 71, 862, 327, 862, 73, 75, 336, 854, 25, 127, 28, 860, 875, 867, 70, 867, 76,
+    71, 77, 862, 79, 73, 75, 81, 82, 84, 85, 86, 87, 860, 875, 867, 348, 76, 350, 77, 127,
+    79, 858, 878, 81, 82, 84, 85, 86, 87, 30, 352, 33, 858, 878, 354, 72, 858, 878, 103, 358,
+    127, 360, 104, 106, 362, 127, 25, 364, 28, 366, 371, 374, 70, 386, 107, 71, 108, 388, 110, 73,
+    75, 112, 113, 115, 116, 117, 118, 395, 396, 398, 400, 76, 401, 77, 402, 79, 403, 405, 81, 82,
+    84, 85, 86, 87, 25, 422, 28, 12, 425, 428, 70, 430, 433, 71, 436, 439, 127, 73, 75, 441,
+    443, 25, 448, 28, 451, 463, 465, 70, 472, 76, 71, 77, 473, 79, 73, 75, 81, 82, 84, 85,
+    86, 87, 475, 477, 478, 479, 76, 480, 77, 482, 79, 499, 506, 81, 82, 84, 85, 86, 87, 39,
+    507, 42, 509, 511, 512, 78, 513, 514, 109, 516, 525, 528, 136, 138, 127, 530, 25, 532, 28, 537,
+    540, 552, 70, 554, 139, 71, 140, 561, 141, 73, 75, 160, 161, 163, 164, 165, 166, 562, 564, 566,
+    567, 76, 568, 77, 569, 79, 571, 588, 81, 82, 84, 85, 86, 87, 11, 595, 44, 596, 598, 600,
+    80, 601, 602, 111, 603, 605, 615, 131, 133, 12, 618, 25, 621, 28, 623, 631, 633, 70, 635, 134,
+    71, 135, 637, 142, 73, 75, 143, 144, 146, 147, 148, 149, 639, 641, 645, 647, 76, 649, 77, 127,
+    79, 651, 653, 81, 82, 84, 85, 86, 87, 25, 655, 28, 657, 659, 661, 70, 663, 666, 71, 668,
+    671, 679, 73, 75, 681, 683, 25, 685, 28, 687, 689, 691, 70, 694, 76, 71, 77, 698, 79, 73,
+    75, 81, 82, 84, 85, 86, 87, 700, 702, 705, 127, 76, 707, 77, 709, 79, 711, 713, 81, 82,
+    84, 85, 86, 87, 57, 716, 60, 718, 720, 722, 93, 724, 727, 124, 729, 731, 734, 155, 157, 736,
+    739, 25, 127, 28, 741, 743, 748, 70, 751, 158, 71, 159, 763, 172, 73, 75, 186, 187, 189, 190,
+    191, 192, 765, 772, 773, 775, 76, 777, 77, 778, 79, 779, 780, 81, 82, 84, 85, 86, 87, 96,
+    782, 99, 801, 805, 806, 434, 807, 809, 437, 810, 811, 812, 442, 444, 12, 815, 96, 818, 99, 820,
+    822, 825, 434, 827, 445, 437, 446, 830, 449, 442, 444, 452, 453, 455, 456, 457, 458, 127, 832, 834,
+    839, 445, 842, 446, 854, 449, 856, 863, 452, 453, 455, 456, 457, 458, 20, 864, 23, 866, 868, 869,
+    24, 870, 871, 29, 873, 891, 893, 34, 36, 805, 896, 63, 898, 66, 7, 901, 7, 69, 7, 37,
+    102, 38, 905, 43, 365, 367, 45, 46, 48, 49, 50, 51, 909, 0, 0, 0, 368, 0, 369, 0,
+    372, 0, 0, 375, 376, 378, 379, 380, 381, 30, 0, 33, 0, 0, 0, 72, 0, 0, 103, 0,
+    0, 0, 104, 106, 0, 0, 30, 0, 33, 0, 0, 0, 72, 0, 107, 103, 108, 0, 110, 104,
+    106, 112, 113, 115, 116, 117, 118, 0, 0, 0, 0, 107, 0, 108, 0, 110, 0, 0, 112, 113,
+    115, 116, 117, 118, 30, 0, 33, 0, 0, 0, 72, 0, 0, 103, 0, 0, 0, 104, 106, 0,
+    0, 30, 0, 33, 0, 0, 0, 72, 0, 107, 103, 108, 0, 110, 104, 106, 112, 113, 115, 116,
+    117, 118, 0, 0, 0, 0, 107, 0, 108, 0, 110, 0, 0, 112, 113, 115, 116, 117, 118, 39,
+    0, 42, 0, 0, 0, 78, 0, 0, 109, 0, 0, 0, 136, 138, 0, 0, 30, 0, 33, 0,
+    0, 0, 72, 0, 139, 103, 140, 0, 141, 104, 106, 160, 161, 163, 164, 165, 166, 0, 0, 0,
+    0, 107, 0, 108, 0, 110, 0, 0, 112, 113, 115, 116, 117, 118, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 30, 0, 33, 0, 0, 0, 72, 0, 134,
+    103, 135, 0, 142, 104, 106, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 107, 0, 108, 0,
+    110, 0, 0, 112, 113, 115, 116, 117, 118, 30, 0, 33, 0, 0, 0, 72, 0, 0, 103, 0,
+    0, 0, 104, 106, 0, 0, 30, 0, 33, 0, 0, 0, 72, 0, 107, 103, 108, 0, 110, 104,
+    106, 112, 113, 115, 116, 117, 118, 0, 0, 0, 0, 107, 0, 108, 0, 110, 0, 0, 112, 113,
+    115, 116, 117, 118, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0,
+    0, 30, 0, 33, 0, 0, 0, 72, 0, 158, 103, 159, 0, 172, 104, 106, 186, 187, 189, 190,
+    191, 192, 0, 0, 0, 0, 107, 0, 108, 0, 110, 0, 0, 112, 113, 115, 116, 117, 118, 11,
+    0, 44, 0, 0, 0, 80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 11, 0, 44, 0,
+    0, 0, 80, 0, 134, 111, 135, 0, 142, 131, 133, 143, 144, 146, 147, 148, 149, 0, 0, 0,
+    0, 134, 0, 135, 0, 142, 0, 0, 143, 144, 146, 147, 148, 149, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 39, 0, 42, 0, 0, 0, 78, 0, 134,
+    109, 135, 0, 142, 136, 138, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 139, 0, 140, 0,
+    141, 0, 0, 160, 161, 163, 164, 165, 166, 39, 0, 42, 0, 0, 0, 78, 0, 0, 109, 0,
+    0, 0, 136, 138, 0, 0, 39, 0, 42, 0, 0, 0, 78, 0, 139, 109, 140, 0, 141, 136,
+    138, 160, 161, 163, 164, 165, 166, 0, 0, 0, 0, 139, 0, 140, 0, 141, 0, 0, 160, 161,
+    163, 164, 165, 166, 39, 0, 42, 0, 0, 0, 78, 0, 0, 109, 0, 0, 0, 136, 138, 0,
+    0, 11, 0, 44, 0, 0, 0, 80, 0, 139, 111, 140, 0, 141, 131, 133, 160, 161, 163, 164,
+    165, 166, 0, 0, 0, 0, 134, 0, 135, 0, 142, 0, 0, 143, 144, 146, 147, 148, 149, 11,
+    0, 44, 0, 0, 0, 80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 11, 0, 44, 0,
+    0, 0, 80, 0, 134, 111, 135, 0, 142, 131, 133, 143, 144, 146, 147, 148, 149, 0, 0, 0,
+    0, 134, 0, 135, 0, 142, 0, 0, 143, 144, 146, 147, 148, 149, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 134,
+    124, 135, 0, 142, 155, 157, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 158, 0, 159, 0,
+    172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0,
+    0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155,
+    157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187,
+    189, 190, 191, 192, 39, 0, 42, 0, 0, 0, 78, 0, 0, 109, 0, 0, 0, 136, 138, 0,
+    0, 39, 0, 42, 0, 0, 0, 78, 0, 139, 109, 140, 0, 141, 136, 138, 160, 161, 163, 164,
+    165, 166, 0, 0, 0, 0, 139, 0, 140, 0, 141, 0, 0, 160, 161, 163, 164, 165, 166, 39,
+    0, 42, 0, 0, 0, 78, 0, 0, 109, 0, 0, 0, 136, 138, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 139, 124, 140, 0, 141, 155, 157, 160, 161, 163, 164, 165, 166, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 11, 0, 44, 0, 0, 0, 80, 0, 134,
+    111, 135, 0, 142, 131, 133, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 134, 0, 135, 0,
+    142, 0, 0, 143, 144, 146, 147, 148, 149, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0,
+    0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155,
+    157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187,
+    189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0,
+    0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190,
+    191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57,
+    0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0,
+    93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158,
+    124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0,
+    172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0,
+    0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155,
+    157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187,
+    189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0,
+    0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190,
+    191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 63,
+    0, 66, 0, 0, 0, 69, 0, 0, 102, 0, 0, 0, 365, 367, 0, 0, 63, 0, 66, 0,
+    0, 0, 69, 0, 368, 102, 369, 0, 372, 365, 367, 375, 376, 378, 379, 380, 381, 0, 0, 0,
+    0, 368, 0, 369, 0, 372, 0, 0, 375, 376, 378, 379, 380, 381, 39, 0, 42, 0, 0, 0,
+    78, 0, 0, 109, 0, 0, 0, 136, 138, 0, 0, 11, 0, 44, 0, 0, 0, 80, 0, 139,
+    111, 140, 0, 141, 131, 133, 160, 161, 163, 164, 165, 166, 0, 0, 0, 0, 134, 0, 135, 0,
+    142, 0, 0, 143, 144, 146, 147, 148, 149, 63, 0, 66, 0, 0, 0, 69, 0, 0, 102, 0,
+    0, 0, 365, 367, 0, 0, 63, 0, 66, 0, 0, 0, 69, 0, 368, 102, 369, 0, 372, 365,
+    367, 375, 376, 378, 379, 380, 381, 0, 0, 0, 0, 368, 0, 369, 0, 372, 0, 0, 375, 376,
+    378, 379, 380, 381, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0,
+    0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190,
+    191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57,
+    0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 423, 0, 426, 0,
+    0, 0, 431, 0, 158, 526, 159, 0, 172, 531, 533, 186, 187, 189, 190, 191, 192, 0, 0, 0,
+    0, 534, 0, 535, 0, 538, 0, 0, 541, 542, 544, 545, 546, 547, 423, 0, 426, 0, 0, 0,
+    431, 0, 0, 526, 0, 0, 0, 531, 533, 0, 0, 20, 0, 23, 0, 0, 0, 24, 0, 534,
+    29, 535, 0, 538, 34, 36, 541, 542, 544, 545, 546, 547, 0, 0, 0, 0, 37, 0, 38, 0,
+    43, 0, 0, 45, 46, 48, 49, 50, 51, 63, 0, 66, 0, 0, 0, 69, 0, 0, 102, 0,
+    0, 0, 365, 367, 0, 0, 423, 0, 426, 0, 0, 0, 431, 0, 368, 526, 369, 0, 372, 531,
+    533, 375, 376, 378, 379, 380, 381, 0, 0, 0, 0, 534, 0, 535, 0, 538, 0, 0, 541, 542,
+    544, 545, 546, 547, 25, 0, 28, 0, 0, 0, 70, 0, 0, 71, 0, 0, 0, 73, 75, 0,
+    0, 96, 0, 99, 0, 0, 0, 434, 0, 76, 437, 77, 0, 79, 442, 444, 81, 82, 84, 85,
+    86, 87, 0, 0, 0, 0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 25,
+    0, 28, 0, 0, 0, 70, 0, 0, 71, 0, 0, 0, 73, 75, 0, 0, 96, 0, 99, 0,
+    0, 0, 434, 0, 76, 437, 77, 0, 79, 442, 444, 81, 82, 84, 85, 86, 87, 0, 0, 0,
+    0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 30, 0, 33, 0, 0, 0,
+    72, 0, 0, 103, 0, 0, 0, 104, 106, 0, 0, 96, 0, 99, 0, 0, 0, 434, 0, 107,
+    437, 108, 0, 110, 442, 444, 112, 113, 115, 116, 117, 118, 0, 0, 0, 0, 445, 0, 446, 0,
+    449, 0, 0, 452, 453, 455, 456, 457, 458, 96, 0, 99, 0, 0, 0, 434, 0, 0, 437, 0,
+    0, 0, 442, 444, 0, 0, 39, 0, 42, 0, 0, 0, 78, 0, 445, 109, 446, 0, 449, 136,
+    138, 452, 453, 455, 456, 457, 458, 0, 0, 0, 0, 139, 0, 140, 0, 141, 0, 0, 160, 161,
+    163, 164, 165, 166, 11, 0, 44, 0, 0, 0, 80, 0, 0, 111, 0, 0, 0, 131, 133, 0,
+    0, 96, 0, 99, 0, 0, 0, 434, 0, 134, 437, 135, 0, 142, 442, 444, 143, 144, 146, 147,
+    148, 149, 0, 0, 0, 0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 96,
+    0, 99, 0, 0, 0, 434, 0, 0, 437, 0, 0, 0, 442, 444, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 445, 124, 446, 0, 449, 155, 157, 452, 453, 455, 456, 457, 458, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0,
+    93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158,
+    124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0,
+    172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0,
+    0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155,
+    157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187,
+    189, 190, 191, 192, 30, 0, 33, 0, 0, 0, 72, 0, 0, 103, 0, 0, 0, 104, 106, 0,
+    0, 423, 0, 426, 0, 0, 0, 431, 0, 107, 526, 108, 0, 110, 531, 533, 112, 113, 115, 116,
+    117, 118, 0, 0, 0, 0, 534, 0, 535, 0, 538, 0, 0, 541, 542, 544, 545, 546, 547, 423,
+    0, 426, 0, 0, 0, 431, 0, 0, 526, 0, 0, 0, 531, 533, 0, 0, 39, 0, 42, 0,
+    0, 0, 78, 0, 534, 109, 535, 0, 538, 136, 138, 541, 542, 544, 545, 546, 547, 0, 0, 0,
+    0, 139, 0, 140, 0, 141, 0, 0, 160, 161, 163, 164, 165, 166, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 423, 0, 426, 0, 0, 0, 431, 0, 134,
+    526, 135, 0, 142, 531, 533, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 534, 0, 535, 0,
+    538, 0, 0, 541, 542, 544, 545, 546, 547, 423, 0, 426, 0, 0, 0, 431, 0, 0, 526, 0,
+    0, 0, 531, 533, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 534, 124, 535, 0, 538, 155,
+    157, 541, 542, 544, 545, 546, 547, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187,
+    189, 190, 191, 192, 57, 0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0,
+    0, 57, 0, 60, 0, 0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190,
+    191, 192, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57,
+    0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 96, 0, 99, 0, 0, 0,
+    434, 0, 0, 437, 0, 0, 0, 442, 444, 0, 0, 96, 0, 99, 0, 0, 0, 434, 0, 445,
+    437, 446, 0, 449, 442, 444, 452, 453, 455, 456, 457, 458, 0, 0, 0, 0, 445, 0, 446, 0,
+    449, 0, 0, 452, 453, 455, 456, 457, 458, 96, 0, 99, 0, 0, 0, 434, 0, 0, 437, 0,
+    0, 0, 442, 444, 0, 0, 96, 0, 99, 0, 0, 0, 434, 0, 445, 437, 446, 0, 449, 442,
+    444, 452, 453, 455, 456, 457, 458, 0, 0, 0, 0, 445, 0, 446, 0, 449, 0, 0, 452, 453,
+    455, 456, 457, 458, 96, 0, 99, 0, 0, 0, 434, 0, 0, 437, 0, 0, 0, 442, 444, 0,
+    0, 423, 0, 426, 0, 0, 0, 431, 0, 445, 526, 446, 0, 449, 531, 533, 452, 453, 455, 456,
+    457, 458, 0, 0, 0, 0, 534, 0, 535, 0, 538, 0, 0, 541, 542, 544, 545, 546, 547, 423,
+    0, 426, 0, 0, 0, 431, 0, 0, 526, 0, 0, 0, 531, 533, 0, 0, 63, 0, 66, 0,
+    0, 0, 69, 0, 534, 102, 535, 0, 538, 365, 367, 541, 542, 544, 545, 546, 547, 0, 0, 0,
+    0, 368, 0, 369, 0, 372, 0, 0, 375, 376, 378, 379, 380, 381, 423, 0, 426, 0, 0, 0,
+    431, 0, 0, 526, 0, 0, 0, 531, 533, 0, 0, 63, 0, 66, 0, 0, 0, 69, 0, 534,
+    102, 535, 0, 538, 365, 367, 541, 542, 544, 545, 546, 547, 0, 0, 0, 0, 368, 0, 369, 0,
+    372, 0, 0, 375, 376, 378, 379, 380, 381, 423, 0, 426, 0, 0, 0, 431, 0, 0, 526, 0,
+    0, 0, 531, 533, 0, 0, 63, 0, 66, 0, 0, 0, 69, 0, 534, 102, 535, 0, 538, 365,
+    367, 541, 542, 544, 545, 546, 547, 0, 0, 0, 0, 368, 0, 369, 0, 372, 0, 0, 375, 376,
+    378, 379, 380, 381, 423, 0, 426, 0, 0, 0, 431, 0, 0, 526, 0, 0, 0, 531, 533, 0,
+    0, 63, 0, 66, 0, 0, 0, 69, 0, 534, 102, 535, 0, 538, 365, 367, 541, 542, 544, 545,
+    546, 547, 0, 0, 0, 0, 368, 0, 369, 0, 372, 0, 0, 375, 376, 378, 379, 380, 381, 423,
+    0, 426, 0, 0, 0, 431, 0, 0, 526, 0, 0, 0, 531, 533, 0, 0, 96, 0, 99, 0,
+    0, 0, 434, 0, 534, 437, 535, 0, 538, 442, 444, 541, 542, 544, 545, 546, 547, 0, 0, 0,
+    0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 63, 0, 66, 0, 0, 0,
+    69, 0, 0, 102, 0, 0, 0, 365, 367, 0, 0, 423, 0, 426, 0, 0, 0, 431, 0, 368,
+    526, 369, 0, 372, 531, 533, 375, 376, 378, 379, 380, 381, 0, 0, 0, 0, 534, 0, 535, 0,
+    538, 0, 0, 541, 542, 544, 545, 546, 547, 63, 0, 66, 0, 0, 0, 69, 0, 0, 102, 0,
+    0, 0, 365, 367, 0, 0, 423, 0, 426, 0, 0, 0, 431, 0, 368, 526, 369, 0, 372, 531,
+    533, 375, 376, 378, 379, 380, 381, 0, 0, 0, 0, 534, 0, 535, 0, 538, 0, 0, 541, 542,
+    544, 545, 546, 547, 25, 0, 28, 0, 0, 0, 70, 0, 0, 71, 0, 0, 0, 73, 75, 0,
+    0, 96, 0, 99, 0, 0, 0, 434, 0, 76, 437, 77, 0, 79, 442, 444, 81, 82, 84, 85,
+    86, 87, 0, 0, 0, 0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 30,
+    0, 33, 0, 0, 0, 72, 0, 0, 103, 0, 0, 0, 104, 106, 0, 0, 16, 0, 19, 0,
+    0, 0, 732, 0, 107, 737, 108, 0, 110, 742, 744, 112, 113, 115, 116, 117, 118, 0, 0, 0,
+    0, 745, 0, 746, 0, 749, 0, 0, 752, 753, 755, 756, 757, 758, 16, 0, 19, 0, 0, 0,
+    732, 0, 0, 737, 0, 0, 0, 742, 744, 0, 0, 39, 0, 42, 0, 0, 0, 78, 0, 745,
+    109, 746, 0, 749, 136, 138, 752, 753, 755, 756, 757, 758, 0, 0, 0, 0, 139, 0, 140, 0,
+    141, 0, 0, 160, 161, 163, 164, 165, 166, 11, 0, 44, 0, 0, 0, 80, 0, 0, 111, 0,
+    0, 0, 131, 133, 0, 0, 16, 0, 19, 0, 0, 0, 732, 0, 134, 737, 135, 0, 142, 742,
+    744, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 745, 0, 746, 0, 749, 0, 0, 752, 753,
+    755, 756, 757, 758, 16, 0, 19, 0, 0, 0, 732, 0, 0, 737, 0, 0, 0, 742, 744, 0,
+    0, 57, 0, 60, 0, 0, 0, 93, 0, 745, 124, 746, 0, 749, 155, 157, 752, 753, 755, 756,
+    757, 758, 0, 0, 0, 0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57,
+    0, 60, 0, 0, 0, 93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 158, 124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 11, 0, 44, 0, 0, 0,
+    80, 0, 0, 111, 0, 0, 0, 131, 133, 0, 0, 813, 0, 816, 0, 0, 0, 823, 0, 134,
+    828, 135, 0, 142, 833, 835, 143, 144, 146, 147, 148, 149, 0, 0, 0, 0, 836, 0, 837, 0,
+    840, 0, 0, 843, 844, 846, 847, 848, 849, 813, 0, 816, 0, 0, 0, 823, 0, 0, 828, 0,
+    0, 0, 833, 835, 0, 0, 20, 0, 23, 0, 0, 0, 24, 0, 836, 29, 837, 0, 840, 34,
+    36, 843, 844, 846, 847, 848, 849, 0, 0, 0, 0, 37, 0, 38, 0, 43, 0, 0, 45, 46,
+    48, 49, 50, 51, 63, 0, 66, 0, 0, 0, 69, 0, 0, 102, 0, 0, 0, 365, 367, 0,
+    0, 423, 0, 426, 0, 0, 0, 431, 0, 368, 526, 369, 0, 372, 531, 533, 375, 376, 378, 379,
+    380, 381, 0, 0, 0, 0, 534, 0, 535, 0, 538, 0, 0, 541, 542, 544, 545, 546, 547, 25,
+    0, 28, 0, 0, 0, 70, 0, 0, 71, 0, 0, 0, 73, 75, 0, 0, 96, 0, 99, 0,
+    0, 0, 434, 0, 76, 437, 77, 0, 79, 442, 444, 81, 82, 84, 85, 86, 87, 0, 0, 0,
+    0, 445, 0, 446, 0, 449, 0, 0, 452, 453, 455, 456, 457, 458, 30, 0, 33, 0, 0, 0,
+    72, 0, 0, 103, 0, 0, 0, 104, 106, 0, 0, 813, 0, 816, 0, 0, 0, 823, 0, 107,
+    828, 108, 0, 110, 833, 835, 112, 113, 115, 116, 117, 118, 0, 0, 0, 0, 836, 0, 837, 0,
+    840, 0, 0, 843, 844, 846, 847, 848, 849, 813, 0, 816, 0, 0, 0, 823, 0, 0, 828, 0,
+    0, 0, 833, 835, 0, 0, 39, 0, 42, 0, 0, 0, 78, 0, 836, 109, 837, 0, 840, 136,
+    138, 843, 844, 846, 847, 848, 849, 0, 0, 0, 0, 139, 0, 140, 0, 141, 0, 0, 160, 161,
+    163, 164, 165, 166, 11, 0, 44, 0, 0, 0, 80, 0, 0, 111, 0, 0, 0, 131, 133, 0,
+    0, 813, 0, 816, 0, 0, 0, 823, 0, 134, 828, 135, 0, 142, 833, 835, 143, 144, 146, 147,
+    148, 149, 0, 0, 0, 0, 836, 0, 837, 0, 840, 0, 0, 843, 844, 846, 847, 848, 849, 813,
+    0, 816, 0, 0, 0, 823, 0, 0, 828, 0, 0, 0, 833, 835, 0, 0, 57, 0, 60, 0,
+    0, 0, 93, 0, 836, 124, 837, 0, 840, 155, 157, 843, 844, 846, 847, 848, 849, 0, 0, 0,
+    0, 158, 0, 159, 0, 172, 0, 0, 186, 187, 189, 190, 191, 192, 57, 0, 60, 0, 0, 0,
+    93, 0, 0, 124, 0, 0, 0, 155, 157, 0, 0, 57, 0, 60, 0, 0, 0, 93, 0, 158,
+    124, 159, 0, 172, 155, 157, 186, 187, 189, 190, 191, 192, 0, 0, 0, 34, 158, 0, 159, 0,
+    172, 0, 0, 186, 187, 189, 190, 191, 192, 38, 73, 0, 0, 0, 0, 55, 48, 49, 50, 51,
+    0, 104, 0, 0, 77, 0, 131, 0, 0, 0, 91, 84, 85, 86, 87, 108, 0, 136, 0, 0,
+    135, 122, 115, 116, 117, 118, 153, 146, 147, 148, 149, 140, 131, 0, 0, 0, 0, 170, 163, 164,
+    165, 166, 0, 131, 0, 0, 135, 0, 155, 0, 0, 0, 153, 146, 147, 148, 149, 135, 0, 155,
+    0, 0, 159, 153, 146, 147, 148, 149, 196, 189, 190, 191, 192, 159, 155, 0, 0, 0, 0, 196,
+    189, 190, 191, 192, 0, 155, 0, 0, 159, 0, 155, 0, 0, 0, 196, 189, 190, 191, 192, 159,
+    0, 155, 0, 0, 159, 196, 189, 190, 191, 192, 196, 189, 190, 191, 192, 159, 155, 0, 0, 0,
+    0, 196, 189, 190, 191, 192, 0, 131, 0, 0, 159, 0, 131, 0, 0, 0, 196, 189, 190, 191,
+    192, 135, 0, 136, 0, 0, 135, 153, 146, 147, 148, 149, 153, 146, 147, 148, 149, 140, 136, 0,
+    0, 0, 0, 170, 163, 164, 165, 166, 0, 136, 0, 0, 140, 0, 136, 0, 0, 0, 170, 163,
+    164, 165, 166, 140, 0, 136, 0, 0, 140, 170, 163, 164, 165, 166, 170, 163, 164, 165, 166, 140,
+    136, 0, 0, 0, 0, 170, 163, 164, 165, 166, 0, 131, 0, 0, 140, 0, 131, 0, 0, 0,
+    170, 163, 164, 165, 166, 135, 0, 104, 0, 0, 135, 153, 146, 147, 148, 149, 153, 146, 147, 148,
+    149, 108, 104, 0, 0, 0, 0, 122, 115, 116, 117, 118, 0, 104, 0, 0, 108, 0, 104, 0,
+    0, 0, 122, 115, 116, 117, 118, 108, 0, 104, 0, 0, 108, 122, 115, 116, 117, 118, 122, 115,
+    116, 117, 118, 108, 104, 0, 0, 0, 0, 122, 115, 116, 117, 118, 0, 365, 0, 0, 108, 0,
+    365, 0, 0, 0, 122, 115, 116, 117, 118, 369, 0, 365, 0, 0, 369, 385, 378, 379, 380, 381,
+    385, 378, 379, 380, 381, 369, 365, 0, 0, 0, 0, 385, 378, 379, 380, 381, 0, 365, 0, 0,
+    369, 0, 365, 0, 0, 0, 385, 378, 379, 380, 381, 369, 0, 365, 0, 0, 369, 385, 378, 379,
+    380, 381, 385, 378, 379, 380, 381, 369, 442, 0, 0, 0, 0, 385, 378, 379, 380, 381, 0, 442,
+    0, 0, 446, 0, 442, 0, 0, 0, 462, 455, 456, 457, 458, 446, 0, 442, 0, 0, 446, 462,
+    455, 456, 457, 458, 462, 455, 456, 457, 458, 446, 442, 0, 0, 0, 0, 462, 455, 456, 457, 458,
+    0, 442, 0, 0, 446, 0, 442, 0, 0, 0, 462, 455, 456, 457, 458, 446, 0, 73, 0, 0,
+    446, 462, 455, 456, 457, 458, 462, 455, 456, 457, 458, 77, 73, 0, 0, 0, 0, 91, 84, 85,
+    86, 87, 0, 73, 0, 0, 77, 0, 73, 0, 0, 0, 91, 84, 85, 86, 87, 77, 0, 531,
+    0, 0, 77, 91, 84, 85, 86, 87, 91, 84, 85, 86, 87, 535, 531, 0, 0, 0, 0, 551,
+    544, 545, 546, 547, 0, 531, 0, 0, 535, 0, 531, 0, 0, 0, 551, 544, 545, 546, 547, 535,
+    0, 531, 0, 0, 535, 551, 544, 545, 546, 547, 551, 544, 545, 546, 547, 535, 531, 0, 0, 0,
+    0, 551, 544, 545, 546, 547, 0, 531, 0, 0, 535, 0, 34, 0, 0, 0, 551, 544, 545, 546,
+    547, 535, 0, 34, 0, 0, 38, 551, 544, 545, 546, 547, 55, 48, 49, 50, 51, 38, 34, 0,
+    0, 0, 0, 55, 48, 49, 50, 51, 0, 34, 0, 0, 38, 0, 73, 0, 0, 0, 55, 48,
+    49, 50, 51, 38, 0, 73, 0, 0, 77, 55, 48, 49, 50, 51, 91, 84, 85, 86, 87, 77,
+    34, 0, 0, 0, 0, 91, 84, 85, 86, 87, 0, 34, 0, 0, 38, 0, 742, 0, 0, 0,
+    55, 48, 49, 50, 51, 38, 0, 742, 0, 0, 746, 55, 48, 49, 50, 51, 762, 755, 756, 757,
+    758, 746, 742, 0, 0, 0, 0, 762, 755, 756, 757, 758, 0, 742, 0, 0, 746, 0, 742, 0,
+    0, 0, 762, 755, 756, 757, 758, 746, 0, 742, 0, 0, 746, 762, 755, 756, 757, 758, 762, 755,
+    756, 757, 758, 746, 742, 0, 0, 0, 0, 762, 755, 756, 757, 758, 0, 833, 0, 0, 746, 0,
+    833, 0, 0, 0, 762, 755, 756, 757, 758, 837, 0, 833, 0, 0, 837, 853, 846, 847, 848, 849,
+    853, 846, 847, 848, 849, 837, 833, 0, 0, 0, 0, 853, 846, 847, 848, 849, 0, 833, 0, 0,
+    837, 0, 833, 0, 0, 0, 853, 846, 847, 848, 849, 837, 0, 833, 0, 0, 837, 853, 846, 847,
+    848, 849, 853, 846, 847, 848, 849, 837, 0, 0, 0, 0, 0, 853, 846, 847, 848, 849, 0, 0,
+)
+
+GOTO_BASE = (
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 355, 1370, 0, 0, 0, 361, 1372, 0, 367, 373, 1374,
+    0, 379, 385, 391, 1376, 0, 397, 403, 409, 1378, 0, 415, 421, 0, 0, 427, 433, 439, 1380, 0,
+    445, 451, 0, 457, 463, 0, 469, 0, 0, 0, 0, 0, 0, 1169, 0, 6, 1382, 0, 475, 481,
+    0, 487, 1384, 0, 493, 499, 0, 505, 511, 517, 523, 529, 0, 0, 535, 541, 547, 553, 15, 559,
+    565, 0, 571, 0, 0, 0, 0, 0, 0, 1173, 0, 21, 577, 0, 583, 1386, 0, 589, 595, 0,
+    601, 607, 613, 0, 0, 619, 625, 631, 637, 30, 643, 649, 0, 655, 0, 0, 0, 0, 0, 0,
+    1177, 0, 36, 661, 0, 1386, 0, 0, 0, 667, 0, 0, 673, 679, 685, 0, 0, 691, 697, 703,
+    45, 52, 709, 0, 715, 0, 0, 0, 0, 0, 0, 1181, 0, 58, 0, 0, 721, 727, 733, 739,
+    0, 745, 0, 0, 0, 0, 0, 0, 1185, 0, 66, 75, 0, 0, 0, 82, 0, 0, 1300, 0,
+    1394, 0, 0, 0, 88, 751, 0, 757, 0, 0, 0, 0, 0, 0, 1189, 0, 96, 0, 104, 0,
+    1303, 0, 1396, 0, 0, 0, 112, 0, 1398, 0, 0, 0, 0, 0, 120, 0, 0, 0, 0, 0,
+    0, 1306, 0, 0, 0, 0, 0, 1193, 0, 1197, 0, 0, 0, 0, 0, 0, 0, 0, 128, 0,
+    0, 0, 1400, 0, 0, 1309, 0, 0, 0, 0, 0, 1312, 0, 1402, 0, 0, 0, 136, 0, 0,
+    0, 0, 0, 0, 144, 0, 0, 0, 1404, 0, 0, 1315, 0, 0, 1201, 0, 1205, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 1209, 0, 1213, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 1400, 0, 0, 1318, 0, 1408, 0, 0, 0, 152, 0, 0,
+    0, 0, 0, 0, 160, 0, 0, 0, 1410, 0, 0, 1321, 0, 0, 0, 0, 0, 1217, 0, 1221,
+    0, 0, 0, 1406, 0, 0, 0, 0, 0, 1408, 0, 0, 0, 0, 0, 0, 0, 1410, 0, 0,
+    0, 1412, 0, 0, 0, 0, 763, 769, 775, 0, 0, 169, 0, 0, 781, 0, 787, 0, 0, 0,
+    0, 0, 0, 1225, 0, 175, 0, 0, 0, 1324, 0, 1420, 0, 0, 0, 183, 0, 0, 0, 0,
+    0, 0, 191, 0, 0, 0, 1422, 0, 0, 1327, 0, 0, 1229, 0, 1233, 0, 0, 0, 0, 0,
+    0, 793, 1420, 0, 799, 805, 0, 811, 0, 817, 823, 0, 829, 835, 0, 841, 847, 0, 1420, 0,
+    0, 0, 0, 853, 859, 865, 0, 0, 200, 0, 0, 871, 0, 877, 0, 0, 0, 0, 0, 0,
+    1237, 0, 206, 0, 0, 0, 1330, 0, 1428, 0, 0, 0, 214, 0, 0, 0, 0, 0, 0, 222,
+    0, 0, 0, 1430, 0, 0, 1333, 0, 0, 1241, 0, 1245, 0, 0, 0, 0, 0, 0, 0, 0,
+    1336, 0, 1432, 0, 0, 0, 230, 0, 0, 0, 0, 0, 0, 238, 0, 0, 0, 1434, 0, 0,
+    1339, 0, 0, 0, 0, 883, 0, 1430, 0, 0, 0, 0, 889, 895, 901, 0, 0, 247, 0, 0,
+    907, 0, 913, 0, 0, 0, 0, 0, 0, 1249, 0, 253, 0, 0, 0, 1342, 0, 1438, 0, 0,
+    0, 261, 0, 0, 0, 0, 0, 0, 269, 0, 0, 0, 1440, 0, 0, 1345, 0, 0, 1253, 0,
+    1257, 0, 0, 0, 0, 0, 0, 0, 0, 1348, 0, 1442, 0, 0, 0, 277, 0, 0, 0, 0,
+    0, 0, 285, 0, 0, 0, 1444, 0, 0, 1351, 0, 0, 0, 0, 1442, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 1261, 0, 1265, 0, 0, 0, 919, 0, 0, 0, 0, 0, 925, 0, 0, 0,
+    0, 0, 0, 0, 931, 0, 0, 0, 1442, 0, 0, 0, 937, 0, 0, 0, 943, 0, 0, 0,
+    949, 0, 0, 0, 0, 955, 0, 0, 0, 0, 0, 0, 1269, 0, 1273, 0, 0, 0, 961, 0,
+    967, 0, 0, 0, 0, 0, 973, 0, 979, 0, 0, 0, 0, 0, 0, 0, 0, 985, 0, 991,
+    0, 0, 0, 0, 1444, 0, 0, 0, 997, 0, 1003, 0, 0, 0, 0, 1009, 0, 0, 0, 1015,
+    0, 1021, 0, 0, 0, 0, 1027, 0, 1033, 0, 0, 1039, 0, 1045, 0, 0, 1051, 0, 1446, 0,
+    0, 0, 0, 1057, 1063, 1069, 0, 0, 294, 0, 0, 1075, 0, 1081, 0, 0, 0, 0, 0, 0,
+    1277, 0, 300, 0, 0, 0, 1354, 0, 1454, 0, 0, 0, 308, 0, 0, 0, 0, 0, 0, 316,
+    0, 0, 0, 1456, 0, 0, 1357, 0, 0, 1281, 0, 1285, 0, 0, 0, 0, 0, 0, 0, 0,
+    1087, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1093, 1454, 0, 1099, 1105, 0, 1111, 0, 1117,
+    0, 0, 1123, 0, 1129, 0, 0, 1135, 0, 1454, 0, 0, 0, 0, 1141, 1147, 1153, 0, 0, 325,
+    0, 0, 1159, 0, 1165, 0, 0, 0, 0, 0, 0, 1289, 0, 331, 0, 0, 0, 1360, 0, 1462,
+    0, 0, 0, 339, 0, 0, 0, 0, 0, 0, 347, 0, 0, 0, 1464, 0, 0, 1363, 0, 0,
+    1293, 0, 1297, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1473, 0, 0, 0, 0, 1375, 0, 0,
+    1378, 0, 1381, 0, 0, 0, 0, 0, 1480, 0,
+)
+
+GOTO_VALUE = (
+    905, 906, 907, 894, 896, 899, 807, 891, 683, 174, 150, 177, 247, 244, 241, 197, 193, 199, 207, 215,
+    216, 0, 669, 633, 174, 150, 177, 247, 244, 241, 197, 193, 199, 207, 215, 216, 0, 621, 346, 174,
+    150, 177, 247, 244, 241, 197, 193, 199, 207, 215, 216, 0, 334, 294, 174, 150, 177, 247, 244, 241,
+    292, 174, 150, 177, 247, 244, 241, 197, 193, 199, 207, 215, 216, 0, 284, 197, 193, 199, 207, 215,
+    216, 0, 248, 172, 174, 150, 177, 247, 244, 241, 176, 174, 150, 177, 247, 244, 241, 197, 193, 199,
+    207, 215, 216, 0, 232, 197, 193, 199, 207, 215, 216, 0, 224, 197, 193, 199, 207, 215, 216, 0,
+    223, 197, 193, 199, 207, 215, 216, 0, 219, 197, 193, 199, 207, 215, 216, 0, 217, 197, 193, 199,
+    207, 215, 216, 0, 239, 197, 193, 199, 207, 215, 216, 0, 258, 197, 193, 199, 207, 215, 216, 0,
+    265, 197, 193, 199, 207, 215, 216, 0, 318, 197, 193, 199, 207, 215, 216, 0, 325, 372, 174, 150,
+    177, 247, 244, 241, 197, 193, 199, 207, 215, 216, 0, 386, 197, 193, 199, 207, 215, 216, 0, 396,
+    197, 193, 199, 207, 215, 216, 0, 403, 449, 174, 150, 177, 247, 244, 241, 197, 193, 199, 207, 215,
+    216, 0, 463, 197, 193, 199, 207, 215, 216, 0, 473, 197, 193, 199, 207, 215, 216, 0, 480, 197,
+    193, 199, 207, 215, 216, 0, 507, 197, 193, 199, 207, 215, 216, 0, 514, 538, 174, 150, 177, 247,
+    244, 241, 197, 193, 199, 207, 215, 216, 0, 552, 197, 193, 199, 207, 215, 216, 0, 562, 197, 193,
+    199, 207, 215, 216, 0, 569, 197, 193, 199, 207, 215, 216, 0, 596, 197, 193, 199, 207, 215, 216,
+    0, 603, 749, 174, 150, 177, 247, 244, 241, 197, 193, 199, 207, 215, 216, 0, 763, 197, 193, 199,
+    207, 215, 216, 0, 773, 197, 193, 199, 207, 215, 216, 0, 780, 840, 174, 150, 177, 247, 244, 241,
+    197, 193, 199, 207, 215, 216, 0, 854, 197, 193, 199, 207, 215, 216, 0, 864, 197, 193, 199, 207,
+    215, 216, 0, 871, 802, 150, 177, 247, 244, 241, 798, 759, 793, 788, 785, 782, 797, 759, 793, 788,
+    785, 782, 725, 52, 588, 611, 608, 605, 724, 52, 588, 611, 608, 605, 718, 52, 588, 611, 608, 605,
+    714, 88, 499, 522, 519, 516, 713, 88, 499, 522, 519, 516, 707, 52, 588, 611, 608, 605, 703, 119,
+    310, 333, 330, 327, 702, 119, 310, 333, 330, 327, 696, 52, 588, 611, 608, 605, 695, 52, 588, 611,
+    608, 605, 694, 52, 588, 611, 608, 605, 692, 167, 278, 273, 270, 267, 691, 167, 278, 273, 270, 267,
+    685, 52, 588, 611, 608, 605, 677, 52, 588, 611, 608, 605, 676, 52, 588, 611, 608, 605, 51, 52,
+    588, 611, 608, 605, 668, 193, 199, 207, 215, 216, 60, 52, 588, 611, 608, 605, 664, 382, 416, 411,
+    408, 405, 663, 382, 416, 411, 408, 405, 66, 52, 588, 611, 608, 605, 659, 382, 416, 411, 408, 405,
+    655, 88, 499, 522, 519, 516, 651, 88, 499, 522, 519, 516, 647, 119, 310, 333, 330, 327, 643, 88,
+    499, 522, 519, 516, 642, 88, 499, 522, 519, 516, 641, 88, 499, 522, 519, 516, 639, 167, 278, 273,
+    270, 267, 635, 88, 499, 522, 519, 516, 629, 88, 499, 522, 519, 516, 628, 88, 499, 522, 519, 516,
+    87, 88, 499, 522, 519, 516, 93, 88, 499, 522, 519, 516, 619, 459, 493, 488, 485, 482, 618, 459,
+    493, 488, 485, 482, 99, 52, 588, 611, 608, 605, 420, 382, 416, 411, 408, 405, 360, 119, 310, 333,
+    330, 327, 356, 119, 310, 333, 330, 327, 355, 119, 310, 333, 330, 327, 354, 119, 310, 333, 330, 327,
+    352, 167, 278, 273, 270, 267, 348, 119, 310, 333, 330, 327, 342, 119, 310, 333, 330, 327, 341, 119,
+    310, 333, 330, 327, 118, 119, 310, 333, 330, 327, 124, 119, 310, 333, 330, 327, 304, 150, 177, 247,
+    244, 241, 303, 150, 177, 247, 244, 241, 302, 150, 177, 247, 244, 241, 300, 167, 278, 273, 270, 267,
+    299, 167, 278, 273, 270, 267, 298, 167, 278, 273, 270, 267, 296, 167, 278, 273, 270, 267, 291, 150,
+    177, 247, 244, 241, 149, 150, 177, 247, 244, 241, 283, 193, 199, 207, 215, 216, 282, 193, 199, 207,
+    215, 216, 280, 167, 278, 273, 270, 267, 279, 167, 278, 273, 270, 267, 166, 167, 278, 273, 270, 267,
+    231, 193, 199, 207, 215, 216, 192, 193, 199, 207, 215, 216, 419, 382, 416, 411, 408, 405, 418, 382,
+    416, 411, 408, 405, 369, 167, 278, 273, 270, 267, 417, 382, 416, 411, 408, 405, 381, 382, 416, 411,
+    408, 405, 616, 548, 582, 577, 574, 571, 612, 548, 582, 577, 574, 571, 426, 52, 588, 611, 608, 605,
+    428, 382, 416, 411, 408, 405, 586, 548, 582, 577, 574, 571, 431, 88, 499, 522, 519, 516, 523, 459,
+    493, 488, 485, 482, 434, 88, 499, 522, 519, 516, 497, 459, 493, 488, 485, 482, 437, 119, 310, 333,
+    330, 327, 496, 459, 493, 488, 485, 482, 495, 459, 493, 488, 485, 482, 446, 167, 278, 273, 270, 267,
+    494, 459, 493, 488, 485, 482, 458, 459, 493, 488, 485, 482, 526, 119, 310, 333, 330, 327, 585, 548,
+    582, 577, 574, 571, 584, 548, 582, 577, 574, 571, 535, 167, 278, 273, 270, 267, 583, 548, 582, 577,
+    574, 571, 547, 548, 582, 577, 574, 571, 631, 459, 493, 488, 485, 482, 637, 459, 493, 488, 485, 482,
+    645, 459, 493, 488, 485, 482, 653, 459, 493, 488, 485, 482, 657, 459, 493, 488, 485, 482, 661, 548,
+    582, 577, 574, 571, 666, 548, 582, 577, 574, 571, 679, 382, 416, 411, 408, 405, 681, 548, 582, 577,
+    574, 571, 687, 382, 416, 411, 408, 405, 689, 548, 582, 577, 574, 571, 698, 382, 416, 411, 408, 405,
+    700, 548, 582, 577, 574, 571, 709, 382, 416, 411, 408, 405, 711, 548, 582, 577, 574, 571, 716, 459,
+    493, 488, 485, 482, 720, 382, 416, 411, 408, 405, 722, 548, 582, 577, 574, 571, 727, 382, 416, 411,
+    408, 405, 729, 548, 582, 577, 574, 571, 732, 88, 499, 522, 519, 516, 734, 459, 493, 488, 485, 482,
+    737, 119, 310, 333, 330, 327, 796, 759, 793, 788, 785, 782, 795, 759, 793, 788, 785, 782, 746, 167,
+    278, 273, 270, 267, 794, 759, 793, 788, 785, 782, 758, 759, 793, 788, 785, 782, 801, 150, 177, 247,
+    244, 241, 889, 850, 884, 879, 876, 873, 888, 850, 884, 879, 876, 873, 816, 52, 588, 611, 608, 605,
+    818, 382, 416, 411, 408, 405, 820, 548, 582, 577, 574, 571, 823, 88, 499, 522, 519, 516, 825, 459,
+    493, 488, 485, 482, 828, 119, 310, 333, 330, 327, 887, 850, 884, 879, 876, 873, 886, 850, 884, 879,
+    876, 873, 837, 167, 278, 273, 270, 267, 885, 850, 884, 879, 876, 873, 849, 850, 884, 879, 876, 873,
+    671, 611, 608, 605, 623, 522, 519, 516, 336, 333, 330, 327, 286, 247, 244, 241, 250, 273, 270, 267,
+    226, 207, 215, 216, 228, 207, 215, 216, 230, 207, 215, 216, 275, 273, 270, 267, 277, 273, 270, 267,
+    288, 247, 244, 241, 290, 247, 244, 241, 338, 333, 330, 327, 340, 333, 330, 327, 388, 411, 408, 405,
+    413, 411, 408, 405, 415, 411, 408, 405, 465, 488, 485, 482, 490, 488, 485, 482, 492, 488, 485, 482,
+    554, 577, 574, 571, 579, 577, 574, 571, 581, 577, 574, 571, 625, 522, 519, 516, 627, 522, 519, 516,
+    673, 611, 608, 605, 675, 611, 608, 605, 765, 788, 785, 782, 790, 788, 785, 782, 792, 788, 785, 782,
+    856, 879, 876, 873, 881, 879, 876, 873, 883, 879, 876, 873, 179, 244, 241, 201, 215, 216, 222, 215,
+    216, 246, 244, 241, 252, 270, 267, 272, 270, 267, 312, 330, 327, 332, 330, 327, 390, 408, 405, 410,
+    408, 405, 467, 485, 482, 487, 485, 482, 501, 519, 516, 521, 519, 516, 556, 574, 571, 576, 574, 571,
+    590, 608, 605, 610, 608, 605, 767, 785, 782, 787, 785, 782, 858, 876, 873, 878, 876, 873, 898, 896,
+    899, 901, 896, 899, 903, 896, 899, 799, 613, 16, 613, 20, 613, 25, 613, 30, 613, 39, 613, 57,
+    613, 63, 613, 96, 613, 306, 308, 181, 241, 203, 216, 209, 216, 243, 241, 254, 267, 269, 267, 309,
+    308, 314, 327, 329, 327, 344, 308, 350, 308, 358, 308, 362, 308, 392, 405, 407, 405, 423, 613, 439,
+    308, 469, 482, 484, 482, 503, 516, 518, 516, 528, 308, 558, 571, 573, 571, 592, 605, 607, 605, 615,
+    613, 649, 308, 705, 308, 739, 308, 769, 782, 784, 782, 813, 613, 830, 308, 860, 873, 875, 873, 893,
+    891, 909, 907, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0,
+)
+
+
+
+# <program> := <class-list>
+def _reduce_0(h, s):
+    return ProgramNode(s[1])
+
+
+
+# <class-list> := <class> ; <class-list>
+def _reduce_1(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <class-list> := <class> ;
+def _reduce_2(h, s):
+    return [s[1]]
+
+
+
+# <class> := class id { <feature_list> }
+def _reduce_3(h, s):
+    return ClassDeclarationNode(s[2], s[4])
+
+
+
+# <class> := class id inherits id { <feature_list> }
+def _reduce_4(h, s):
+    return ClassDeclarationNode(s[2], s[6], s[4])
+
+
+
+# <feature_list> := <def-attr> ; <feature_list>
+def _reduce_5(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <feature_list> := <def-func> ; <feature_list>
+def _reduce_6(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <feature_list> := e
+def _reduce_7(h, s):
+    return []
+
+
+
+# <def-attr> := id : id
+def _reduce_8(h, s):
+    return AttrDeclarationNode(s[1], s[3])
+
+
+
+# <def-attr> := id : id <- <expr>
+def _reduce_9(h, s):
+    return AttrDeclarationNode(s[1], s[3], s[5])
+
+
+
+# <def-func> := id ( <params-list> ) : id { <expr> }
+def _reduce_10(h, s):
+    return MethodDeclarationNode(s[1], s[3], s[6], s[8])
+
+
+
+# <params-list> := <param> , <params-list>
+def _reduce_11(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <params-list> := <param>
+def _reduce_12(h, s):
+    return [s[1]]
+
+
+
+# <params-list> := e
+def _reduce_13(h, s):
+    return []
+
+
+
+# <param> := id : id
+def _reduce_14(h, s):
+    return VarDeclarationNode(s[1], s[3])
+
+
+
+# <expr-list> := <expr> ;
+def _reduce_15(h, s):
+    return [s[1]]
+
+
+
+# <expr-list> := <expr> ; <expr-list>
+def _reduce_16(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <expr> := id <- <expr>
+def _reduce_17(h, s):
+    return AssignNode(s[1], s[3])
+
+
+
+# <expr> := if <expr> then <expr> else <expr> fi
+def _reduce_18(h, s):
+    return ConditionalNode(s[2], s[4], s[6])
+
+
+
+# <expr> := while <expr> loop <expr> pool
+def _reduce_19(h, s):
+    return LoopNode(s[2], s[4])
+
+
+
+# <expr> := { <expr-list> }
+def _reduce_20(h, s):
+    return BlocksNode(s[2])
+
+
+
+# <expr> := let <let-list> in <expr>
+def _reduce_21(h, s):
+    return LetNode(s[2], s[4])
+
+
+
+# <expr> := case <expr> of <case-list> esac
+def _reduce_22(h, s):
+    return CaseNode(s[2], s[4])
+
+
+
+# <expr> := isvoid <expr>
+def _reduce_23(h, s):
+    return IsVoidNode(s[2])
+
+
+
+# <expr> := not <expr>
+def _reduce_24(h, s):
+    return NotNode(s[2])
+
+
+
+# <expr> := ~ <expr>
+def _reduce_25(h, s):
+    return ComplementNode(s[2])
+
+
+
+# <expr> := <cmp>
+def _reduce_26(h, s):
+    return s[1]
+
+
+
+# <cmp> := <cmp> < <arith>
+def _reduce_27(h, s):
+    return LessNode(s[1], s[3])
+
+
+
+# <cmp> := <cmp> <= <arith>
+def _reduce_28(h, s):
+    return LessOrEqualNode(s[1], s[3])
+
+
+
+# <cmp> := <cmp> = <arith>
+def _reduce_29(h, s):
+    return EqualsNode(s[1], s[3])
+
+
+
+# <cmp> := <arith>
+def _reduce_30(h, s):
+    return s[1]
+
+
+
+# <arith> := <arith> + <term>
+def _reduce_31(h, s):
+    return PlusNode(s[1], s[3])
+
+
+
+# <arith> := <arith> - <term>
+def _reduce_32(h, s):
+    return MinusNode(s[1], s[3])
+
+
+
+# <arith> := <term>
+def _reduce_33(h, s):
+    return s[1]
+
+
+
+# <term> := <term> * <factor>
+def _reduce_34(h, s):
+    return StarNode(s[1], s[3])
+
+
+
+# <term> := <term> / <factor>
+def _reduce_35(h, s):
+    return DivNode(s[1], s[3])
+
+
+
+# <term> := <factor>
+def _reduce_36(h, s):
+    return s[1]
+
+
+
+# <factor> := <atom>
+def _reduce_37(h, s):
+    return s[1]
+
+
+
+# <factor> := ( <expr> )
+def _reduce_38(h, s):
+    return s[2]
+
+
+
+# <factor> := new id
+def _reduce_39(h, s):
+    return InstantiateNode(s[2])
+
+
+
+# <atom> := false
+def _reduce_40(h, s):
+    return BooleanNode(s[1])
+
+
+
+# <atom> := true
+def _reduce_41(h, s):
+    return BooleanNode(s[1])
+
+
+
+# <atom> := int
+def _reduce_42(h, s):
+    return ConstantNumNode(s[1])
+
+
+
+# <atom> := string
+def _reduce_43(h, s):
+    return StringNode(s[1])
+
+
+
+# <atom> := id
+def _reduce_44(h, s):
+    return VariableNode(s[1])
+
+
+
+# <atom> := <factor> @ id . id ( <arg-list> )
+def _reduce_45(h, s):
+    return MethodCallNode(expr=s[1], typex=s[3], idx=s[5], args=s[7])
+
+
+
+# <atom> := <factor> . id ( <arg-list> )
+def _reduce_46(h, s):
+    return MethodCallNode(expr=s[1], idx=s[3], args=s[5])
+
+
+
+# <atom> := id ( <arg-list> )
+def _reduce_47(h, s):
+    return MethodCallNode(idx=s[1], args=s[3])
+
+
+
+# <arg-list> := <expr>
+def _reduce_48(h, s):
+    return [s[1]]
+
+
+
+# <arg-list> := <expr> , <arg-list>
+def _reduce_49(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <arg-list> := e
+def _reduce_50(h, s):
+    return []
+
+
+
+# <let-list> := <let-single> , <let-list>
+def _reduce_51(h, s):
+    return [s[1]] + s[3]
+
+
+
+# <let-list> := <let-single>
+def _reduce_52(h, s):
+    return [s[1]]
+
+
+
+# <let-single> := id : id
+def _reduce_53(h, s):
+    return VarDeclarationNode(s[1], s[3])
+
+
+
+# <let-single> := id : id <- <expr>
+def _reduce_54(h, s):
+    return VarDeclarationNode(s[1], s[3], s[5])
+
+
+
+# <case-list> := <case-single> <case-list>
+def _reduce_55(h, s):
+    return [s[1]] + s[2]
+
+
+
+# <case-list> := <case-single>
+def _reduce_56(h, s):
+    return [s[1]]
+
+
+
+# <case-single> := id : id => <expr> ;
+def _reduce_57(h, s):
+    return CaseOptionNode(s[1], s[3], s[5])
+
+
+
+RULES = (
+    _reduce_0,
+    _reduce_1,
+    _reduce_2,
+    _reduce_3,
+    _reduce_4,
+    _reduce_5,
+    _reduce_6,
+    _reduce_7,
+    _reduce_8,
+    _reduce_9,
+    _reduce_10,
+    _reduce_11,
+    _reduce_12,
+    _reduce_13,
+    _reduce_14,
+    _reduce_15,
+    _reduce_16,
+    _reduce_17,
+    _reduce_18,
+    _reduce_19,
+    _reduce_20,
+    _reduce_21,
+    _reduce_22,
+    _reduce_23,
+    _reduce_24,
+    _reduce_25,
+    _reduce_26,
+    _reduce_27,
+    _reduce_28,
+    _reduce_29,
+    _reduce_30,
+    _reduce_31,
+    _reduce_32,
+    _reduce_33,
+    _reduce_34,
+    _reduce_35,
+    _reduce_36,
+    _reduce_37,
+    _reduce_38,
+    _reduce_39,
+    _reduce_40,
+    _reduce_41,
+    _reduce_42,
+    _reduce_43,
+    _reduce_44,
+    _reduce_45,
+    _reduce_46,
+    _reduce_47,
+    _reduce_48,
+    _reduce_49,
+    _reduce_50,
+    _reduce_51,
+    _reduce_52,
+    _reduce_53,
+    _reduce_54,
+    _reduce_55,
+    _reduce_56,
+    _reduce_57,
+)
+
+
+
+def parse(w, trace=None):
+    """
+    Parses `w` (a `TokenBuffer` or any iterable of tokens) and returns the value of the start symbol. The text of
+    the reduced productions is appended to `trace` when given.
+    """
+    stack = [0]
+    values = [None]
+    # lexemes of a TokenBuffer are only sliced when a semantic action reads them
+    lexeme = w.lex if getattr(w, 'token_types', None) is not None else None
+    tokens = _lookahead(w)
+    terminal, lex, token = next(tokens)
+
+    while True:
+        state = stack[-1]
+        index = ACTION_BASE[state] + terminal
+        action = ACTION_VALUE[index] if ACTION_CHECK[index] == state else DEFAULT[state]
+
+        if action > 0:
+            stack.append(action - 1)
+            values.append(lex)
+            terminal, lex, token = next(tokens)
+        elif action < -1:
+            production = -2 - action
+            length = LENGTHS[production]
+            if length:
+                symbols = [None] + values[-length:]
+                if lexeme is not None and BODY_TERMINALS[production]:
+                    symbols = _LazySymbols(symbols, BODY_TERMINALS[production], lexeme)
+                value = RULES[production](None, symbols)
+                del stack[-length:]
+                del values[-length:]
+            else:
+                value = RULES[production](None, None)
+            stack.append(GOTO_VALUE[GOTO_BASE[stack[-1]] + LEFTS[production]])
+            values.append(value)
+            if trace is not None:
+                trace.append(PRODUCTIONS[production])
+        elif action == -1:
+            return values[-1]
+        else:
+            lookahead = w[token] if isinstance(token, int) else token
+            raise Exception(f'Aborting parsing: syntax error near token {lookahead.lex} line:{lookahead.row} col:{lookahead.col}')
+
+
+def _lookahead(w):
+    # TokenBuffers are recognized by their columns: importing `cmp.utils` would load `cmp.pycompiler`
+    token_types = getattr(w, 'token_types', None)
+    if token_types is not None:
+        ids = [TERMINAL_IDS.get(_name(token_type), UNKNOWN) for token_type in token_types]
+        for i, token_type in enumerate(w.types):
+            yield ids[token_type], i, i
+        return
+
+    ids = {}
+    for token in w:
+        token_type = token.token_type
+        try:
+            terminal = ids[token_type]
+        except KeyError:
+            terminal = ids[token_type] = TERMINAL_IDS.get(_name(token_type), UNKNOWN)
+        yield terminal, token.lex, token
+
+
+def _name(token_type):
+    return getattr(token_type, 'Name', token_type)
+
+
+class _LazySymbols:
+    # the same as cmp.parsers.shift_reduce_parser.LazySymbols
+    __slots__ = ('values', 'terminals', 'lex')
+
+    def __init__(self, values, terminals, lex):
+        self.values = values
+        self.terminals = terminals
+        self.lex = lex
+
+    def __getitem__(self, i):
+        value = self.values[i]
+        return self.lex(value) if i in self.terminals else value
+
+    def __len__(self):
+        return len(self.values)
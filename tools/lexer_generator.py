@@ -0,0 +1,220 @@
+import hashlib
+import importlib
+import importlib.util
+import os
+import warnings
+
+GENERATOR_VERSION = 2
+
+TOOLS_PATH = os.path.dirname(os.path.abspath(__file__))
+ROOT_PATH = os.path.dirname(TOOLS_PATH)
+SPECIFICATION_PATHS = [os.path.join(ROOT_PATH, 're_lexer.py'), os.path.join(ROOT_PATH, 'grammar.py')]
+MODULE = 'tools.cool_lexer'
+MODULE_PATH = os.path.join(TOOLS_PATH, 'cool_lexer.py')
+# generated modules for sources other than the ones of MODULE_PATH
+CACHE_PATH = os.path.join(TOOLS_PATH, 'cache')
+
+# Scan loop of the generated module. Input is buffered as in `ReLexer.stream`, rows and columns follow
+# `CoolLexer._advance`, string lexemes are unquoted as in `CoolLexer.format_str`.
+TOKENIZE_SOURCE = '''
+class Token:
+    """
+    Token whose type is the name of a terminal of the grammar.
+    """
+
+    def __init__(self, lex, token_type, row=None, col=None):
+        self.col = col
+        self.row = row
+        self.lex = lex
+        self.token_type = token_type
+
+    def __str__(self):
+        return f'{self.token_type}: {self.lex}'
+
+    def __repr__(self):
+        return str(self)
+
+
+def tokenize(source, chunk_size=CHUNK_SIZE):
+    """
+    Yields the tokens of `source`, whitespace and comments excluded, followed by the EOF token.
+
+    `source` is the program text, anything with a `read(size)` method returning `str` or `bytes` (file objects), or
+    an iterable of `str` or `bytes` chunks. Files are read `chunk_size` characters at a time and only the unconsumed
+    tail of the input is buffered.
+    """
+    match = PATTERN.match
+    chunks = _chunks(source, chunk_size)
+    # a whole text needs no further input
+    buffer, exhausted = (source, True) if isinstance(source, str) else ('', False)
+    position = 0
+    row = column = 0
+    while True:
+        found = match(buffer, position) if position < len(buffer) else None
+        if not exhausted and (found is None or found.end() == len(buffer) or _pending(buffer, position)):
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+            else:
+                buffer = buffer[position:] + chunk
+                position = 0
+            continue
+
+        if position == len(buffer):
+            break
+        if found is None:
+            raise Exception(f'Unknown token in row:{row} col:{column}')
+
+        group = found.lastgroup
+        lex = found.group()
+        position = found.end()
+        token_type = TOKEN_TYPES[group]
+
+        if group == 'tabulation':
+            column += 4
+        elif group == 'whitespace':
+            column += len(lex)
+        elif group == 'newline':
+            column = 0
+            row += 1
+        elif group == 'comment':
+            row, column = _skip(lex, row, column)
+        else:
+            if group == IDENTIFIER:
+                token_type = KEYWORDS.get(lex, token_type)
+            elif token_type == STRING:
+                lex = lex[1:-1].replace('\\\\n', '\\n').replace('\\\\t', '\\t')
+            yield Token(lex, token_type, row, column)
+            if token_type == STRING:
+                row, column = _skip(lex, row, column)
+            else:
+                new_lines = lex.count('\\n')
+                if new_lines:
+                    row += new_lines
+                    column = 0
+                else:
+                    column += len(lex)
+
+    yield Token(EOF, EOF, row, column)
+
+
+def _chunks(source, chunk_size):
+    if hasattr(source, 'read'):
+        read = source.read
+        source = iter(lambda: read(chunk_size), read(0))
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _pending(buffer, position):
+    # a token that opens with one of DELIMITERS may still grow: its closer is not buffered yet
+    for opener, closer in DELIMITERS:
+        if buffer.startswith(opener, position) and buffer.find(closer, position + len(opener)) < 0:
+            return True
+    return False
+
+
+def _skip(lex, row, column):
+    new_lines = max(lex.count('\\n') - lex.count('\\\\n'), 0)
+    if new_lines == 0:
+        return row, column + len(lex)
+    return row + new_lines, column + len(lex[lex.rfind('\\n'):]) + 1
+'''
+
+
+def specification_digest(paths=SPECIFICATION_PATHS) -> str:
+    """
+    Hash of the sources the token specification is read from and of the generator version.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as file:
+            digest.update(file.read() + b'\0')
+    digest.update(str(GENERATOR_VERSION).encode())
+    return digest.hexdigest()
+
+
+def _name(token_type):
+    return getattr(token_type, 'Name', token_type)
+
+
+def generate(lexer, path: str = MODULE_PATH) -> None:
+    """
+    Writes a standalone lexer module for `lexer` (a `CoolLexer`): its master regex, the terminal name of every regex
+    group and keyword, and a scan loop. The module only imports `codecs` and `re`.
+    """
+    from grammar import G, string
+
+    skipped = set(lexer.SKIPPED)
+    if skipped != {'tabulation', 'whitespace', 'newline', 'comment'} or lexer.identifier is None:
+        raise ValueError('The scan loop of the generated lexer only knows the skipped tokens of CoolLexer')
+    for group in skipped:
+        if lexer.token_types.get(group) != group:
+            raise ValueError(f'Group {group!r} does not produce a {group!r} token')
+
+    token_types = {group: _name(token_type) for group, token_type in lexer.token_types.items()}
+    keywords = {lex: _name(token_type) for lex, token_type in lexer.keywords.items()}
+    source = [
+        f'# Generated by tools/lexer_generator.py from re_lexer.CoolLexer, do not edit.\n'
+        f'# Regenerate with: python -m tools.lexer_generator\n'
+        f'import codecs\n'
+        f'import re\n\n'
+        f'SPECIFICATION_DIGEST = {specification_digest()!r}\n\n'
+        f'PATTERN = re.compile({lexer.patterns.pattern!r})\n\n'
+        f'TOKEN_TYPES = {{\n' + ''.join(f'    {group!r}: {name!r},\n' for group, name in token_types.items()) + '}\n\n'
+        f'KEYWORDS = {{\n' + ''.join(f'    {lex!r}: {name!r},\n' for lex, name in keywords.items()) + '}\n\n'
+        f'IDENTIFIER = {lexer.identifier!r}\n'
+        f'STRING = {string.Name!r}\n'
+        f'EOF = {G.EOF.Name!r}\n\n'
+        f'CHUNK_SIZE = {lexer.CHUNK_SIZE!r}\n'
+        f'DELIMITERS = {[tuple(pair) for pair in lexer.delimiters]!r}\n\n',
+        TOKENIZE_SOURCE,
+    ]
+
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as file:
+        file.write('\n'.join(source))
+    os.replace(temporary, path)
+
+
+def load_generated_lexer(regenerate: bool = True):
+    """
+    Returns the `tokenize` function of the generated module. When `tools/cool_lexer.py` is missing or `re_lexer.py`
+    or `grammar.py` changed since it was generated, a module for the current sources is generated into the cache
+    directory and loaded from there: only `python -m tools.lexer_generator` writes the source tree.
+    """
+    digest = specification_digest()
+    try:
+        module = importlib.import_module(MODULE)
+        if module.SPECIFICATION_DIGEST == digest:
+            return module.tokenize
+        reason = 're_lexer.py or grammar.py changed'
+    except ImportError as e:
+        reason = str(e)
+    if not regenerate:
+        raise ImportError(f'{MODULE} is out of date: {reason}')
+
+    path = os.path.join(CACHE_PATH, f'cool_lexer-{digest[:16]}.py')
+    if not os.path.exists(path):
+        warnings.warn(f'{MODULE} is out of date ({reason}), generating {os.path.relpath(path)}')
+        from re_lexer import CoolLexer
+        os.makedirs(CACHE_PATH, exist_ok=True)
+        generate(CoolLexer(), path)
+    spec = importlib.util.spec_from_file_location(f'cool_lexer_{digest[:16]}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.tokenize
+
+
+if __name__ == '__main__':
+    from re_lexer import CoolLexer
+
+    generate(CoolLexer())
+    print(os.path.relpath(MODULE_PATH))
@@ -0,0 +1,233 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+import warnings
+
+GENERATOR_VERSION = 2
+
+TOOLS_PATH = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR_PATH = os.path.join(os.path.dirname(TOOLS_PATH), 'grammar.py')
+MODULE = 'tools.cool_parser'
+MODULE_PATH = os.path.join(TOOLS_PATH, 'cool_parser.py')
+# generated modules for grammar revisions other than the one of MODULE_PATH, next to the cached parser tables
+CACHE_PATH = os.path.join(TOOLS_PATH, 'cache')
+
+# Parser loop of the generated module, the same as `ShiftReduceParser.evaluate` over the module-level tables
+PARSE_SOURCE = '''
+def parse(w, trace=None):
+    """
+    Parses `w` (a `TokenBuffer` or any iterable of tokens) and returns the value of the start symbol. The text of
+    the reduced productions is appended to `trace` when given.
+    """
+    stack = [0]
+    values = [None]
+    # lexemes of a TokenBuffer are only sliced when a semantic action reads them
+    lexeme = w.lex if getattr(w, 'token_types', None) is not None else None
+    tokens = _lookahead(w)
+    terminal, lex, token = next(tokens)
+
+    while True:
+        state = stack[-1]
+        index = ACTION_BASE[state] + terminal
+        action = ACTION_VALUE[index] if ACTION_CHECK[index] == state else DEFAULT[state]
+
+        if action > 0:
+            stack.append(action - 1)
+            values.append(lex)
+            terminal, lex, token = next(tokens)
+        elif action < -1:
+            production = -2 - action
+            length = LENGTHS[production]
+            if length:
+                symbols = [None] + values[-length:]
+                if lexeme is not None and BODY_TERMINALS[production]:
+                    symbols = _LazySymbols(symbols, BODY_TERMINALS[production], lexeme)
+                value = RULES[production](None, symbols)
+                del stack[-length:]
+                del values[-length:]
+            else:
+                value = RULES[production](None, None)
+            stack.append(GOTO_VALUE[GOTO_BASE[stack[-1]] + LEFTS[production]])
+            values.append(value)
+            if trace is not None:
+                trace.append(PRODUCTIONS[production])
+        elif action == -1:
+            return values[-1]
+        else:
+            lookahead = w[token] if isinstance(token, int) else token
+            raise Exception(f'Aborting parsing: syntax error near token {lookahead.lex} line:{lookahead.row} col:{lookahead.col}')
+
+
+def _lookahead(w):
+    # TokenBuffers are recognized by their columns: importing `cmp.utils` would load `cmp.pycompiler`
+    token_types = getattr(w, 'token_types', None)
+    if token_types is not None:
+        ids = [TERMINAL_IDS.get(_name(token_type), UNKNOWN) for token_type in token_types]
+        for i, token_type in enumerate(w.types):
+            yield ids[token_type], i, i
+        return
+
+    ids = {}
+    for token in w:
+        token_type = token.token_type
+        try:
+            terminal = ids[token_type]
+        except KeyError:
+            terminal = ids[token_type] = TERMINAL_IDS.get(_name(token_type), UNKNOWN)
+        yield terminal, token.lex, token
+
+
+def _name(token_type):
+    return getattr(token_type, 'Name', token_type)
+
+
+class _LazySymbols:
+    # the same as cmp.parsers.shift_reduce_parser.LazySymbols
+    __slots__ = ('values', 'terminals', 'lex')
+
+    def __init__(self, values, terminals, lex):
+        self.values = values
+        self.terminals = terminals
+        self.lex = lex
+
+    def __getitem__(self, i):
+        value = self.values[i]
+        return self.lex(value) if i in self.terminals else value
+
+    def __len__(self):
+        return len(self.values)
+'''
+
+
+def grammar_digest(path: str = GRAMMAR_PATH) -> str:
+    """
+    Hash of the grammar source, semantic actions included, and of the generator version.
+    """
+    with open(path, 'rb') as file:
+        digest = hashlib.sha256(file.read())
+    digest.update(f'\0{GENERATOR_VERSION}'.encode())
+    return digest.hexdigest()
+
+
+def semantic_actions(G, path: str = GRAMMAR_PATH) -> list:
+    """
+    `(parameters, body)` source of the synthesized attribute of every production of `G`, in the order of
+    `G.Productions`. The source of each action is the lambda of `path` that compiled to it, found by the line it
+    starts on, so an action is never paired with the production of another statement.
+    """
+    with open(path) as file:
+        tree = ast.parse(file.read(), path)
+
+    lambdas = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Lambda):
+            lambdas.setdefault(node.lineno, []).append(node)
+
+    actions = []
+    for production in G.Productions:
+        rule = getattr(production, 'attributes', (None,))[0]
+        code = getattr(rule, '__code__', None)
+        if code is None or not os.path.exists(code.co_filename) or not os.path.samefile(code.co_filename, path):
+            raise ValueError(f'The semantic action of {production} is not a lambda of {path}')
+        candidates = lambdas.get(code.co_firstlineno, [])
+        if len(candidates) != 1:
+            raise ValueError(f'{path}:{code.co_firstlineno}: expected the only lambda of the line, the semantic '
+                             f'action of {production}')
+        parameters = [argument.arg for argument in candidates[0].args.args]
+        if parameters != list(code.co_varnames[:code.co_argcount]):
+            raise ValueError(f'{path}:{code.co_firstlineno}: the lambda does not match the semantic action of '
+                             f'{production}')
+        actions.append((parameters, ast.unparse(candidates[0].body)))
+    return actions
+
+
+def _literal(name, values, width=20):
+    values = list(values)
+    lines = [', '.join(str(value) for value in values[i:i + width]) for i in range(0, len(values), width)]
+    if len(values) == 1:
+        return f'{name} = ({values[0]},)\n'
+    return f'{name} = (\n    ' + ',\n    '.join(lines) + ',\n)\n'
+
+
+def _positions(production):
+    positions = [i for i, symbol in enumerate(production.Right, 1) if symbol.IsTerminal]
+    return f'frozenset({{{", ".join(map(str, positions))}}})' if positions else 'frozenset()'
+
+
+def generate(G, path: str = MODULE_PATH, grammar_path: str = GRAMMAR_PATH) -> None:
+    """
+    Writes a standalone parser module for `G` (the grammar declared in `grammar_path`): its LR(1) tables as tuple
+    literals, every semantic action as a plain function and the parser loop. The module only imports `cool_ast`.
+    """
+    from tools.tables import load_parser
+
+    table = load_parser(G).table
+    actions = semantic_actions(G, grammar_path)
+
+    chunks = [
+        f'# Generated by tools/parser_generator.py from grammar.py, do not edit.\n'
+        f'# Regenerate with: python -m tools.parser_generator\n'
+        f'from cool_ast import *\n\n'
+        f'GRAMMAR_DIGEST = {grammar_digest(grammar_path)!r}\n\n'
+        f'TERMINALS = {tuple(table.terminals)!r}\n'
+        f'TERMINAL_IDS = {{name: i for i, name in enumerate(TERMINALS)}}\n'
+        f'UNKNOWN = len(TERMINALS)\n\n'
+        f'PRODUCTIONS = (\n' + ''.join(f'    {str(production)!r},\n' for production in G.Productions) + ')\n',
+        f'# body positions of every production, as indexed by its semantic action, that hold a terminal\n'
+        f'BODY_TERMINALS = (\n' + ''.join(f'    {_positions(production)},\n' for production in G.Productions) + ')\n',
+    ]
+    for name, column in [('LENGTHS', table.lengths), ('LEFTS', table.lefts), ('DEFAULT', table.default),
+                         ('ACTION_BASE', table.action_base), ('ACTION_CHECK', table.action_check),
+                         ('ACTION_VALUE', table.action_value), ('GOTO_BASE', table.goto_base),
+                         ('GOTO_VALUE', table.goto_value)]:
+        chunks.append(_literal(name, column))
+
+    for i, (production, (parameters, body)) in enumerate(zip(G.Productions, actions)):
+        chunks.append(f'\n\n# {production}\ndef _reduce_{i}({", ".join(parameters)}):\n    return {body}\n')
+    chunks.append('\n\nRULES = (\n' + ''.join(f'    _reduce_{i},\n' for i in range(len(actions))) + ')\n\n')
+    chunks.append(PARSE_SOURCE)
+
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as file:
+        file.write('\n'.join(chunks))
+    os.replace(temporary, path)
+
+
+def load_generated_parser(G=None, regenerate: bool = True):
+    """
+    Returns the `parse` function of the generated module. When `tools/cool_parser.py` is missing or was generated
+    from another version of `grammar.py`, a module for the current grammar is generated into the cache directory and
+    loaded from there: only `python -m tools.parser_generator` writes the source tree. `G` is only needed (and loaded
+    otherwise) to generate it.
+    """
+    digest = grammar_digest()
+    try:
+        module = importlib.import_module(MODULE)
+        if module.GRAMMAR_DIGEST == digest:
+            return module.parse
+        reason = 'grammar.py changed'
+    except ImportError as e:
+        reason = str(e)
+    if not regenerate:
+        raise ImportError(f'{MODULE} is out of date: {reason}')
+
+    path = os.path.join(CACHE_PATH, f'cool_parser-{digest[:16]}.py')
+    if not os.path.exists(path):
+        warnings.warn(f'{MODULE} is out of date ({reason}), generating {os.path.relpath(path)}')
+        if G is None:
+            from grammar import G
+        os.makedirs(CACHE_PATH, exist_ok=True)
+        generate(G, path)
+    spec = importlib.util.spec_from_file_location(f'cool_parser_{digest[:16]}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.parse
+
+
+if __name__ == '__main__':
+    from grammar import G
+
+    generate(G)
+    print(os.path.relpath(MODULE_PATH))
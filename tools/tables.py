@@ -0,0 +1,169 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+import warnings
+import zlib
+from typing import Optional, Type
+
+from cmp.parsers.lalr_parser import LALR1Parser
+from cmp.parsers.lr1_parser import LR1Parser
+from cmp.parsers.slr1_parser import SLR1Parser
+from cmp.parsers.lr_table import LRTable
+from cmp.parsers.shift_reduce_parser import ShiftReduceParser
+from cmp.pycompiler import Grammar
+
+FORMAT_VERSION = 1
+# part of the grammar fingerprint: bump it whenever the construction of the LR1, LALR1 or SLR1 tables changes, so the
+# tables built by the previous construction are not loaded
+BUILDER_VERSION = 1
+MAGIC = b'COOLTBL\0'
+# magic, format version, byte order of the integer arrays, grammar fingerprint, parser kind, payload size, payload crc32
+HEADER = struct.Struct('<8sIB32s16sII')
+
+TOOLS_PATH = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(TOOLS_PATH, 'cache')
+
+PARSER_KINDS = {'lr1': LR1Parser, 'lalr1': LALR1Parser, 'slr1': SLR1Parser}
+
+
+class TableError(Exception):
+    pass
+
+
+def grammar_fingerprint(G: Grammar) -> bytes:
+    """
+    SHA-256 of `G.to_json` (symbol names and every production, in declaration order), the start symbol and
+    `BUILDER_VERSION`. Semantic actions are not part of the tables, so editing them does not invalidate an artifact.
+    """
+    digest = hashlib.sha256(G.to_json.encode())
+    digest.update(b'\0' + getattr(G.startSymbol, 'Name', '').encode())
+    digest.update(f'\0{BUILDER_VERSION}'.encode())
+    return digest.digest()
+
+
+def cache_path(G: Grammar, kind: Type[ShiftReduceParser] = LR1Parser, directory: str = CACHE_PATH) -> str:
+    """
+    Cache entry of the `kind` tables of `G`: the file name holds the parser kind and the grammar fingerprint, so every
+    grammar revision and algorithm gets its own entry.
+    """
+    return os.path.join(directory, f'{kind.__name__}-{grammar_fingerprint(G).hex()[:16]}.tbl')
+
+
+def save_tables(parser: ShiftReduceParser, path: Optional[str] = None) -> None:
+    path = cache_path(parser.G, type(parser)) if path is None else path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = parser.table.to_bytes()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, sys.byteorder == 'big', grammar_fingerprint(parser.G),
+                         type(parser).__name__.encode(), len(payload), zlib.crc32(payload))
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(header)
+        file.write(payload)
+    os.replace(temporary, path)
+
+
+def read_tables(path: str, G: Grammar, kind: Type[ShiftReduceParser] = LR1Parser) -> LRTable:
+    """
+    Loads the tables stored at `path`, raising `TableError` unless they were written by this format version, for
+    this grammar and parser kind, and are intact.
+    """
+    try:
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if len(data) < HEADER.size:
+                raise TableError(f'{path} is truncated')
+            magic, version, big_endian, fingerprint, name, size, crc = HEADER.unpack_from(data)
+            if magic != MAGIC:
+                raise TableError(f'{path} is not a table artifact')
+            if version != FORMAT_VERSION:
+                raise TableError(f'{path} has format version {version}, expected {FORMAT_VERSION}')
+            if fingerprint != grammar_fingerprint(G):
+                raise TableError(f'{path} was generated for another grammar')
+            name = name.rstrip(b'\0').decode()
+            if name != kind.__name__:
+                raise TableError(f'{path} holds {name} tables, expected {kind.__name__}')
+            payload = data[HEADER.size:HEADER.size + size]
+            if len(payload) != size or zlib.crc32(payload) != crc:
+                raise TableError(f'{path} is corrupt')
+            return LRTable.from_bytes(payload, byteswap=big_endian != (sys.byteorder == 'big'))
+    except (OSError, ValueError) as e:
+        raise TableError(f'{path} cannot be read: {e}')
+
+
+def load_parser(G: Grammar, path: Optional[str] = None, kind: Type[ShiftReduceParser] = LR1Parser,
+                regenerate: bool = True) -> ShiftReduceParser:
+    """
+    Returns a `kind` parser for `G` using the tables stored at `path`, by default its entry in the table cache.
+    Missing, stale or corrupt tables are rebuilt from the grammar and written back when `regenerate` is set; otherwise
+    `TableError` is raised.
+    """
+    path = cache_path(G, kind) if path is None else path
+    try:
+        return kind.from_table(G, read_tables(path, G, kind))
+    except TableError as e:
+        if not regenerate:
+            raise
+        warnings.warn(f'Regenerating parser tables: {e}')
+
+    parser = kind(G)
+    try:
+        save_tables(parser, path)
+    except OSError as e:
+        warnings.warn(f'Parser tables could not be saved: {e}')
+    return parser
+
+
+def prune(G: Grammar, directory: str = CACHE_PATH) -> list:
+    """
+    Removes the cache entries that do not belong to the current revision of `G`, returning their paths.
+    """
+    current = {os.path.basename(cache_path(G, kind, directory)) for kind in PARSER_KINDS.values()}
+    removed = []
+    for name in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if name.endswith('.tbl') and name not in current:
+            os.remove(os.path.join(directory, name))
+            removed.append(os.path.join(directory, name))
+    return removed
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from grammar import G
+
+    args_parser = argparse.ArgumentParser(description='Prewarm the parser table cache for the grammar in grammar.py')
+    args_parser.add_argument(
+        'kinds',
+        nargs='*',
+        default=['lr1'],
+        choices=sorted(PARSER_KINDS),
+        help='Parsing algorithms whose tables are generated (default: lr1)')
+    args_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate the tables even if the cache already holds them')
+    args_parser.add_argument(
+        '--prune',
+        action='store_true',
+        help='Remove the cache entries of previous grammar revisions')
+    arguments = args_parser.parse_args()
+
+    for name in arguments.kinds:
+        kind = PARSER_KINDS[name]
+        path = cache_path(G, kind)
+        start = time.time()
+        try:
+            if arguments.force:
+                raise TableError(f'{path} is regenerated on request')
+            read_tables(path, G, kind)
+            status = 'hit'
+        except TableError:
+            save_tables(kind(G), path)
+            status = 'generated'
+        print(f'{name:<6} {status:<9} {time.time() - start:.3f}s  {os.path.relpath(path)}')
+
+    if arguments.prune:
+        for path in prune(G):
+            print(f'removed {os.path.relpath(path)}')
@@ -0,0 +1,3 @@
+from vm.bytecode import *
+from vm.compiler import *
+from vm.machine import *
@@ -0,0 +1,122 @@
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from semantics import Type
+
+# Every instruction is stored as two ints in `CodeObject.instructions`: the opcode and its argument.
+OPNAMES = [
+    'LOAD_CONST',
+    'LOAD_LOCAL',
+    'STORE_LOCAL',
+    'LOAD_SELF',
+    'LOAD_ATTR',
+    'STORE_ATTR',
+    'NEW',
+    'PUSH_VOID',
+    'POP',
+    'DUP',
+    'ADD',
+    'SUB',
+    'MUL',
+    'DIV',
+    'LESS',
+    'LESS_EQUAL',
+    'EQUAL',
+    'NOT',
+    'COMPLEMENT',
+    'IS_VOID',
+    'JUMP',
+    'JUMP_IF_FALSE',
+    'CALL',
+    'CASE',
+    'RETURN',
+]
+(LOAD_CONST, LOAD_LOCAL, STORE_LOCAL, LOAD_SELF, LOAD_ATTR, STORE_ATTR, NEW, PUSH_VOID, POP, DUP, ADD, SUB, MUL, DIV,
+ LESS, LESS_EQUAL, EQUAL, NOT, COMPLEMENT, IS_VOID, JUMP, JUMP_IF_FALSE, CALL, CASE, RETURN) = range(len(OPNAMES))
+
+HAS_CONSTANT = {LOAD_CONST, LOAD_ATTR, STORE_ATTR, NEW, CALL, CASE}
+HAS_TARGET = {JUMP, JUMP_IF_FALSE}
+
+
+class CallSite:
+    def __init__(self, name: str, argc: int, static_type: Optional[Type]):
+        self.name = name
+        self.argc = argc
+        self.static_type = static_type
+        self.targets: Dict[Type, Tuple[Any, Any]] = {}
+
+    def __repr__(self):
+        static = '' if self.static_type is None else f'@{self.static_type.name}'
+        return f'{static}.{self.name}/{self.argc}'
+
+
+class CaseSite:
+    def __init__(self, options: List[Tuple[Type, int, int]]):
+        self.options = options
+        self.branches: Dict[Type, Tuple[Type, int, int]] = {}
+
+    def __repr__(self):
+        return ', '.join(f'{typex.name} -> {target}' for typex, _, target in self.options)
+
+
+class CodeObject:
+    def __init__(self, name: str):
+        self.name = name
+        self.instructions = array('i')
+        self.constants: List[Any] = []
+        self.nlocals = 1
+        self._constant_index: Dict[Any, int] = {}
+
+    def emit(self, opcode: int, arg: int = 0) -> int:
+        position = len(self.instructions)
+        self.instructions.append(opcode)
+        self.instructions.append(arg)
+        return position
+
+    def patch(self, position: int, target: int) -> None:
+        self.instructions[position + 1] = target
+
+    @property
+    def position(self) -> int:
+        return len(self.instructions)
+
+    def add_constant(self, value: Any, key: Any = None) -> int:
+        if key is not None and key in self._constant_index:
+            return self._constant_index[key]
+        self.constants.append(value)
+        index = len(self.constants) - 1
+        if key is not None:
+            self._constant_index[key] = index
+        return index
+
+    def __len__(self):
+        return len(self.instructions) // 2
+
+
+class Program:
+    def __init__(self, main_type: Type):
+        self.main_type = main_type
+        self.methods: Dict[Tuple[str, str], CodeObject] = {}
+        self.initializers: Dict[Tuple[str, str], Optional[CodeObject]] = {}
+
+    def code_objects(self) -> List[CodeObject]:
+        return [code for code in list(self.initializers.values()) + list(self.methods.values()) if code is not None]
+
+
+def disassemble(code: CodeObject) -> str:
+    lines = [f'{code.name} (locals: {code.nlocals})']
+    instructions = code.instructions
+    for position in range(0, len(instructions), 2):
+        opcode, arg = instructions[position], instructions[position + 1]
+        line = f'{position:>6} {OPNAMES[opcode]:<14}'
+        if opcode in HAS_CONSTANT:
+            constant = code.constants[arg]
+            constant = constant.name if isinstance(constant, Type) else getattr(constant, 'value', constant)
+            line += f'{arg:>4} ({constant!r})'
+        elif opcode in HAS_TARGET or opcode in (LOAD_LOCAL, STORE_LOCAL):
+            line += f'{arg:>4}'
+        lines.append(line.rstrip())
+    return '\n'.join(lines)
+
+
+def disassemble_program(program: Program) -> str:
+    return '\n\n'.join(disassemble(code) for code in program.code_objects())
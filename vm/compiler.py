@@ -0,0 +1,222 @@
+from typing import Optional
+from cmp import visitor
+import cool_ast
+from interpreter import CoolObject
+from semantics import Context, Type, VariablesResolver
+from vm.bytecode import *
+
+
+class BytecodeCompiler:
+    """
+    Lowers a checked program into flat bytecode, one `CodeObject` per method and per attribute initializer.
+
+    Local variables live in the frame slots assigned by `VariablesResolver` (slot 0 always holds `self`); every other
+    name is an attribute of the current object.
+    """
+
+    def __init__(self, context: Context):
+        self.context = context
+        self.current_type: Type = None
+        self.code: CodeObject = None
+        self.program: Optional[Program] = None
+
+    def _enter(self, name: str, nlocals: int) -> CodeObject:
+        self.code = CodeObject(name)
+        self.code.nlocals = nlocals
+        return self.code
+
+    def _type_constant(self, typex: Type) -> int:
+        return self.code.add_constant(typex, ('type', typex.name))
+
+    @visitor.on('node')
+    def visit(self, node):
+        pass
+
+    @visitor.when(cool_ast.ProgramNode)
+    def visit(self, node: cool_ast.ProgramNode) -> Program:
+        VariablesResolver().visit(node)
+        self.program = Program(self.context.get_type('Main'))
+        for class_decl in node.declarations:
+            self.visit(class_decl)
+        return self.program
+
+    @visitor.when(cool_ast.ClassDeclarationNode)
+    def visit(self, node: cool_ast.ClassDeclarationNode) -> None:
+        self.current_type = self.context.get_type(node.id)
+        for feature in node.features:
+            self.visit(feature)
+
+    @visitor.when(cool_ast.AttrDeclarationNode)
+    def visit(self, node: cool_ast.AttrDeclarationNode) -> None:
+        code = None
+        if node.expression is not None:
+            code = self._enter(f'{self.current_type.name}.{node.id}', node.frame_size)
+            self.visit(node.expression)
+            code.emit(RETURN)
+        self.program.initializers[self.current_type.name, node.id] = code
+
+    @visitor.when(cool_ast.MethodDeclarationNode)
+    def visit(self, node: cool_ast.MethodDeclarationNode) -> None:
+        code = self._enter(f'{self.current_type.name}.{node.id}', node.frame_size)
+        if node.body is None:
+            code.emit(PUSH_VOID)
+        else:
+            self.visit(node.body)
+        code.emit(RETURN)
+        self.program.methods[self.current_type.name, node.id] = code
+
+    @visitor.when(cool_ast.BlocksNode)
+    def visit(self, node: cool_ast.BlocksNode) -> None:
+        if not node.expr_list:
+            self.code.emit(PUSH_VOID)
+        for i, expr in enumerate(node.expr_list):
+            if i:
+                self.code.emit(POP)
+            self.visit(expr)
+
+    @visitor.when(cool_ast.ConditionalNode)
+    def visit(self, node: cool_ast.ConditionalNode) -> None:
+        self.visit(node.condition)
+        jump_else = self.code.emit(JUMP_IF_FALSE)
+        self.visit(node.then_body)
+        jump_end = self.code.emit(JUMP)
+        self.code.patch(jump_else, self.code.position)
+        self.visit(node.else_body)
+        self.code.patch(jump_end, self.code.position)
+
+    @visitor.when(cool_ast.LoopNode)
+    def visit(self, node: cool_ast.LoopNode) -> None:
+        start = self.code.position
+        self.visit(node.condition)
+        jump_end = self.code.emit(JUMP_IF_FALSE)
+        self.visit(node.body)
+        self.code.emit(POP)
+        self.code.emit(JUMP, start)
+        self.code.patch(jump_end, self.code.position)
+        self.code.emit(PUSH_VOID)
+
+    @visitor.when(cool_ast.LetNode)
+    def visit(self, node: cool_ast.LetNode) -> None:
+        for var in node.var_decl_list:
+            if var.expr is None:
+                self.code.emit(NEW, self._type_constant(self.context.get_type(var.typex)))
+            else:
+                self.visit(var.expr)
+            self.code.emit(STORE_LOCAL, var.slot)
+        self.visit(node.in_expr)
+
+    @visitor.when(cool_ast.CaseNode)
+    def visit(self, node: cool_ast.CaseNode) -> None:
+        self.visit(node.case_expr)
+        options = []
+        site = CaseSite(options)
+        self.code.emit(CASE, self.code.add_constant(site))
+
+        jumps_end = []
+        for option in node.options:
+            options.append((self.context.get_type(option.type), option.slot, self.code.position))
+            self.visit(option.expr)
+            jumps_end.append(self.code.emit(JUMP))
+        for jump in jumps_end:
+            self.code.patch(jump, self.code.position)
+
+    @visitor.when(cool_ast.MethodCallNode)
+    def visit(self, node: cool_ast.MethodCallNode) -> None:
+        if node.expr is None:
+            self.code.emit(LOAD_SELF)
+        else:
+            self.visit(node.expr)
+        for arg in node.args:
+            self.visit(arg)
+        static_type = None if node.type is None else self.context.get_type(node.type)
+        self.code.emit(CALL, self.code.add_constant(CallSite(node.id, len(node.args), static_type)))
+
+    @visitor.when(cool_ast.VariableNode)
+    def visit(self, node: cool_ast.VariableNode) -> None:
+        if node.slot is not None:
+            self.code.emit(LOAD_LOCAL, node.slot)
+        else:
+            self.code.emit(LOAD_ATTR, self.code.add_constant(node.lex, ('name', node.lex)))
+
+    @visitor.when(cool_ast.AssignNode)
+    def visit(self, node: cool_ast.AssignNode) -> None:
+        self.visit(node.expr)
+        self.code.emit(DUP)
+        if node.slot is not None:
+            self.code.emit(STORE_LOCAL, node.slot)
+        else:
+            self.code.emit(STORE_ATTR, self.code.add_constant(node.id, ('name', node.id)))
+
+    @visitor.when(cool_ast.NotNode)
+    def visit(self, node: cool_ast.NotNode) -> None:
+        self.visit(node.expr)
+        self.code.emit(NOT)
+
+    @visitor.when(cool_ast.ComplementNode)
+    def visit(self, node: cool_ast.ComplementNode) -> None:
+        self.visit(node.expr)
+        self.code.emit(COMPLEMENT)
+
+    @visitor.when(cool_ast.IsVoidNode)
+    def visit(self, node: cool_ast.IsVoidNode) -> None:
+        self.visit(node.expr)
+        self.code.emit(IS_VOID)
+
+    @visitor.when(cool_ast.ConstantNumNode)
+    def visit(self, node: cool_ast.ConstantNumNode) -> None:
+        value = int(node.lex)
+        constant = CoolObject(self.context.get_type('Int'), value)
+        self.code.emit(LOAD_CONST, self.code.add_constant(constant, ('Int', value)))
+
+    @visitor.when(cool_ast.BooleanNode)
+    def visit(self, node: cool_ast.BooleanNode) -> None:
+        value = node.lex == 'true'
+        constant = CoolObject(self.context.get_type('Bool'), value)
+        self.code.emit(LOAD_CONST, self.code.add_constant(constant, ('Bool', value)))
+
+    @visitor.when(cool_ast.StringNode)
+    def visit(self, node: cool_ast.StringNode) -> None:
+        constant = CoolObject(self.context.get_type('String'), node.lex)
+        self.code.emit(LOAD_CONST, self.code.add_constant(constant, ('String', node.lex)))
+
+    @visitor.when(cool_ast.InstantiateNode)
+    def visit(self, node: cool_ast.InstantiateNode) -> None:
+        self.code.emit(NEW, self._type_constant(self.context.get_type(node.lex)))
+
+    @visitor.when(cool_ast.BinaryNode)
+    def visit(self, node: cool_ast.BinaryNode) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+        self.code.emit(self.operate(node))
+
+    @visitor.on('node')
+    def operate(self, node):
+        pass
+
+    @visitor.when(cool_ast.PlusNode)
+    def operate(self, node):
+        return ADD
+
+    @visitor.when(cool_ast.MinusNode)
+    def operate(self, node):
+        return SUB
+
+    @visitor.when(cool_ast.StarNode)
+    def operate(self, node):
+        return MUL
+
+    @visitor.when(cool_ast.DivNode)
+    def operate(self, node):
+        return DIV
+
+    @visitor.when(cool_ast.EqualsNode)
+    def operate(self, node):
+        return EQUAL
+
+    @visitor.when(cool_ast.LessOrEqualNode)
+    def operate(self, node):
+        return LESS_EQUAL
+
+    @visitor.when(cool_ast.LessNode)
+    def operate(self, node):
+        return LESS
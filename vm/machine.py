@@ -0,0 +1,200 @@
+from typing import Dict, Optional, Set, Tuple
+from interpreter import CoolObject, VoidObject, defining_type, resolve_dispatch
+from semantics import Context, Type, VoidType
+from vm.bytecode import *
+
+
+class VirtualMachine:
+    """
+    Stack machine that executes a `Program` produced by `BytecodeCompiler`.
+
+    COOL method calls and lazy attribute initializations push a frame on an explicit frame stack instead of recursing
+    in Python, so the whole program runs inside a single loop.
+    """
+
+    def __init__(self, context: Context, program: Program):
+        self.context = context
+        self.program = program
+        self.initializers: Dict[Tuple[Type, str], Optional[CodeObject]] = {}
+        self.assignable: Set[Tuple[Type, str]] = set()
+
+    def run(self) -> CoolObject:
+        main_type = self.program.main_type
+        main = self.program.methods[defining_type(main_type, 'main').name, 'main']
+        return self.execute(main, CoolObject(main_type))
+
+    def execute(self, code: CodeObject, this: CoolObject) -> CoolObject:
+        context = self.context
+        int_type = context.get_type('Int')
+        bool_type = context.get_type('Bool')
+
+        frames = []
+        instructions = code.instructions
+        constants = code.constants
+        local = [None] * code.nlocals
+        local[0] = this
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+
+        while True:
+            opcode = instructions[pc]
+            arg = instructions[pc + 1]
+            pc += 2
+
+            if opcode == LOAD_LOCAL:
+                push(local[arg])
+            elif opcode == LOAD_CONST:
+                push(constants[arg])
+            elif opcode == JUMP_IF_FALSE:
+                if not pop().value:
+                    pc = arg
+            elif opcode == STORE_LOCAL:
+                local[arg] = pop()
+            elif opcode == ADD:
+                right = pop().value
+                push(CoolObject(int_type, pop().value + right))
+            elif opcode == SUB:
+                right = pop().value
+                push(CoolObject(int_type, pop().value - right))
+            elif opcode == LESS:
+                right = pop().value
+                push(CoolObject(bool_type, pop().value < right))
+            elif opcode == JUMP:
+                pc = arg
+            elif opcode == POP:
+                pop()
+            elif opcode == DUP:
+                push(stack[-1])
+            elif opcode == LOAD_SELF:
+                push(this)
+            elif opcode == LOAD_ATTR:
+                name = constants[arg]
+                try:
+                    push(this.atributes[name])
+                    continue
+                except KeyError:
+                    pass
+                initializer = self._initializer(this.type, name)
+                if initializer is None:
+                    value = this.atributes[name] = CoolObject(this.type.get_attribute(name).type)
+                    push(value)
+                    continue
+                frames.append((code, pc, local, this, stack, name))
+                code = initializer
+                instructions = code.instructions
+                constants = code.constants
+                local = [None] * code.nlocals
+                local[0] = this
+                stack = []
+                push = stack.append
+                pop = stack.pop
+                pc = 0
+            elif opcode == STORE_ATTR:
+                name = constants[arg]
+                if (this.type, name) not in self.assignable:
+                    this.set_attribute(name, pop())
+                    self.assignable.add((this.type, name))
+                else:
+                    this.atributes[name] = pop()
+            elif opcode == CALL:
+                site = constants[arg]
+                argc = site.argc
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                obj = pop()
+                try:
+                    builtin, callee = site.targets[obj.type]
+                except KeyError:
+                    builtin, owner = resolve_dispatch(context, site.name, obj.type, site.static_type)
+                    callee = None if builtin is not None else self.program.methods[owner.name, site.name]
+                    site.targets[obj.type] = builtin, callee
+
+                if builtin is not None:
+                    push(builtin(obj, *args, context))
+                    continue
+                frames.append((code, pc, local, this, stack, None))
+                code = callee
+                instructions = code.instructions
+                constants = code.constants
+                local = [obj] + args
+                local.extend([None] * (code.nlocals - argc - 1))
+                this = obj
+                stack = []
+                push = stack.append
+                pop = stack.pop
+                pc = 0
+            elif opcode == RETURN:
+                value = pop()
+                if not frames:
+                    return value
+                code, pc, local, this, stack, attribute = frames.pop()
+                if attribute is not None:
+                    this.atributes[attribute] = value
+                instructions = code.instructions
+                constants = code.constants
+                push = stack.append
+                pop = stack.pop
+                push(value)
+            elif opcode == MUL:
+                right = pop().value
+                push(CoolObject(int_type, pop().value * right))
+            elif opcode == DIV:
+                right = pop().value
+                push(CoolObject(int_type, pop().value // right))
+            elif opcode == LESS_EQUAL:
+                right = pop().value
+                push(CoolObject(bool_type, pop().value <= right))
+            elif opcode == EQUAL:
+                right = pop().value
+                push(CoolObject(bool_type, pop().value == right))
+            elif opcode == NEW:
+                push(CoolObject(constants[arg]))
+            elif opcode == PUSH_VOID:
+                push(VoidObject())
+            elif opcode == NOT:
+                push(CoolObject(bool_type, not pop().value))
+            elif opcode == COMPLEMENT:
+                push(CoolObject(int_type, -pop().value))
+            elif opcode == IS_VOID:
+                push(CoolObject(bool_type, isinstance(pop(), VoidObject)))
+            elif opcode == CASE:
+                site = constants[arg]
+                obj = pop()
+                typex = obj.type
+                try:
+                    _, slot, target = site.branches[typex]
+                except KeyError:
+                    _, slot, target = self._select(site, typex)
+                local[slot] = obj
+                pc = target
+            else:
+                raise ValueError(f'Unknown opcode {opcode}')
+
+    def _initializer(self, typex: Type, name: str) -> Optional[CodeObject]:
+        try:
+            return self.initializers[typex, name]
+        except KeyError:
+            pass
+        typex.get_attribute(name)
+        owner = typex.attribute_table[name][1]
+        initializer = self.initializers[typex, name] = self.program.initializers.get((owner.name, name))
+        return initializer
+
+    @staticmethod
+    def _select(site: CaseSite, typex: Type) -> Tuple[Type, int, int]:
+        minimum = 1e10
+        most_suitable = 0
+        for index, (option_type, _, _) in enumerate(site.options):
+            distance = Type.types_distance(typex, option_type)
+            if distance != -1 and distance < minimum:
+                most_suitable = index
+                minimum = distance
+        option = site.options[most_suitable]
+        if not isinstance(typex, VoidType):
+            site.branches[typex] = option
+        return option